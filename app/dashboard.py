@@ -8,20 +8,49 @@ Start: streamlit run app/dashboard.py (aus Projektroot).
 
 from __future__ import annotations
 
+import functools
 import sys
+from dataclasses import dataclass
+from datetime import timedelta
 from pathlib import Path
+from typing import Any
 
+import streamlit as st
+
+# Paket aus src/ importierbar machen, ohne es zu installieren; die folgenden Importe hängen davon ab
 ROOT = Path(__file__).resolve().parent.parent
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-import pandas as pd
-import streamlit as st
+from eraa_visualizer.aggregations import HourMonthProfile  # noqa: E402
+from eraa_visualizer.catalog import DimensionCatalog  # noqa: E402
+from eraa_visualizer.config import Config  # noqa: E402
+from eraa_visualizer.figure_cache import FigureCache  # noqa: E402
+from eraa_visualizer.index import TableIndex  # noqa: E402
+from eraa_visualizer.loaders import load_dataset  # noqa: E402
+from eraa_visualizer.plots import (  # noqa: E402
+    plot_adequacy_ens_boxplot,
+    plot_adequacy_ens_heatmap_hour_month,
+    plot_adequacy_europe_map,
+    plot_adequacy_lole_boxplot,
+    plot_adequacy_lole_heatmap,
+    plot_adequacy_lole_heatmap_hour_month,
+    plot_dispatch_heatmap,
+    plot_dispatch_heatmap_hour_month,
+    plot_dispatch_timeseries,
+    plot_net_position_heatmap,
+    plot_net_position_heatmap_hour_month,
+    plot_net_position_timeseries,
+    plot_prices_boxplot,
+    plot_prices_heatmap_hour_month,
+    plot_prices_timeseries,
+    plot_storage_level_timeseries,
+    required_columns,
+)
 
-from eraa_visualizer.config import Config
-from eraa_visualizer.loaders import load_dataset
-from eraa_visualizer.plots import (
+# Alle im Dashboard genutzten Plots – bestimmt, welche Spalten geladen werden
+DASHBOARD_PLOTS = (
     plot_adequacy_ens_boxplot,
     plot_adequacy_ens_heatmap_hour_month,
     plot_adequacy_europe_map,
@@ -41,28 +70,37 @@ from eraa_visualizer.plots import (
 )
 
 
-def _filter_df(
-    df: pd.DataFrame | None,
-    *,
-    target_years: list[int] | None = None,
-    study_zones: list[str] | None = None,
-) -> pd.DataFrame | None:
-    if df is None or df.empty:
-        return df
-    out = df.copy()
-    if target_years:
-        if "target_year" in out.columns:
-            out = out[out["target_year"].isin(target_years)]
-    if study_zones:
-        if "study_zone" in out.columns:
-            out = out[out["study_zone"].isin(study_zones)]
-    return out if not out.empty else None
-
-
-@st.cache_data
+def _options(catalog: DimensionCatalog, table: str, key: str, allowed: list | None = None) -> list:
+    """Auswahlliste aus dem Dimensionskatalog (ohne Laden der Tabelle), gemäß Sidebar-Filter."""
+    return [v for v in catalog.values(key, table) if allowed is None or v in allowed]
+
+
+def _available(
+    catalog: DimensionCatalog, table: str, filter_ty: list | None, filter_z: list | None
+) -> bool:
+    """Tabelle vorhanden und mit Zieljahren/Zonen aus dem Sidebar-Filter vertreten."""
+    return bool(_options(catalog, table, "target_year", filter_ty)) and bool(
+        _options(catalog, table, "study_zone", filter_z)
+    )
+
+
+@st.cache_resource
+def _figure_cache(max_mb: int) -> FigureCache:
+    # Ein Cache pro Prozess für alle Sessions; Figuren werden nur gelesen
+    # (st.plotly_chart serialisiert)
+    return FigureCache(max_bytes=max_mb * 1_000_000)
+
+
+@st.cache_resource
 def _load_config_and_data():
+    # Lazy: Tabellen werden erst beim ersten Zugriff geladen und danach für alle Sessions gehalten.
+    # cache_resource gibt allen Sessions dasselbe Objekt (kein Pickle/Kopie wie bei cache_data);
+    # Sessions lesen nur und bilden Sichten per Slice (Copy-on-Write ab pandas 3: Änderungen an
+    # einer Sicht erreichen die geteilte Tabelle nicht). Plots verändern ihre Eingabe nie, siehe
+    # test_plots_leave_shared_tables_unchanged. Geladen wird unter einem Lock pro Tabelle, eine
+    # Sitzung, die Dispatch lädt, blockiert also keine andere, die Preise liest
     config = Config.load(ROOT / "config.yaml")
-    dataset = load_dataset(config)
+    dataset = load_dataset(config, columns=required_columns(DASHBOARD_PLOTS), lazy=True)
     return config, dataset
 
 
@@ -91,16 +129,12 @@ def _render_header():
 
 
 def _sidebar_filters(config: Config, dataset):
-    target_years_available = []
-    study_zones_available = []
-    for df in [dataset.adequacy, dataset.dispatch, dataset.net_position, dataset.prices, dataset.storage]:
-        if df is not None and not df.empty:
-            if "target_year" in df.columns:
-                target_years_available.extend(df["target_year"].unique().tolist())
-            if "study_zone" in df.columns:
-                study_zones_available.extend(df["study_zone"].unique().tolist())
-    target_years_available = sorted(set(target_years_available)) or config.dimensions.target_years
-    study_zones_available = sorted(set(study_zones_available))
+    # Ausprägungen aus dem Dimensionskatalog – ohne die Tabellen selbst zu laden
+    tables = ["adequacy", "dispatch", "net_position", "prices", "storage"]
+    target_years_available = (
+        dataset.catalog.values("target_year", tables) or config.dimensions.target_years
+    )
+    study_zones_available = dataset.catalog.values("study_zone", tables)
 
     filter_target = st.sidebar.multiselect(
         "Target Year (Zieljahr)",
@@ -119,127 +153,344 @@ def _sidebar_filters(config: Config, dataset):
     return filter_ty, filter_z
 
 
-def page_visualizations(config, adeq, adeq_hm, disp, netpos, prices, storage):
-    tab_adequacy, tab_dispatch, tab_netpos, tab_prices, tab_storage = st.tabs([
-        "Adequacy (LOLE & ENS)",
-        "Dispatch (Erzeugung)",
-        "Net Position",
-        "Preise",
-        "Speicher",
-    ])
-
-    with tab_adequacy:
-        if adeq is not None and not adeq.empty:
-            st.subheader("Loss of Load Expectation (LOLE) und Energy Not Served (ENS)")
-            c1, c2 = st.columns(2)
-            with c1:
-                fig = plot_adequacy_lole_boxplot(adeq, config)
-                st.plotly_chart(fig, use_container_width=True)
-            with c2:
-                fig = plot_adequacy_ens_boxplot(adeq, config)
-                st.plotly_chart(fig, use_container_width=True)
-            st.subheader("LOLE – Heatmap Zone × Zieljahr")
-            fig = plot_adequacy_lole_heatmap(adeq, config)
-            st.plotly_chart(fig, use_container_width=True)
-            # Stunde × Monat (LOLE / ENS)
-            if adeq_hm is not None and not adeq_hm.empty:
-                st.subheader("LOLE und ENS – Stunde (24h) × Monat (12)")
-                zone_hm = st.selectbox("Zone (Stunde×Monat)", options=["Alle"] + sorted(adeq_hm["study_zone"].unique().tolist()), key="adeq_hm_zone")
-                ty_hm = st.selectbox("Zieljahr (Stunde×Monat)", options=[None] + sorted(adeq_hm["target_year"].unique().tolist()), key="adeq_hm_ty", format_func=lambda x: "Alle" if x is None else str(x))
-                c1, c2 = st.columns(2)
-                with c1:
-                    fig = plot_adequacy_lole_heatmap_hour_month(adeq_hm, config, study_zone=None if zone_hm == "Alle" else zone_hm, target_year=ty_hm)
-                    st.plotly_chart(fig, use_container_width=True)
-                with c2:
-                    fig = plot_adequacy_ens_heatmap_hour_month(adeq_hm, config, study_zone=None if zone_hm == "Alle" else zone_hm, target_year=ty_hm)
-                    st.plotly_chart(fig, use_container_width=True)
-            st.subheader("Europakarte – Jahres-LOLE und -ENS pro Land")
-            map_ty = st.selectbox("Zieljahr (Karte)", options=[None] + sorted(adeq["target_year"].unique().tolist()), key="map_ty", format_func=lambda x: "Alle" if x is None else str(x))
-            c1, c2 = st.columns(2)
-            with c1:
-                fig = plot_adequacy_europe_map(adeq, config, metric="lole", target_year=map_ty)
-                st.plotly_chart(fig, use_container_width=True)
-            with c2:
-                fig = plot_adequacy_europe_map(adeq, config, metric="ens", target_year=map_ty)
-                st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("Keine Adequacy-Daten. Bitte Beispieldaten mit `python3.11 scripts/generate_sample_data.py` erzeugen.")
-
-    with tab_dispatch:
-        if disp is not None and not disp.empty:
-            st.subheader("Erzeugung nach Technologie (Zeitreihe)")
-            disp_zone = st.selectbox("Study Zone", options=["Alle"] + sorted(disp["study_zone"].unique().tolist()), key="disp_zone")
-            disp_ty = st.selectbox("Target Year", options=[None] + sorted(disp["target_year"].unique().tolist()), key="disp_ty", format_func=lambda x: "Alle" if x is None else str(x))
-            fig = plot_dispatch_timeseries(disp, config, study_zone=None if disp_zone == "Alle" else disp_zone, target_year=disp_ty)
-            st.plotly_chart(fig, use_container_width=True)
-            st.subheader("Erzeugung – Heatmap Technologie × Zeit")
-            hz = st.selectbox("Zone (Heatmap)", sorted(disp["study_zone"].unique().tolist()), key="heat_zone")
-            hy = st.selectbox("Zieljahr (Heatmap)", sorted(disp["target_year"].unique().tolist()), key="heat_year")
-            fig = plot_dispatch_heatmap(disp, config, hz, int(hy))
-            st.plotly_chart(fig, use_container_width=True)
-            st.subheader("Erzeugung – Stunde × Monat")
-            tech_hm = st.selectbox("Technologie (Stunde×Monat)", options=["Alle"] + sorted(disp["technology"].unique().tolist()), key="disp_tech_hm")
-            fig = plot_dispatch_heatmap_hour_month(disp, config, hz, int(hy), technology=None if tech_hm == "Alle" else tech_hm)
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("Keine Dispatch-Daten.")
-
-    with tab_netpos:
-        if netpos is not None and not netpos.empty:
-            st.subheader("Net Position (Zeitreihe)")
-            np_ty = st.selectbox("Target Year", options=[None] + sorted(netpos["target_year"].unique().tolist()), key="np_ty", format_func=lambda x: "Alle" if x is None else str(x))
-            fig = plot_net_position_timeseries(netpos, config, target_year=np_ty)
-            st.plotly_chart(fig, use_container_width=True)
-            st.subheader("Net Position – Heatmap Zone × Zeit")
-            for ty in sorted(netpos["target_year"].unique().tolist()):
-                fig = plot_net_position_heatmap(netpos, config, int(ty))
-                st.plotly_chart(fig, use_container_width=True)
-            st.subheader("Net Position – Stunde × Monat")
-            np_zone = st.selectbox("Zone (Stunde×Monat)", sorted(netpos["study_zone"].unique().tolist()), key="np_zone_hm")
-            np_ty_hm = st.selectbox("Zieljahr (Stunde×Monat)", sorted(netpos["target_year"].unique().tolist()), key="np_ty_hm")
-            fig = plot_net_position_heatmap_hour_month(netpos, config, np_zone, int(np_ty_hm))
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("Keine Net-Position-Daten.")
-
-    with tab_prices:
-        if prices is not None and not prices.empty:
-            st.subheader("Strompreis [€/MWh] – Zeitreihe")
-            fig = plot_prices_timeseries(prices, config)
-            st.plotly_chart(fig, use_container_width=True)
-            st.subheader("Preisverteilung (Boxplot)")
-            fig = plot_prices_boxplot(prices, config)
-            st.plotly_chart(fig, use_container_width=True)
-            st.subheader("Preis – Stunde × Monat")
-            pr_zone = st.selectbox("Zone (Stunde×Monat)", sorted(prices["study_zone"].unique().tolist()), key="pr_zone_hm")
-            pr_ty = st.selectbox("Zieljahr (Stunde×Monat)", sorted(prices["target_year"].unique().tolist()), key="pr_ty_hm")
-            fig = plot_prices_heatmap_hour_month(prices, config, pr_zone, int(pr_ty))
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("Keine Preisdaten.")
-
-    with tab_storage:
-        if storage is not None and not storage.empty:
-            st.subheader("Speicherfüllstand")
-            fig = plot_storage_level_timeseries(storage, config)
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("Keine Speicherdaten.")
-
-
-def page_europe_map(config, adeq):
-    st.subheader("Europakarte – LOLE und ENS pro Land")
-    if adeq is None or adeq.empty:
-        st.info("Keine Adequacy-Daten für die Karte.")
+def _sidebar_memory(dataset, figures: FigureCache) -> None:
+    """Speicher der Tabellen, Ableitungen (Sample-Mittel, Indizes, Profile) und Figuren."""
+    usage = dataset.memory_usage()
+    if usage.empty:
+        return
+    per_table = usage.pivot_table(
+        index="table", columns="kind", values="mb", aggfunc="sum", fill_value=0.0
+    )
+    per_table["gesamt"] = per_table.sum(axis=1)
+    total = usage["mb"].sum() + figures.nbytes / 1e6
+    with st.sidebar.expander(f"Speicher: {total:,.1f} MB"):
+        st.dataframe(per_table.round(1), use_container_width=True)
+        st.caption("Einmal pro Prozess geladen und von allen Sitzungen geteilt (MB).")
+        st.caption(figures.stats())
+
+
+def _profile_options(
+    profile, catalog: DimensionCatalog, table: str, dim: str, allowed: list | None = None
+) -> list:
+    """Auswahlliste aus dem Stunde×Monat-Profil bzw. dem Katalog, gemäß Sidebar-Filter."""
+    if profile is None:
+        return _options(catalog, table, dim, allowed)
+    return [v for v in profile.labels(dim) if allowed is None or v in allowed]
+
+
+@dataclass
+class _View:
+    """Was jeder Bereich braucht: Konfiguration, Figuren-Cache, Dataset und Sidebar-Auswahl."""
+
+    config: Config
+    figures: FigureCache
+    dataset: Any
+    filter_ty: list | None = None
+    filter_z: list | None = None
+
+    @functools.cached_property
+    def catalog(self) -> DimensionCatalog:
+        # Einmal pro Rerun: lazy prüft jeder Zugriff die Quelldateien
+        return self.dataset.catalog
+
+    @property
+    def sel(self) -> dict:
+        return {"target_year": self.filter_ty, "study_zone": self.filter_z}
+
+    def chart(self, func, source, *args, window: tuple | None = None, **kwargs) -> None:
+        """
+        Figur aus dem Cache zeichnen; Tabellen werden per Sidebar-Auswahl ausgeschnitten,
+        Profile über die Argumente.
+
+        `window`: Zeitfenster, das auf dem Index ausgeschnitten und mit dem vollen Punktbudget
+        aufgelöst wird.
+        """
+        select = None if isinstance(source, HourMonthProfile) else self.sel
+        if window is not None and select is not None:
+            select = {**select, "window": window}
+        fig = self.figures.figure(func, source, self.config, *args, select=select, **kwargs)
+        st.plotly_chart(fig, use_container_width=True)
+
+
+def _time_window(index: TableIndex | None, key: str) -> tuple | None:
+    """
+    Zeitfenster einer Zeitreihe per Schieberegler (None = ganzer Horizont).
+
+    Streamlit meldet Zoom/Relayout im Browser nicht an den Server; das Fenster wird deshalb hier
+    gewählt, auf dem Index ausgeschnitten und mit demselben Punktbudget feiner aufgelöst.
+    """
+    bounds = index.time_range if index is not None else None
+    if bounds is None or bounds[0] == bounds[1]:
+        return None
+    first, last = (b.to_pydatetime() for b in bounds)
+    start, stop = st.slider(
+        "Zeitfenster",
+        min_value=first,
+        max_value=last,
+        value=(first, last),
+        step=timedelta(hours=1),
+        format="DD.MM.YYYY HH:mm",
+        key=key,
+        help="Ausschnitt wählen – er wird mit voller Auflösung (bis zum Punktbudget) neu geladen.",
+    )
+    return None if (start, stop) == (first, last) else (start, stop)
+
+
+# --- Diagrammgruppen mit eigenen Auswahlboxen (Fragment: Änderung rechnet nur die Gruppe neu) ---
+
+
+@st.fragment
+def _adequacy_hour_month(view: _View) -> None:
+    if not _available(view.catalog, "adequacy_hour_month", view.filter_ty, view.filter_z):
         return
-    map_ty = st.selectbox("Zieljahr", options=[None] + sorted(adeq["target_year"].unique().tolist()), key="eu_map_ty", format_func=lambda x: "Alle" if x is None else str(x))
+    adeq_hm = view.dataset.index("adequacy_hour_month")
+    st.subheader("LOLE und ENS – Stunde (24h) × Monat (12)")
+    lole_profile = view.dataset.hour_month_profile("adequacy_hour_month", "lole_h")
+    lole_hm = lole_profile or adeq_hm
+    ens_hm = view.dataset.hour_month_profile("adequacy_hour_month", "ens_mwh") or adeq_hm
+    zones = _profile_options(
+        lole_profile, view.catalog, "adequacy_hour_month", "study_zone", view.filter_z
+    )
+    years = _profile_options(
+        lole_profile, view.catalog, "adequacy_hour_month", "target_year", view.filter_ty
+    )
+    zone_hm = st.selectbox("Zone (Stunde×Monat)", options=["Alle"] + zones, key="adeq_hm_zone")
+    ty_hm = st.selectbox(
+        "Zieljahr (Stunde×Monat)",
+        options=[None] + years,
+        key="adeq_hm_ty",
+        format_func=lambda x: "Alle" if x is None else str(x),
+    )
+    # "Alle" = alle Werte des Sidebar-Filters
+    sel_zone = view.filter_z if zone_hm == "Alle" else zone_hm
+    sel_ty = view.filter_ty if ty_hm is None else ty_hm
     c1, c2 = st.columns(2)
     with c1:
-        fig = plot_adequacy_europe_map(adeq, config, metric="lole", target_year=map_ty)
-        st.plotly_chart(fig, use_container_width=True)
+        view.chart(
+            plot_adequacy_lole_heatmap_hour_month, lole_hm, study_zone=sel_zone, target_year=sel_ty
+        )
     with c2:
-        fig = plot_adequacy_europe_map(adeq, config, metric="ens", target_year=map_ty)
-        st.plotly_chart(fig, use_container_width=True)
+        view.chart(
+            plot_adequacy_ens_heatmap_hour_month, ens_hm, study_zone=sel_zone, target_year=sel_ty
+        )
+
+
+@st.fragment
+def _adequacy_map(view: _View, label: str, key: str) -> None:
+    adeq = view.dataset.index("adequacy")
+    map_ty = st.selectbox(
+        label,
+        options=[None] + _options(view.catalog, "adequacy", "target_year", view.filter_ty),
+        key=key,
+        format_func=lambda x: "Alle" if x is None else str(x),
+    )
+    c1, c2 = st.columns(2)
+    with c1:
+        view.chart(plot_adequacy_europe_map, adeq, metric="lole", target_year=map_ty)
+    with c2:
+        view.chart(plot_adequacy_europe_map, adeq, metric="ens", target_year=map_ty)
+
+
+@st.fragment
+def _dispatch_timeseries(view: _View) -> None:
+    disp = view.dataset.index("dispatch", mean=True)
+    st.subheader("Erzeugung nach Technologie (Zeitreihe)")
+    disp_zone = st.selectbox(
+        "Study Zone",
+        options=["Alle"] + _options(view.catalog, "dispatch", "study_zone", view.filter_z),
+        key="disp_zone",
+    )
+    disp_ty = st.selectbox(
+        "Target Year",
+        options=[None] + _options(view.catalog, "dispatch", "target_year", view.filter_ty),
+        key="disp_ty",
+        format_func=lambda x: "Alle" if x is None else str(x),
+    )
+    window = _time_window(disp, "disp_window")
+    zone = None if disp_zone == "Alle" else disp_zone
+    view.chart(
+        plot_dispatch_timeseries, disp, study_zone=zone, target_year=disp_ty, window=window
+    )
+
+
+@st.fragment
+def _dispatch_heatmaps(view: _View) -> None:
+    disp = view.dataset.index("dispatch", mean=True)
+    profile = view.dataset.hour_month_profile("dispatch", "generation_mw")
+    st.subheader("Erzeugung – Heatmap Technologie × Zeit")
+    hz = st.selectbox(
+        "Zone (Heatmap)",
+        _options(view.catalog, "dispatch", "study_zone", view.filter_z),
+        key="heat_zone",
+    )
+    hy = st.selectbox(
+        "Zieljahr (Heatmap)",
+        _options(view.catalog, "dispatch", "target_year", view.filter_ty),
+        key="heat_year",
+    )
+    view.chart(plot_dispatch_heatmap, disp, hz, int(hy))
+    st.subheader("Erzeugung – Stunde × Monat")
+    tech_hm = st.selectbox(
+        "Technologie (Stunde×Monat)",
+        options=["Alle"] + _profile_options(profile, view.catalog, "dispatch", "technology"),
+        key="disp_tech_hm",
+    )
+    technology = None if tech_hm == "Alle" else tech_hm
+    view.chart(
+        plot_dispatch_heatmap_hour_month, profile or disp, hz, int(hy), technology=technology
+    )
+
+
+@st.fragment
+def _net_position_timeseries(view: _View) -> None:
+    netpos = view.dataset.index("net_position", mean=True)
+    st.subheader("Net Position (Zeitreihe)")
+    np_ty = st.selectbox(
+        "Target Year",
+        options=[None] + _options(view.catalog, "net_position", "target_year", view.filter_ty),
+        key="np_ty",
+        format_func=lambda x: "Alle" if x is None else str(x),
+    )
+    window = _time_window(netpos, "np_window")
+    view.chart(plot_net_position_timeseries, netpos, target_year=np_ty, window=window)
+
+
+@st.fragment
+def _net_position_hour_month(view: _View) -> None:
+    netpos = view.dataset.index("net_position", mean=True)
+    profile = view.dataset.hour_month_profile("net_position", "net_position_mw")
+    st.subheader("Net Position – Stunde × Monat")
+    np_zone = st.selectbox(
+        "Zone (Stunde×Monat)",
+        _profile_options(profile, view.catalog, "net_position", "study_zone", view.filter_z),
+        key="np_zone_hm",
+    )
+    np_ty_hm = st.selectbox(
+        "Zieljahr (Stunde×Monat)",
+        _profile_options(profile, view.catalog, "net_position", "target_year", view.filter_ty),
+        key="np_ty_hm",
+    )
+    view.chart(plot_net_position_heatmap_hour_month, profile or netpos, np_zone, int(np_ty_hm))
+
+
+@st.fragment
+def _prices_timeseries(view: _View) -> None:
+    prices = view.dataset.index("prices", mean=True)
+    st.subheader("Strompreis [€/MWh] – Zeitreihe")
+    view.chart(plot_prices_timeseries, prices, window=_time_window(prices, "pr_window"))
+
+
+@st.fragment
+def _storage_timeseries(view: _View) -> None:
+    storage = view.dataset.index("storage", mean=True)
+    st.subheader("Speicherfüllstand")
+    view.chart(plot_storage_level_timeseries, storage, window=_time_window(storage, "st_window"))
+
+
+@st.fragment
+def _prices_hour_month(view: _View) -> None:
+    prices = view.dataset.index("prices", mean=True)
+    profile = view.dataset.hour_month_profile("prices", "price_eur_mwh")
+    st.subheader("Preis – Stunde × Monat")
+    pr_zone = st.selectbox(
+        "Zone (Stunde×Monat)",
+        _profile_options(profile, view.catalog, "prices", "study_zone", view.filter_z),
+        key="pr_zone_hm",
+    )
+    pr_ty = st.selectbox(
+        "Zieljahr (Stunde×Monat)",
+        _profile_options(profile, view.catalog, "prices", "target_year", view.filter_ty),
+        key="pr_ty_hm",
+    )
+    view.chart(plot_prices_heatmap_hour_month, profile or prices, pr_zone, int(pr_ty))
+
+
+# --- Bereiche: nur der gewählte wird berechnet (und nur dessen Tabellen werden geladen) ---
+
+
+def _section_adequacy(view: _View) -> None:
+    if not _available(view.catalog, "adequacy", view.filter_ty, view.filter_z):
+        st.info("Keine Adequacy-Daten. Bitte Beispieldaten mit `python3.11 scripts/generate_sample_data.py` erzeugen.")
+        return
+    adeq = view.dataset.index("adequacy")
+    st.subheader("Loss of Load Expectation (LOLE) und Energy Not Served (ENS)")
+    c1, c2 = st.columns(2)
+    with c1:
+        view.chart(plot_adequacy_lole_boxplot, adeq)
+    with c2:
+        view.chart(plot_adequacy_ens_boxplot, adeq)
+    st.subheader("LOLE – Heatmap Zone × Zieljahr")
+    view.chart(plot_adequacy_lole_heatmap, adeq)
+    _adequacy_hour_month(view)
+    st.subheader("Europakarte – Jahres-LOLE und -ENS pro Land")
+    _adequacy_map(view, "Zieljahr (Karte)", "map_ty")
+
+
+def _section_dispatch(view: _View) -> None:
+    # Zeitreihen: gemerktes Sample-Mittel statt Rohdaten
+    if not _available(view.catalog, "dispatch", view.filter_ty, view.filter_z):
+        st.info("Keine Dispatch-Daten.")
+        return
+    _dispatch_timeseries(view)
+    _dispatch_heatmaps(view)
+
+
+def _section_net_position(view: _View) -> None:
+    if not _available(view.catalog, "net_position", view.filter_ty, view.filter_z):
+        st.info("Keine Net-Position-Daten.")
+        return
+    netpos = view.dataset.index("net_position", mean=True)
+    _net_position_timeseries(view)
+    st.subheader("Net Position – Heatmap Zone × Zeit")
+    for ty in _options(view.catalog, "net_position", "target_year", view.filter_ty):
+        view.chart(plot_net_position_heatmap, netpos, int(ty))
+    _net_position_hour_month(view)
+
+
+def _section_prices(view: _View) -> None:
+    # Preise roh nur für den Boxplot (Verteilung über die Läufe); Zeitreihe und Stunde×Monat
+    # nutzen wie Dispatch das geteilte Sample-Mittel
+    if not _available(view.catalog, "prices", view.filter_ty, view.filter_z):
+        st.info("Keine Preisdaten.")
+        return
+    prices = view.dataset.index("prices")
+    _prices_timeseries(view)
+    st.subheader("Preisverteilung (Boxplot)")
+    # Mit Streaming sind die Preise Sample-Mittel; die Verteilung über alle Läufe liefert der Sketch
+    view.chart(plot_prices_boxplot, view.dataset.sketches.get("prices", prices))
+    _prices_hour_month(view)
+
+
+def _section_storage(view: _View) -> None:
+    if not _available(view.catalog, "storage", view.filter_ty, view.filter_z):
+        st.info("Keine Speicherdaten.")
+        return
+    _storage_timeseries(view)
+
+
+SECTIONS = {
+    "Adequacy (LOLE & ENS)": _section_adequacy,
+    "Dispatch (Erzeugung)": _section_dispatch,
+    "Net Position": _section_net_position,
+    "Preise": _section_prices,
+    "Speicher": _section_storage,
+}
+
+
+def page_visualizations(view: _View) -> None:
+    # Statt st.tabs (führt den Code aller Tabs aus) wird nur der gewählte Bereich gerechnet
+    section = st.radio(
+        "Bereich", list(SECTIONS), horizontal=True, key="section", label_visibility="collapsed"
+    )
+    SECTIONS[section](view)
+
+
+def page_europe_map(view: _View) -> None:
+    st.subheader("Europakarte – LOLE und ENS pro Land")
+    if not _available(view.catalog, "adequacy", view.filter_ty, view.filter_z):
+        st.info("Keine Adequacy-Daten für die Karte.")
+        return
+    _adequacy_map(view, "Zieljahr", "eu_map_ty")
 
 
 def page_data_model():
@@ -289,13 +540,6 @@ def main() -> None:
     config, dataset = _load_config_and_data()
     filter_ty, filter_z = _sidebar_filters(config, dataset)
 
-    adeq = _filter_df(dataset.adequacy, target_years=filter_ty, study_zones=filter_z)
-    adeq_hm = _filter_df(dataset.adequacy_hour_month, target_years=filter_ty, study_zones=filter_z)
-    disp = _filter_df(dataset.dispatch, target_years=filter_ty, study_zones=filter_z)
-    netpos = _filter_df(dataset.net_position, target_years=filter_ty, study_zones=filter_z)
-    prices = _filter_df(dataset.prices, target_years=filter_ty, study_zones=filter_z)
-    storage = _filter_df(dataset.storage, target_years=filter_ty, study_zones=filter_z)
-
     st.sidebar.markdown("---")
     page = st.sidebar.radio(
         "Seite",
@@ -306,14 +550,21 @@ def main() -> None:
     st.sidebar.caption("Daten: Ordner `data/`. Beispieldaten: `python3.11 scripts/generate_sample_data.py`")
     st.sidebar.markdown("[ENTSO-E ERAA](https://www.entsoe.eu/eraa/)")
 
+    figures = _figure_cache(config.visualization.figure_cache_mb)
+    # Sidebar-Auswahl; ausgeschnitten wird erst, wenn eine Figur nicht im Cache liegt
+    view = _View(config, figures, dataset, filter_ty, filter_z)
+
+    # Nur die Tabellen des aktiven Bereichs laden
     if page == "Visualisierungen":
-        page_visualizations(config, adeq, adeq_hm, disp, netpos, prices, storage)
+        page_visualizations(view)
     elif page == "Europakarte":
-        page_europe_map(config, adeq)
+        page_europe_map(view)
     elif page == "Datenmodell":
         page_data_model()
     else:
         page_eraa_process()
+    # Nach der Seite: enthält auch die in diesem Lauf gebauten Ableitungen
+    _sidebar_memory(dataset, figures)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,77 @@
+"""
+Rerun-Latenz des Streamlit-Dashboards (AppTest, ohne Browser).
+
+Misst auf den Daten in `data/` (Beispieldaten: scripts/generate_sample_data.py) den ersten Lauf
+(Laden + alle sichtbaren Figuren), einen Rerun ohne Änderung, die Änderung einer Auswahlbox im
+Bereich Preise und einer Sidebar-Filteränderung – jeweils Median über mehrere Wiederholungen.
+Für einen Vorher/Nachher-Vergleich das Skript auf beiden Ständen ausführen. Aufruf:
+
+    uv run python scripts/benchmark_dashboard.py --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import statistics
+import time
+from pathlib import Path
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+APP = Path(__file__).resolve().parent.parent / "app" / "dashboard.py"
+
+
+def timed(at: AppTest) -> float:
+    t0 = time.perf_counter()
+    # Streamlit schreibt ohne laufenden Server Warnungen nach stderr
+    with contextlib.redirect_stderr(io.StringIO()):
+        at.run()
+    seconds = time.perf_counter() - t0
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return seconds
+
+
+def keys(at: AppTest, kind: str) -> set[str]:
+    return {w.key for w in getattr(at, kind) if w.key}
+
+
+def open_prices(at: AppTest) -> None:
+    """Bereich Preise öffnen (Dashboard mit Bereichsauswahl; bei Tabs sind alle Bereiche aktiv)."""
+    if "section" in keys(at, "radio"):
+        section = at.radio(key="section")
+        section.set_value(next(o for o in section.options if o.startswith("Preise")))
+        timed(at)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = ("erster Lauf", "Rerun", "Auswahl Preise", "Sidebar-Filter")
+    results: dict[str, list[float]] = {name: [] for name in runs}
+    for _ in range(args.repeat):
+        st.cache_resource.clear()
+        at = AppTest.from_file(str(APP), default_timeout=600)
+        results["erster Lauf"].append(timed(at))
+        results["Rerun"].append(timed(at))
+        open_prices(at)
+        zone = at.selectbox(key="pr_zone_hm")
+        zone.select(zone.options[-1])
+        results["Auswahl Preise"].append(timed(at))
+        years = at.sidebar.multiselect[0]
+        years.set_value(years.options[-1:])
+        results["Sidebar-Filter"].append(timed(at))
+
+    print(f"{APP.relative_to(APP.parent.parent)}, {args.repeat} Wiederholung(en)")
+    for name, values in results.items():
+        median, low = statistics.median(values) * 1000, min(values) * 1000
+        print(f"  {name:<16} {median:8.0f} ms  (min {low:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Aufbau- und Serialisierungszeit von Liniendiagrammen: SVG (Scatter) vs. WebGL (Scattergl).
+
+Erzeugt synthetische Preis-Zeitreihen (Zonen × Stunden), baut `plot_prices_timeseries` einmal mit
+SVG und einmal mit WebGL und misst Figurenaufbau, JSON-Serialisierung und HTML-Größe. Die
+Zeichenzeit im Browser hängt an der Trace-Art: SVG legt pro Punkt ein DOM-Element an, WebGL nicht –
+oberhalb einiger zehntausend Punkte wird SVG beim Zoomen zäh. Mit dem Ergebnis lässt sich
+`visualization.webgl_min_points` in config.yaml einstellen. Aufruf:
+
+    uv run python scripts/benchmark_render.py --zones 5 20 50 --hours 8760
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from eraa_visualizer.config import Config  # noqa: E402
+from eraa_visualizer.plots import plot_prices_timeseries  # noqa: E402
+
+
+def synthetic_prices(n_zones: int, hours: int, rng: np.random.Generator) -> pd.DataFrame:
+    times = pd.date_range("2030-01-01", periods=hours, freq="h")
+    return pd.DataFrame({
+        "study_zone": np.repeat([f"Z{i:02d}" for i in range(n_zones)], hours),
+        "target_year": 2030,
+        "datetime": np.tile(times, n_zones),
+        "price_eur_mwh": rng.lognormal(4.3, 0.4, n_zones * hours),
+    })
+
+
+def measure(df: pd.DataFrame, config: Config) -> tuple[float, float, int, str]:
+    t0 = time.perf_counter()
+    fig = plot_prices_timeseries(df, config)
+    build = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    html = fig.to_html(include_plotlyjs=False, full_html=False)
+    serialise = time.perf_counter() - t0
+    return build, serialise, len(html.encode()), fig.data[0].type
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--zones", type=int, nargs="+", default=[5, 20, 50])
+    parser.add_argument("--hours", type=int, default=8760)
+    parser.add_argument(
+        "--max-points", type=int, default=0, help="timeseries_max_points (0 = ohne Downsampling)"
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'Punkte':>10} {'Trace':>10} {'Aufbau':>8} {'JSON/HTML':>10} {'Größe':>10}")
+    for n_zones in args.zones:
+        df = synthetic_prices(n_zones, args.hours, rng)
+        for threshold in (None, 0):
+            config = Config()
+            config.visualization.timeseries_max_points = args.max_points
+            config.visualization.webgl_min_points = threshold
+            build, serialise, size, trace = measure(df, config)
+            print(
+                f"{len(df):>10,} {trace:>10} {build:>7.2f}s {serialise:>9.2f}s "
+                f"{size / 1e6:>8.1f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
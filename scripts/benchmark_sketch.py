@@ -0,0 +1,96 @@
+"""
+Genauigkeit vs. Speicher der Quantil-Sketches im Vergleich zu exaktem np.quantile.
+
+Erzeugt synthetische Stundenpreise in ERAA-Größe (Klimajahre × Samples × 8760 h pro Zone/Zieljahr),
+füttert sie blockweise (wie die Loader) in je einen Sketch pro Gruppe und vergleicht die Boxplot-
+Perzentile mit np.quantile über die vollständige Spalte. Aufruf:
+
+    uv run python scripts/benchmark_sketch.py --zones 2 --climate-years 36 --samples 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from eraa_visualizer.sketch import QuantileSketch  # noqa: E402
+
+PERCENTILES = np.array([1, 5, 25, 50, 75, 95, 99]) / 100
+
+
+def synthetic_prices(rng: np.random.Generator, n_runs: int, hours: int = 8760) -> np.ndarray:
+    """
+    Preise [€/MWh] eines Laufs pro Zeile: Tages-/Jahresgang, log-normales Rauschen, seltene
+    Knappheitsspitzen.
+    """
+    t = np.arange(hours)
+    shape = 80 + 25 * np.sin(2 * np.pi * (t % 24 - 7) / 24) + 20 * np.cos(2 * np.pi * t / hours)
+    noise = rng.lognormal(0, 0.35, size=(n_runs, hours))
+    scarce = rng.random((n_runs, hours)) < 0.002
+    spikes = np.where(scarce, rng.uniform(500, 3000, (n_runs, hours)), 0)
+    return (shape * noise + spikes).astype("float32")
+
+
+def rank_error(sorted_values: np.ndarray, estimates: np.ndarray, qs: np.ndarray) -> float:
+    """Größte Abweichung zwischen Soll-Rang q und tatsächlichem Rang des Schätzwerts."""
+    lo = np.searchsorted(sorted_values, estimates, side="left") / len(sorted_values)
+    hi = np.searchsorted(sorted_values, estimates, side="right") / len(sorted_values)
+    return float(np.max(np.maximum(0, np.maximum(lo - qs, qs - hi))))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--zones", type=int, default=2, help="Anzahl Gruppen (Zone × Zieljahr)")
+    parser.add_argument("--climate-years", type=int, default=36)
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--chunk-runs", type=int, default=20, help="Läufe pro Block beim Einlesen")
+    parser.add_argument("--k", type=int, nargs="+", default=[50, 100, 200, 400, 800])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    n_runs = args.climate_years * args.samples
+    groups = [synthetic_prices(rng, n_runs) for _ in range(args.zones)]
+    exact_sorted = [np.sort(g.ravel()) for g in groups]
+    exact_bytes = sum(g.nbytes for g in groups)
+    t0 = time.perf_counter()
+    exact = [np.quantile(g, PERCENTILES) for g in groups]
+    exact_seconds = time.perf_counter() - t0
+    n_values = sum(g.size for g in groups)
+    print(f"{args.zones} Gruppen × {n_runs} Läufe × 8760 h = {n_values:,} Werte")
+    print(f"exakt (np.quantile): {exact_bytes / 1e6:9.1f} MB  {exact_seconds:6.2f} s")
+    print()
+    print(
+        f"{'k':>5} {'Speicher':>10} {'Faktor':>8} {'Rangfehler':>11} {'rel. Fehler':>12} "
+        f"{'Zeit':>7}"
+    )
+
+    for k in args.k:
+        sketches = [QuantileSketch(k, seed=0) for _ in groups]
+        t0 = time.perf_counter()
+        for sketch, g in zip(sketches, groups):
+            # Blockweise wie die Loader; jeder Block als eigener Sketch, danach gemergt
+            for block in np.array_split(g, max(1, n_runs // args.chunk_runs)):
+                part = QuantileSketch(k)
+                part.update(block)
+                sketch.merge(part)
+        seconds = time.perf_counter() - t0
+        nbytes = sum(s.nbytes for s in sketches)
+        estimates = [s.quantile(PERCENTILES) for s in sketches]
+        r_err = max(rank_error(xs, est, PERCENTILES) for xs, est in zip(exact_sorted, estimates))
+        v_err = max(
+            float(np.max(np.abs(est - ex) / np.abs(ex))) for est, ex in zip(estimates, exact)
+        )
+        print(
+            f"{k:>5} {nbytes / 1e3:>8.1f} kB {exact_bytes / nbytes:>7.0f}x "
+            f"{r_err:>10.4%} {v_err:>11.3%} {seconds:>6.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -158,7 +158,9 @@ def generate_storage(rng: np.random.Generator, n_hours: int = 24 * 31) -> pd.Dat
                                 "study_zone": zone,
                                 "target_year": ty,
                                 "storage_type": stype,
-                                "datetime": f"2025-01-01T{t:02d}:00:00",
+                                "datetime": (
+                                    pd.Timestamp("2025-01-01") + pd.Timedelta(hours=t)
+                                ).strftime("%Y-%m-%dT%H:%M:%S"),
                                 "climate_year": cy,
                                 "sample_id": sid,
                                 "level_pct": float(level),
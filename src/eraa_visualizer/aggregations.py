@@ -0,0 +1,246 @@
+"""
+Aggregationen über die Monte-Carlo-Läufe (climate_year × sample_id).
+
+Die Zeitreihen-Plots brauchen nur das Sample-Mittel pro Zone/Zieljahr/Technologie/Zeitschritt.
+`RunMeanAccumulator` berechnet es blockweise mit laufenden Summen und Zählern, sodass die
+Rohdaten nie vollständig im Speicher liegen müssen. `HourMonthProfile` hält Stunde×Monat-Profile
+aller Zonen/Zieljahre, aus denen die Heatmaps nur noch ausschneiden.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+# Dimensionen der Monte-Carlo-Läufe, über die gemittelt wird
+RUN_DIMS = ("climate_year", "sample_id")
+
+# Schlüssel und Kennzahlen der Zeitreihen-Tabellen (kanonische Spaltennamen)
+TIME_SERIES_KEYS: dict[str, tuple[str, ...]] = {
+    "dispatch": ("study_zone", "target_year", "technology", "datetime"),
+    "net_position": ("study_zone", "target_year", "datetime"),
+    "prices": ("study_zone", "target_year", "datetime"),
+    "storage": ("study_zone", "target_year", "storage_type", "datetime"),
+}
+TIME_SERIES_VALUES: dict[str, tuple[str, ...]] = {
+    "dispatch": ("generation_mw", "load_mw"),
+    "net_position": ("net_position_mw",),
+    "prices": ("price_eur_mwh",),
+    "storage": ("level_pct", "level_mwh"),
+}
+
+# Spalte mit der Anzahl gemittelter Läufe im Ergebnis
+N_RUNS = "n_runs"
+
+
+def run_mean(df: pd.DataFrame, table: str, stats: bool = False) -> pd.DataFrame:
+    """
+    Sample-Mittel einer Zeitreihen-Tabelle in einem groupby-Durchlauf.
+
+    Ergebnis wie `RunMeanAccumulator.result()`: Schlüssel, Mittel je Kennzahl und `n_runs`;
+    mit `stats=True` zusätzlich `<kennzahl>_min` und `<kennzahl>_max`. Bereits aggregierte
+    Tabellen (Spalte `n_runs`, z.B. aus dem Streaming) werden unverändert zurückgegeben.
+    """
+    if N_RUNS in df.columns:
+        return df
+    keys = [k for k in TIME_SERIES_KEYS[table] if k in df.columns]
+    values = [v for v in TIME_SERIES_VALUES[table] if v in df.columns]
+    g = df.groupby(keys, observed=True)
+    parts = [g[values].mean(), g.size().rename(N_RUNS)]
+    if stats:
+        parts += [g[values].min().add_suffix("_min"), g[values].max().add_suffix("_max")]
+    return pd.concat(parts, axis=1).reset_index()
+
+
+class RunMeanAccumulator:
+    """
+    Laufende Summen/Zähler pro Schlüssel über beliebig viele Blöcke.
+
+    Teilaggregate werden zusammengefasst, sobald sie `compact_rows` Zeilen überschreiten;
+    der Speicherbedarf ist damit durch Blockgröße + Anzahl distinkter Schlüssel begrenzt.
+    """
+
+    def __init__(self, keys: Iterable[str], values: Iterable[str], compact_rows: int = 1_000_000):
+        self.keys = list(keys)
+        self.values = list(values)
+        self.compact_rows = compact_rows
+        self._parts: list[pd.DataFrame] = []
+        self._rows = 0
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        if chunk.empty:
+            return
+        keys = [k for k in self.keys if k in chunk.columns]
+        values = [v for v in self.values if v in chunk.columns]
+        if keys != self.keys or values != self.values:
+            # Schlüssel/Kennzahlen, die in der Quelle fehlen, fallen für alle Blöcke weg
+            self.keys, self.values = keys, values
+        # Summen in float64, auch wenn die Kennzahlen als float32 gelesen werden
+        # (Cast erst im Ergebnis)
+        chunk = chunk.astype(dict.fromkeys(self.values, "float64"))
+        g = chunk.groupby(self.keys, observed=True, sort=False)
+        part = pd.concat(
+            [
+                g[self.values].sum(),
+                g[self.values].count().add_suffix("__n"),
+                g.size().rename(N_RUNS),
+            ],
+            axis=1,
+        )
+        self._parts.append(part)
+        self._rows += len(part)
+        if self._rows > self.compact_rows and len(self._parts) > 1:
+            self._compact()
+
+    def _compact(self) -> None:
+        levels = list(range(len(self.keys)))
+        combined = pd.concat(self._parts).groupby(level=levels, sort=False).sum()
+        self._parts = [combined]
+        self._rows = len(combined)
+
+    def result(self) -> pd.DataFrame:
+        """Sample-Mittel pro Schlüssel plus Spalte `n_runs` (Anzahl aggregierter Zeilen)."""
+        if not self._parts:
+            return pd.DataFrame(columns=[*self.keys, *self.values, N_RUNS])
+        self._compact()
+        total = self._parts[0].sort_index()
+        out = pd.DataFrame(index=total.index)
+        for v in self.values:
+            out[v] = total[v] / total[f"{v}__n"].where(total[f"{v}__n"] > 0)
+        out[N_RUNS] = total[N_RUNS].astype("int64")
+        out.index.names = self.keys
+        return out.reset_index()
+
+
+def factorize_axis(col: pd.Series) -> tuple[np.ndarray, pd.Index]:
+    """
+    Codes und sortierte Beschriftungen einer Dimension (Kategorien direkt, sonst factorize;
+    NaN → -1).
+    """
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        # ungenutzte Kategorien entfernen, damit keine leeren Slices entstehen
+        col = col.cat.remove_unused_categories()
+        return col.cat.codes.to_numpy(), pd.Index(col.cat.categories, name=col.name)
+    codes, labels = pd.factorize(col, sort=True)
+    return codes, pd.Index(labels, name=col.name)
+
+
+# Dimensionen der Stunde×Monat-Profile je Tabelle (zusätzlich zu hour und month)
+PROFILE_DIMS: dict[str, tuple[str, ...]] = {
+    "adequacy_hour_month": ("study_zone", "target_year"),
+    "dispatch": ("study_zone", "target_year", "technology"),
+    "net_position": ("study_zone", "target_year"),
+    "prices": ("study_zone", "target_year"),
+    "storage": ("study_zone", "target_year", "storage_type"),
+}
+
+
+class HourMonthProfile:
+    """
+    Summen und Anzahlen einer Kennzahl pro (Dimensionen…, Stunde, Monat) als Tensor der Form
+    (…, 24, 12).
+
+    Wird in einem Durchlauf über die ganze Tabelle gebaut; `grid()` liefert das Mittel für eine
+    beliebige Auswahl (einzelne Werte, Listen oder alle) ohne erneuten Zugriff auf die Rohdaten.
+    """
+
+    def __init__(self, sums: np.ndarray, counts: np.ndarray, axes: dict[str, pd.Index], value: str):
+        self.sums = sums
+        self.counts = counts
+        self.axes = axes
+        self.value = value
+
+    @classmethod
+    def from_long(cls, df: pd.DataFrame, value: str, dims: Iterable[str]) -> HourMonthProfile:
+        """Erwartet Spalten hour (0–23) und month (1–12), siehe `models.normalize_time`."""
+        dims = [d for d in dims if d in df.columns]
+        codes, axes = [], {}
+        for dim in dims:
+            dim_codes, labels = factorize_axis(df[dim])
+            codes.append(dim_codes)
+            axes[dim] = labels
+        hour = df["hour"].to_numpy(dtype="int64", na_value=-1)
+        month = df["month"].to_numpy(dtype="int64", na_value=0) - 1
+        values = df[value].to_numpy(dtype="float64", na_value=np.nan)
+        valid = ~np.isnan(values) & (hour >= 0) & (hour < 24) & (month >= 0) & (month < 12)
+        for c in codes:
+            valid &= c >= 0
+        shape = (*(len(labels) for labels in axes.values()), 24, 12)
+        flat = np.ravel_multi_index((*(c[valid] for c in codes), hour[valid], month[valid]), shape)
+        size = int(np.prod(shape))
+        sums = np.bincount(flat, weights=values[valid], minlength=size).reshape(shape)
+        counts = np.bincount(flat, minlength=size).reshape(shape)
+        return cls(sums, counts, axes, value)
+
+    @property
+    def nbytes(self) -> int:
+        return self.sums.nbytes + self.counts.nbytes
+
+    def labels(self, dim: str) -> list:
+        """Ausprägungen einer Dimension (z.B. für Auswahllisten)."""
+        return self.axes[dim].tolist() if dim in self.axes else []
+
+    def grid(self, **selection: Any) -> np.ndarray:
+        """
+        Mittel als 24×12-Array (Stunde × Monat); NaN, wo keine Daten vorliegen.
+
+        Pro Dimension: None = alle, Einzelwert oder Liste; nicht vorhandene Werte ergeben ein
+        leeres Profil.
+        """
+        sums, counts = self.sums, self.counts
+        # Führende Achse ist immer die nächste Dimension: auswählen bzw. aufsummieren
+        for dim, labels in self.axes.items():
+            wanted = selection.get(dim)
+            if wanted is None:
+                sums, counts = sums.sum(axis=0), counts.sum(axis=0)
+                continue
+            many = isinstance(wanted, (list, tuple, set, np.ndarray, pd.Index))
+            positions = labels.get_indexer(list(wanted) if many else [wanted])
+            positions = positions[positions >= 0]
+            sums, counts = sums[positions].sum(axis=0), counts[positions].sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(counts > 0, sums / counts, np.nan)
+
+    def pivot(self, **selection: Any) -> pd.DataFrame:
+        """`grid()` als DataFrame (Index Stunde 0–23, Spalten Monat 1–12), fehlende Werte = 0."""
+        return pd.DataFrame(self.grid(**selection), index=range(24), columns=range(1, 13)).fillna(0)
+
+
+def box_stats(
+    df: pd.DataFrame,
+    keys: Iterable[str],
+    value: str,
+    percentiles: Iterable[float] = (5, 25, 50, 75, 95),
+    max_outliers: int = 1000,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Boxplot-Kennwerte pro Gruppe, vektorisiert über `groupby().quantile()`.
+
+    Box = 25./50./75. Perzentil, Whisker (Fences) = kleinstes/größtes Perzentil aus `percentiles`.
+    Liefert (Kennwerte mit q1, median, q3, lowerfence, upperfence, count; Ausreißer außerhalb der
+    Fences, pro Gruppe auf die `max_outliers` vom Median am weitesten entfernten gekappt).
+    """
+    keys = list(keys)
+    pcts = sorted({*percentiles, 25, 50, 75})
+    g = df.groupby(keys, observed=True)[value]
+    q = g.quantile([p / 100 for p in pcts]).unstack()
+    q.columns = pcts
+    stats = pd.DataFrame({
+        "q1": q[25],
+        "median": q[50],
+        "q3": q[75],
+        "lowerfence": q[pcts[0]],
+        "upperfence": q[pcts[-1]],
+        "count": g.count(),
+    })
+    bounds = stats[["median", "lowerfence", "upperfence"]]
+    joined = df[[*keys, value]].join(bounds, on=keys)
+    outside = (joined[value] < joined["lowerfence"]) | (joined[value] > joined["upperfence"])
+    outliers = joined[outside]
+    if len(outliers) and max_outliers >= 0:
+        dist = (outliers[value] - outliers["median"]).abs()
+        outliers = outliers.assign(_dist=dist).sort_values("_dist", ascending=False)
+        outliers = outliers.groupby(keys, observed=True).head(max_outliers)
+    return stats.reset_index(), outliers[[*keys, value]].reset_index(drop=True)
@@ -0,0 +1,115 @@
+"""Parquet-Cache für CSV-Eingaben: einmal parsen, danach spaltenorientiert lesen."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+# Erhöhen, wenn sich das Format der Cache-Einträge ändert (invalidiert alle Einträge)
+CACHE_VERSION = 2
+
+
+class TableCache:
+    """
+    Cache-Verzeichnis mit konvertierten Parquet-Dateien.
+
+    Ein Eintrag ist über Quellpfad, Dateigröße, mtime sowie Schema-Mapping und Dtypes
+    geschlüsselt; ändert sich eines davon, wird der Eintrag beim nächsten Laden neu gebaut.
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+    def _prefix(self, source: Path) -> str:
+        resolved = str(source.resolve())
+        return f"{source.stem}-{hashlib.sha256(resolved.encode()).hexdigest()[:8]}"
+
+    def key(
+        self, source: Path, schema: dict[str, str] | None, dtypes: dict[str, str] | None
+    ) -> str:
+        st = source.stat()
+        payload = {
+            "version": CACHE_VERSION,
+            "path": str(source.resolve()),
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "schema": schema or {},
+            "dtypes": dtypes or {},
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:16]
+
+    def entry_path(
+        self, source: Path, schema: dict[str, str] | None, dtypes: dict[str, str] | None
+    ) -> Path:
+        return self.cache_dir / f"{self._prefix(source)}-{self.key(source, schema, dtypes)}.parquet"
+
+    def lookup(
+        self, source: Path, schema: dict[str, str] | None, dtypes: dict[str, str] | None
+    ) -> Path | None:
+        """Pfad des gültigen Eintrags zu `source` (zählt als Hit) oder None."""
+        entry = self.entry_path(source, schema, dtypes)
+        if entry.exists():
+            self.hits += 1
+            return entry
+        return None
+
+    def get_or_build(
+        self,
+        source: Path,
+        schema: dict[str, str] | None,
+        dtypes: dict[str, str] | None,
+        build: Callable[[], pd.DataFrame],
+        filters: list[tuple[str, str, list]] | None = None,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Liest den Cache-Eintrag zu `source` oder baut ihn über `build()` neu.
+
+        `filters` (pyarrow-DNF) und `columns` werden nur beim Lesen eines vorhandenen Eintrags
+        angewendet; nach einem Neuaufbau wird die vollständige Tabelle zurückgegeben.
+        """
+        entry = self.entry_path(source, schema, dtypes)
+        if entry.exists():
+            self.hits += 1
+            if filters or columns is not None:
+                names = pq.read_schema(entry).names
+                if filters:
+                    filters = [f for f in filters if f[0] in names] or None
+                if columns is not None:
+                    columns = [c for c in names if c in columns]
+            return pd.read_parquet(entry, columns=columns, filters=filters)
+        self.misses += 1
+        df = build()
+        self._write(entry, df)
+        return df
+
+    def _write(self, entry: Path, df: pd.DataFrame) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Veraltete Einträge derselben Quelldatei entfernen
+        prefix = entry.name.rsplit("-", 1)[0]
+        for old in self.cache_dir.glob(f"{prefix}-*.parquet"):
+            old.unlink(missing_ok=True)
+        tmp = entry.with_suffix(f".tmp{os.getpid()}")
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, entry)
+
+    def clear(self) -> int:
+        """Löscht alle Cache-Einträge; gibt die Anzahl entfernter Dateien zurück."""
+        if not self.cache_dir.exists():
+            return 0
+        removed = 0
+        for f in self.cache_dir.glob("*.parquet"):
+            f.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    def stats(self) -> str:
+        return f"Cache: {self.hits} hit(s), {self.misses} miss(es) in {self.cache_dir}"
@@ -0,0 +1,75 @@
+"""
+Katalog der Dimensionen: welche Zonen, Zieljahre, Technologien, Speichertypen, Klimajahre und
+Samples in welcher Tabelle vorkommen.
+
+Wird beim ersten Zugriff gebaut – lazy aus Parquet-Footern/Partitionen bzw. nur den
+Dimensionsspalten der Quellen, sonst pro geladener Tabelle – und danach von den Dashboard-Filtern
+und `--list-only` gelesen, statt die Daten mit `.unique()` erneut zu scannen. Ändert sich eine
+Quelldatei bzw. wird eine Tabelle ersetzt, wird ihr Eintrag neu gebaut.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Iterable
+
+import pandas as pd
+
+CATALOG_DIMS = (
+    "study_zone", "target_year", "technology", "storage_type", "climate_year", "sample_id"
+)
+INT_DIMS = frozenset({"target_year", "climate_year", "sample_id"})
+
+
+def plain_values(values: Iterable, dim: str) -> list:
+    """Ausprägungen als sortierte Python-Werte (int für Jahre/Samples, sonst str), ohne fehlende."""
+    out = set()
+    for v in values:
+        if v is None or (isinstance(v, float) and math.isnan(v)) or v is pd.NA:
+            continue
+        out.add(int(v) if dim in INT_DIMS else str(v))
+    return sorted(out)
+
+
+def frame_dimensions(df: pd.DataFrame) -> dict[str, list]:
+    """Ausprägungen aller Katalog-Dimensionen einer Tabelle (ein `unique` pro Spalte)."""
+    return {dim: plain_values(df[dim].unique(), dim) for dim in CATALOG_DIMS if dim in df.columns}
+
+
+class DimensionCatalog:
+    """Tabelle → Dimension → sortierte Ausprägungen."""
+
+    def __init__(self, tables: dict[str, dict[str, list]] | None = None):
+        self._tables = {table: dict(dims) for table, dims in (tables or {}).items()}
+
+    @classmethod
+    def from_frames(cls, frames: dict[str, pd.DataFrame | None]) -> DimensionCatalog:
+        return cls({
+            table: frame_dimensions(df)
+            for table, df in frames.items()
+            if df is not None and not df.empty
+        })
+
+    def __contains__(self, table: str) -> bool:
+        return table in self._tables
+
+    @property
+    def tables(self) -> list[str]:
+        return list(self._tables)
+
+    def dimensions(self, table: str) -> dict[str, list]:
+        """Alle Dimensionen einer Tabelle ({} wenn die Tabelle fehlt)."""
+        return self._tables.get(table, {})
+
+    def values(self, dim: str, tables: str | Iterable[str] | None = None) -> list:
+        """Ausprägungen einer Dimension in einer oder mehreren Tabellen (None = alle)."""
+        if isinstance(tables, str):
+            tables = [tables]
+        if tables is None:
+            selected = self._tables
+        else:
+            selected = {t: self._tables[t] for t in tables if t in self._tables}
+        out: set = set()
+        for dims in selected.values():
+            out.update(dims.get(dim, ()))
+        return sorted(out)
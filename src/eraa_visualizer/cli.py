@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 
 import click
 
+from .config import Config
+from .loaders import load_dataset, memory_report, table_cache, warm_table_cache
 from .pipeline import run_pipeline
+from .report import read_manifest
 
 
 @click.command()
@@ -22,25 +26,113 @@ from .pipeline import run_pipeline
     is_flag=True,
     help="Nur auflisten, welche Daten/Plots erzeugt würden (ohne zu schreiben).",
 )
-def main(config: Path, list_only: bool) -> None:
+@click.option(
+    "--warm-cache",
+    is_flag=True,
+    help="CSV-Eingaben Tabelle für Tabelle in den Parquet-Cache konvertieren (ohne Plots), "
+    "auch gestreamte Zeitreihen.",
+)
+@click.option(
+    "--clear-cache",
+    is_flag=True,
+    help="Parquet-Cache leeren.",
+)
+@click.option(
+    "--memory",
+    is_flag=True,
+    help="Mit --list-only: Tabellen laden und Speicherersparnis der Dtypes ausgeben.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Plots in so vielen Prozessen parallel rendern (Standard: visualization.jobs).",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Alle Plots neu bauen (sonst nur die, deren Daten/Konfiguration sich geändert haben).",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Ladezeiten pro Tabelle ausgeben.")
+def main(
+    config: Path,
+    list_only: bool,
+    warm_cache: bool,
+    clear_cache: bool,
+    memory: bool,
+    jobs: int | None,
+    force: bool,
+    verbose: bool,
+) -> None:
     """ERAA Data Visualizer – Visualisierungspipeline für ERAA-Modelloutputs."""
+    if verbose:
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+    cfg = Config.load(config)
+    cache = table_cache(cfg)
+    if clear_cache:
+        removed = cache.clear() if cache is not None else 0
+        click.echo(f"Cache geleert: {removed} Datei(en) entfernt.")
+        if not (warm_cache or list_only):
+            return
+    if warm_cache:
+        if cache is None:
+            raise click.UsageError("Kein cache_dir in der Konfiguration gesetzt (paths.cache_dir).")
+        warm_table_cache(cfg, cache)
+        click.echo(cache.stats())
+        return
+
     if list_only:
-        from .config import Config
-        from .loaders import load_dataset
-
-        cfg = Config.load(config)
-        dataset = load_dataset(cfg)
-        click.echo("Geladene Daten:")
-        click.echo(f"  Adequacy:      {dataset.adequacy is not None and not dataset.adequacy.empty}")
-        click.echo(f"  Dispatch:      {dataset.dispatch is not None and not dataset.dispatch.empty}")
-        click.echo(f"  Net Position:  {dataset.net_position is not None and not dataset.net_position.empty}")
-        click.echo(f"  Prices:        {dataset.prices is not None and not dataset.prices.empty}")
-        click.echo(f"  Storage:       {dataset.storage is not None and not dataset.storage.empty}")
+        # Lazy: nur Metadaten aus Headern/Footern, Tabellen werden nicht geladen
+        dataset = load_dataset(cfg, cache=cache, lazy=True)
+        catalog = dataset.catalog
+        click.echo("Verfügbare Daten:")
+        for label, table in (
+            ("Adequacy", "adequacy"),
+            ("Dispatch", "dispatch"),
+            ("Net Position", "net_position"),
+            ("Prices", "prices"),
+            ("Storage", "storage"),
+        ):
+            info = dataset.info(table)
+            if info is None or not info.row_count:
+                click.echo(f"  {label + ':':<14} False")
+                continue
+            dims = catalog.dimensions(table)
+            details = [f"{info.row_count} rows", f"{len(dims.get('study_zone', []))} zones"]
+            counted = (("technology", "technologies"), ("storage_type", "storage types"))
+            details += [f"{len(dims[dim])} {name}" for dim, name in counted if dim in dims]
+            if "climate_year" in dims:
+                samples = len(dims.get("sample_id", [])) or 1
+                details.append(f"{len(dims['climate_year'])} CY × {samples} samples")
+            click.echo(
+                f"  {label + ':':<14} True  ({', '.join(details)}, "
+                f"TY {', '.join(map(str, dims.get('target_year', [])))})"
+            )
+        if memory:
+            report = memory_report(dataset)
+            if not report.empty:
+                click.echo("Speicher (typisiert vs. Standard-Dtypes):")
+                for r in report.itertuples(index=False):
+                    click.echo(
+                        f"  {r.table:<20} {r.rows:>9} rows  {r.typed_mb:8.2f} MB "
+                        f"(statt {r.untyped_mb:8.2f} MB, -{r.saved_pct:.0f}%)"
+                    )
+        if cache is not None:
+            click.echo(cache.stats())
         click.echo("Run without --list-only to generate HTML plots.")
         return
 
     click.echo("Running ERAA visualization pipeline...")
-    written = run_pipeline(config)
+    written = run_pipeline(config, cache=cache, jobs=jobs, force=force)
+    if cache is not None:
+        click.echo(cache.stats())
+    build = read_manifest(cfg).get("build", {})
+    click.echo(
+        f"Rebuilt {build.get('rebuilt', 0)}, skipped {build.get('skipped', 0)} (unchanged)"
+        + (f", failed {build['failed']}" if build.get("failed") else "")
+        + "."
+    )
     click.echo(f"Done. Written {len(written)} HTML file(s) to {Path(written[0]).parent if written else 'N/A'}.")
     for p in written:
         click.echo(f"  {p}")
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import Literal
 
 import yaml
 from pydantic import BaseModel, Field
@@ -12,6 +12,8 @@ from pydantic import BaseModel, Field
 class PathsConfig(BaseModel):
     data_dir: str = "data"
     output_dir: str = "output"
+    # Parquet-Cache für CSV-Eingaben (None = deaktiviert)
+    cache_dir: str | None = None
     output_subdirs: dict[str, str] = Field(
         default_factory=lambda: {
             "adequacy": "adequacy",
@@ -29,6 +31,21 @@ class DimensionsConfig(BaseModel):
     target_years: list[int] = Field(default_factory=lambda: [2025, 2028, 2030, 2033])
 
 
+class LoadingConfig(BaseModel):
+    # Zeitreihen (Dispatch, Net Position, Preise, Speicher) blockweise lesen und nur das
+    # Sample-Mittel über climate_year × sample_id behalten (für Dateien größer als RAM)
+    stream_time_series: bool = False
+    # Zeilen pro Block; bestimmt den Spitzenspeicher beim Streaming
+    chunk_rows: int = 1_000_000
+    # Beim Streaming zusätzlich Quantil-Sketches der Preise pro Zone × Zieljahr führen (Boxplots
+    # über alle Läufe); größeres k = genauer, Speicher wächst etwa linear
+    # (siehe scripts/benchmark_sketch.py)
+    sketch_k: int = 200
+    # Tabellen parallel laden (1 = sequentiell); "thread" oder "process"
+    workers: int = 1
+    executor: Literal["thread", "process"] = "thread"
+
+
 class TechnologyConfig(BaseModel):
     generation: list[str] = Field(default_factory=list)
     storage: list[str] = Field(default_factory=list)
@@ -37,6 +54,11 @@ class TechnologyConfig(BaseModel):
 class HtmlConfig(BaseModel):
     full_html: bool = True
     include_plotlyjs: bool | str = True
+    # standalone = plotly.js in jeder Datei (include_plotlyjs); report = einmal als plotly.min.js im
+    # output_dir, Dateien verweisen darauf, Zeitachsen als Typed Arrays (siehe report.py)
+    mode: Literal["standalone", "report"] = "standalone"
+    # zusätzlich vorkomprimierte .html.gz schreiben (für Webserver mit gzip_static o.ä.)
+    gzip: bool = False
 
 
 class VisualizationConfig(BaseModel):
@@ -46,7 +68,24 @@ class VisualizationConfig(BaseModel):
     figure_height: int = 600
     html: HtmlConfig = Field(default_factory=HtmlConfig)
     boxplot_percentiles: list[int] = Field(default_factory=lambda: [5, 25, 50, 75, 95])
+    # summary = Boxen aus serverseitig berechneten Perzentilen; raw = alle Werte an px.box
+    boxplot_mode: Literal["summary", "raw"] = "summary"
+    boxplot_max_outliers: int = 1000
     heatmap_max_timesteps: int = 8760
+    # Zeitachsen-Downsampling (siehe downsample.py): max. Punkte pro Trace in Zeitreihen (0 = alle)
+    # und Verfahren für Zeitreihen und Heatmaps – m4/lttb erhalten Spitzen, mean glättet
+    timeseries_max_points: int = 2000
+    # Obergrenze pro Zeitreihen-Figur über alle Traces (0 = nur die Grenze pro Trace); viele Traces
+    # teilen sich das Budget, die Nutzlast bleibt unabhängig von Horizont und Trace-Zahl begrenzt
+    timeseries_figure_max_points: int = 50_000
+    downsample_method: Literal["m4", "lttb", "mean"] = "m4"
+    # Liniendiagramme ab so vielen Punkten pro Figur als WebGL (Scattergl) statt SVG zeichnen
+    # (None = immer SVG); Messung von Aufbau/Serialisierung: scripts/benchmark_render.py
+    webgl_min_points: int | None = 20_000
+    # Dashboard: Budget des LRU-Caches für fertige Figuren (MB, pro Prozess)
+    figure_cache_mb: int = 256
+    # Plots parallel in so vielen Prozessen rendern (1 = nacheinander); CLI: --jobs
+    jobs: int = 1
 
 
 class SchemaConfig(BaseModel):
@@ -57,13 +96,26 @@ class SchemaConfig(BaseModel):
     storage: dict[str, str] = Field(default_factory=dict)
 
 
+class DtypesConfig(BaseModel):
+    """Dtype-Überschreibungen pro Tabelle (Spaltenname aus Schema → pandas-Dtype)."""
+
+    adequacy: dict[str, str] = Field(default_factory=dict)
+    adequacy_hour_month: dict[str, str] = Field(default_factory=dict)
+    dispatch: dict[str, str] = Field(default_factory=dict)
+    net_position: dict[str, str] = Field(default_factory=dict)
+    prices: dict[str, str] = Field(default_factory=dict)
+    storage: dict[str, str] = Field(default_factory=dict)
+
+
 class Config(BaseModel):
     paths: PathsConfig = Field(default_factory=PathsConfig)
     dimensions: DimensionsConfig = Field(default_factory=DimensionsConfig)
+    loading: LoadingConfig = Field(default_factory=LoadingConfig)
     technology: TechnologyConfig = Field(default_factory=TechnologyConfig)
     study_zones: list[str] = Field(default_factory=list)
     visualization: VisualizationConfig = Field(default_factory=VisualizationConfig)
     schema: SchemaConfig = Field(default_factory=SchemaConfig)
+    dtypes: DtypesConfig = Field(default_factory=DtypesConfig)
 
     @classmethod
     def load(cls, path: str | Path = "config.yaml") -> "Config":
@@ -0,0 +1,178 @@
+"""
+Dichte Array-Darstellung der Zeitreihen-Tabellen.
+
+Dispatch, Net Position, Preise und Speicher sind reguläre Gitter:
+Zone × Zieljahr × [Technologie/Speichertyp] × Zeit × Klimajahr × Sample.
+`RunCube` hält eine Kennzahl als zusammenhängendes ndarray mit beschrifteten Achsen;
+Statistiken über die Läufe sind dann einzelne NumPy-Reduktionen statt groupby auf String-Schlüsseln.
+"""
+
+from __future__ import annotations
+
+import warnings
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from .aggregations import RUN_DIMS, TIME_SERIES_KEYS, TIME_SERIES_VALUES, factorize_axis
+
+
+class RunCube:
+    """
+    Eine Kennzahl als N-D-Array; `axes` ordnet jeder Array-Achse ihre Beschriftungen zu.
+
+    Fehlende Kombinationen (z.B. Technologie nicht in jeder Zone) sind NaN; alle Reduktionen
+    ignorieren NaN.
+    """
+
+    def __init__(self, data: np.ndarray, axes: dict[str, pd.Index], name: str):
+        if data.shape != tuple(len(labels) for labels in axes.values()):
+            raise ValueError(f"Array-Form {data.shape} passt nicht zu den Achsen {list(axes)}")
+        self.data = data
+        self.axes = axes
+        self.name = name
+
+    @classmethod
+    def from_long(
+        cls,
+        df: pd.DataFrame,
+        dims: Iterable[str],
+        value: str,
+        dtype: str | np.dtype | None = None,
+    ) -> RunCube:
+        """
+        Aus einer langen Tabelle (eine Zeile pro Gitterpunkt) bauen.
+
+        Zeilen mit fehlendem Schlüssel (NaN in einer Dimension) werden verworfen; doppelte
+        Gitterpunkte sind ein Fehler (ValueError), statt stillschweigend überschrieben zu werden.
+        Ohne `dtype` bleibt float32 erhalten, alles andere wird float64.
+        """
+        dims = [d for d in dims if d in df.columns]
+        dtype = dtype or np.result_type(df[value].dtype, np.float32)
+        codes, axes = [], {}
+        for dim in dims:
+            dim_codes, labels = factorize_axis(df[dim])
+            codes.append(dim_codes)
+            axes[dim] = labels
+        shape = tuple(len(labels) for labels in axes.values())
+        values = df[value].to_numpy(dtype=dtype, na_value=np.nan)
+        # Code -1 (fehlender Schlüssel) würde sonst in die letzte Zelle der Achse schreiben
+        valid = np.ones(len(df), dtype=bool)
+        for c in codes:
+            valid &= c >= 0
+        codes = [c[valid] for c in codes]
+        if codes:
+            flat = np.ravel_multi_index(codes, shape)
+        else:
+            flat = np.zeros(int(valid.sum()), dtype=np.int64)
+        if len(np.unique(flat)) < len(flat):
+            raise ValueError(
+                f"Doppelte Gitterpunkte für {value} über {dims}; Tabelle vorher aggregieren"
+            )
+        data = np.full(shape, np.nan, dtype=dtype)
+        data.flat[flat] = values[valid]
+        return cls(data, axes, value)
+
+    @property
+    def dims(self) -> list[str]:
+        return list(self.axes)
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+
+    def _axis_numbers(self, dims: Iterable[str]) -> tuple[int, ...]:
+        return tuple(self.dims.index(d) for d in dims if d in self.axes)
+
+    def _reduce(self, func, dims: Iterable[str], **kwargs) -> RunCube:
+        numbers = self._axis_numbers(dims)
+        if not numbers:
+            return self
+        with warnings.catch_warnings():
+            # "Mean of empty slice" für Gitterpunkte ohne einen einzigen Lauf → NaN
+            warnings.simplefilter("ignore", RuntimeWarning)
+            data = func(self.data, axis=numbers, **kwargs)
+        axes = {d: labels for i, (d, labels) in enumerate(self.axes.items()) if i not in numbers}
+        return RunCube(np.asarray(data), axes, self.name)
+
+    def mean(self, dims: Iterable[str] = RUN_DIMS) -> RunCube:
+        return self._reduce(np.nanmean, dims)
+
+    def min(self, dims: Iterable[str] = RUN_DIMS) -> RunCube:
+        return self._reduce(np.nanmin, dims)
+
+    def max(self, dims: Iterable[str] = RUN_DIMS) -> RunCube:
+        return self._reduce(np.nanmax, dims)
+
+    def quantile(self, q: float | Iterable[float], dims: Iterable[str] = RUN_DIMS) -> RunCube:
+        """Quantil(e) über `dims`; mehrere Quantile ergeben eine vorderste Achse `quantile`."""
+        scalar = np.isscalar(q)
+        qs = np.atleast_1d(np.asarray(q, dtype="float64"))
+        numbers = self._axis_numbers(dims)
+        if not numbers:
+            data = np.broadcast_to(self.data, (len(qs), *self.data.shape))
+            axes = dict(self.axes)
+        else:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                data = np.nanquantile(self.data, qs, axis=numbers).astype(self.data.dtype)
+            axes = {
+                d: labels for i, (d, labels) in enumerate(self.axes.items()) if i not in numbers
+            }
+        if scalar:
+            return RunCube(data[0], axes, self.name)
+        return RunCube(data, {"quantile": pd.Index(qs, name="quantile"), **axes}, self.name)
+
+    def sel(self, **labels) -> RunCube:
+        """Auswahl nach Beschriftung: Einzelwert entfernt die Achse, Liste behält sie."""
+        index: list = []
+        axes: dict[str, pd.Index] = {}
+        for dim, axis_labels in self.axes.items():
+            if dim not in labels:
+                index.append(slice(None))
+                axes[dim] = axis_labels
+                continue
+            wanted = labels[dim]
+            if isinstance(wanted, (list, tuple, np.ndarray, pd.Index)):
+                positions = axis_labels.get_indexer(list(wanted))
+                positions = positions[positions >= 0]
+                index.append(positions)
+                axes[dim] = axis_labels[positions]
+            else:
+                index.append(axis_labels.get_loc(wanted))
+        # Mehrere Listen-Indizes nicht gemeinsam (fancy indexing), sondern Achse für Achse anwenden
+        data = self.data
+        offset = 0
+        for idx in index:
+            if isinstance(idx, np.ndarray):
+                data = np.take(data, idx, axis=offset)
+                offset += 1
+            elif isinstance(idx, slice):
+                offset += 1
+            else:
+                data = np.take(data, idx, axis=offset)
+        return RunCube(data, axes, self.name)
+
+    def to_frame(self, dropna: bool = True) -> pd.DataFrame:
+        """Zurück in eine lange Tabelle (eine Spalte pro Achse plus Kennzahl)."""
+        if not self.axes:
+            return pd.DataFrame({self.name: [self.data.item()]})
+        index = pd.MultiIndex.from_product(list(self.axes.values()), names=self.dims)
+        out = pd.DataFrame({self.name: self.data.reshape(-1)}, index=index)
+        if dropna:
+            out = out[out[self.name].notna()]
+        return out.reset_index()
+
+
+def cube_dims(table: str) -> tuple[str, ...]:
+    """Achsen einer Zeitreihen-Tabelle: Schlüssel plus Laufdimensionen."""
+    return (*TIME_SERIES_KEYS[table], *RUN_DIMS)
+
+
+def table_cubes(
+    df: pd.DataFrame, table: str, values: Iterable[str] | None = None
+) -> dict[str, RunCube]:
+    """Ein RunCube pro Kennzahl einer Zeitreihen-Tabelle."""
+    values = [v for v in (values or TIME_SERIES_VALUES[table]) if v in df.columns]
+    return {v: RunCube.from_long(df, cube_dims(table), v) for v in values}
@@ -0,0 +1,162 @@
+"""
+Downsampling langer Zeitachsen für Plots, ohne Spitzen zu verlieren.
+
+Ein Jahr stündlich sind 8760 Punkte pro Trace; mehrere Zieljahre, Zonen oder Technologien
+vervielfachen das. Für die Darstellung genügen einige tausend Punkte pro Trace – solange die
+Knappheitsspitzen erhalten bleiben, die jedes `iloc[::n]` zufällig verwirft.
+
+- **m4**: pro Bucket erster, letzter, kleinster und größter Punkt (pixelgenaue Linien)
+- **lttb**: Largest-Triangle-Three-Buckets (ein Punkt pro Bucket, optisch formtreu)
+- **mean**: Mittel pro Bucket (glättet, Spitzen werden abgeschwächt)
+
+Die Buckets teilen die Punkte einer Reihe in gleich große Abschnitte (reguläre Zeitraster).
+"""
+
+from __future__ import annotations
+
+import warnings
+from typing import Iterable, Literal
+
+import numpy as np
+import pandas as pd
+
+Method = Literal["m4", "lttb", "mean"]
+
+
+def _bucket_starts(n: int, n_buckets: int) -> np.ndarray:
+    """Startindizes von `n_buckets` (nahezu) gleich großen Buckets über n Punkte."""
+    return np.unique(np.linspace(0, n, n_buckets, endpoint=False).astype(np.int64))
+
+
+def m4(y: np.ndarray, max_points: int) -> np.ndarray:
+    """Indizes (aufsteigend) von erstem/letztem/Min/Max pro Bucket; höchstens `max_points` Stück."""
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+    starts = _bucket_starts(n, max(1, max_points // 4))
+    sizes = np.diff(np.append(starts, n))
+    bucket = np.repeat(np.arange(len(starts)), sizes)
+    # NaN nie als Extremum wählen
+    low = np.where(np.isnan(y), np.inf, y)
+    high = np.where(np.isnan(y), -np.inf, y)
+    argmin = np.lexsort((low, bucket))[starts]
+    argmax = np.lexsort((-high, bucket))[starts]
+    return np.unique(np.concatenate([starts, starts + sizes - 1, argmin, argmax]))
+
+
+def lttb(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Indizes der Largest-Triangle-Three-Buckets-Auswahl (erster und letzter Punkt immer enthalten).
+
+    Pro Bucket ein Vektorausdruck; die Schleife läuft nur über die `max_points` Buckets.
+    """
+    n = len(x)
+    if n <= max_points or max_points < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    starts = 1 + _bucket_starts(n - 2, max_points - 2)
+    stops = np.append(starts[1:], n - 1)
+    # Schwerpunkt des jeweils nächsten Buckets (NaN-frei), vorab für alle Buckets
+    valid = ~np.isnan(y)
+    counts = np.add.reduceat(valid.astype(np.int64), starts)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_x = np.add.reduceat(np.where(valid, x, 0), starts) / counts
+        mean_y = np.add.reduceat(np.where(valid, y, 0), starts) / counts
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+    has_nan = not valid.all()
+    out = [0]
+    a = 0
+    for lo, hi, cx, cy in zip(starts.tolist(), stops.tolist(), next_x.tolist(), next_y.tolist()):
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - cx) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (cy - ay))
+        if has_nan:
+            # NaN-Punkte nur wählen, wenn der Bucket sonst leer ist
+            area = np.where(np.isnan(area), -np.inf, area)
+        a = lo + int(area.argmax())
+        out.append(a)
+    out.append(n - 1)
+    return np.asarray(out, dtype=np.int64)
+
+
+def block_mean(y: np.ndarray, max_points: int) -> tuple[np.ndarray, np.ndarray]:
+    """(Startindex, Mittel) pro Bucket; NaN werden ignoriert."""
+    n = len(y)
+    starts = _bucket_starts(n, min(n, max_points))
+    valid = ~np.isnan(y)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sums = np.add.reduceat(np.where(valid, y, 0), starts)
+        means = sums / np.add.reduceat(valid.astype(np.int64), starts)
+    return starts, means
+
+
+def _numeric_axis(s: pd.Series) -> np.ndarray:
+    if pd.api.types.is_datetime64_any_dtype(s.dtype):
+        return s.to_numpy().astype("datetime64[s]").astype("int64").astype("float64")
+    if pd.api.types.is_numeric_dtype(s.dtype):
+        return s.to_numpy(dtype="float64", na_value=np.nan)
+    return np.arange(len(s), dtype="float64")
+
+
+def downsample_frame(
+    df: pd.DataFrame,
+    x: str,
+    y: str,
+    max_points: int,
+    method: Method = "m4",
+    by: Iterable[str] = (),
+) -> pd.DataFrame:
+    """
+    Lange Tabelle pro Trace (Gruppe aus `by`) auf höchstens `max_points` Punkte entlang `x`
+    reduzieren.
+
+    m4/lttb behalten Originalzeilen; mean ersetzt `y` durch das Bucket-Mittel (übrige Spalten aus
+    der ersten Zeile des Buckets). `max_points <= 0` schaltet das Downsampling ab.
+    """
+    by = [c for c in by if c in df.columns]
+    if max_points <= 0 or len(df) <= max_points or y not in df.columns:
+        return df
+    groups = df.groupby(by, observed=True, sort=False) if by else [(None, df)]
+    parts = []
+    for _, group in groups:
+        if len(group) <= max_points:
+            parts.append(group)
+            continue
+        group = group.sort_values(x, kind="stable")
+        values = group[y].to_numpy(dtype="float64", na_value=np.nan)
+        if method == "mean":
+            starts, means = block_mean(values, max_points)
+            parts.append(group.iloc[starts].assign(**{y: means}))
+        elif method == "lttb":
+            parts.append(group.iloc[lttb(_numeric_axis(group[x]), values, max_points)])
+        else:
+            parts.append(group.iloc[m4(values, max_points)])
+    return pd.concat(parts, ignore_index=True)
+
+
+def downsample_columns(
+    z: np.ndarray, max_columns: int, method: Method = "m4"
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Heatmap-Matrix (Zeilen × Zeit) auf höchstens `max_columns` Zeitspalten reduzieren.
+
+    Eine Zelle zeigt nur einen Wert: mean → Bucket-Mittel; m4/lttb → der Wert mit der größten
+    Abweichung vom Bucket-Mittel (Spitzen und Senken bleiben sichtbar). Liefert (Matrix,
+    Startspalten).
+    """
+    n = z.shape[1]
+    if max_columns <= 0 or n <= max_columns:
+        return z, np.arange(n)
+    starts = _bucket_starts(n, max_columns)
+    valid = ~np.isnan(z)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sums = np.add.reduceat(np.where(valid, z, 0), starts, axis=1)
+        means = sums / np.add.reduceat(valid.astype(np.int64), starts, axis=1)
+    if method == "mean":
+        return means, starts
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        high = np.fmax.reduceat(z, starts, axis=1)
+        low = np.fmin.reduceat(z, starts, axis=1)
+    return np.where(np.abs(high - means) >= np.abs(low - means), high, low), starts
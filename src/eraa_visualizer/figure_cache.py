@@ -0,0 +1,164 @@
+"""
+LRU-Cache für fertige Plotly-Figuren (Dashboard).
+
+Ein Streamlit-Rerun baut sonst jede Figur neu, auch wenn sich nur eine Auswahlbox geändert hat.
+`FigureCache.figure()` schlüsselt nach Plot-Funktion, Datenquelle, Auswahl, Aufrufparametern und
+dem Konfigurationsabschnitt `visualization`. Die Datenquelle (TableIndex, Profil, DataFrame) geht
+über eine Kennung pro Objekt ein statt über einen Hash ihres Inhalts: Die Quellen des Datasets
+werden einmal gebaut und nur ersetzt, wenn sich die Tabelle ändert. Die Auswahl (`select=`) wird
+erst bei einem Fehlschlag ausgeschnitten – ein Treffer kostet nur den Dictionary-Zugriff.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from .config import Config
+from .index import select as select_rows
+
+_TRACE_ARRAYS = (
+    "x", "y", "z", "lat", "lon", "locations", "text", "customdata",
+    "q1", "median", "q3", "lowerfence", "upperfence",
+)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Aufrufparameter → hashbarer Schlüssel (Listen → Tupel, NumPy-Skalare → Python-Werte)."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, np.ndarray, pd.Index)):
+        items = [_freeze(v) for v in value]
+        return tuple(sorted(items, key=repr) if isinstance(value, set) else items)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def figure_nbytes(fig: go.Figure) -> int:
+    """Ungefährer Speicher einer Figur: Datenarrays der Traces (Layout fällt kaum ins Gewicht)."""
+    total = 0
+    for trace in fig.data:
+        for attr in _TRACE_ARRAYS:
+            value = trace[attr] if attr in trace else None
+            if value is None or isinstance(value, str):
+                continue
+            arr = np.asarray(value)
+            # Strings/Objekte: grob 16 Byte pro Eintrag zusätzlich zum Zeiger
+            total += arr.nbytes + (16 * arr.size if arr.dtype.kind in "OUS" else 0)
+    return total
+
+
+class FigureCache:
+    """
+    Thread-sicherer LRU-Cache mit Speicherbudget; Figuren gelten als unveränderlich.
+
+    Statistik: `hits`, `misses`, `evictions`, `nbytes`; `stats()` als Textzeile.
+    """
+
+    def __init__(self, max_bytes: int = 256_000_000):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._entries: OrderedDict[Hashable, tuple[go.Figure, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Kennung pro Datenquelle; verschwindet mit dem Objekt, wird nie wiederverwendet
+        self._tokens: weakref.WeakKeyDictionary[Any, int] = weakref.WeakKeyDictionary()
+        self._counter = itertools.count()
+        self._config_keys: dict[int, tuple[Config, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _token(self, source: Any) -> Hashable:
+        if source is None:
+            return None
+        try:
+            with self._lock:
+                if source not in self._tokens:
+                    self._tokens[source] = next(self._counter)
+                return self._tokens[source]
+        except TypeError:
+            # nicht weak-referenzierbar → nur Identität (gilt, solange der Aufrufer es hält)
+            return ("id", id(source))
+
+    def _config_key(self, config: Config) -> str:
+        cached = self._config_keys.get(id(config))
+        if cached is None or cached[0] is not config:
+            digest = hashlib.sha256(config.visualization.model_dump_json().encode()).hexdigest()
+            cached = (config, digest)
+            self._config_keys = {id(config): cached}
+        return cached[1]
+
+    def figure(
+        self,
+        func: Callable[..., go.Figure],
+        source: Any,
+        config: Config,
+        *args: Any,
+        select: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> go.Figure:
+        """
+        `func(source[.select(**select)], config, *args, **kwargs)` aus dem Cache oder neu gebaut.
+
+        `select`: Auswahl auf der Quelle (TableIndex: Slices, DataFrame: Maske), None-Werte = alle.
+        """
+        key = (
+            f"{func.__module__}.{func.__qualname__}",
+            self._token(source),
+            _freeze(select or {}),
+            _freeze(args),
+            _freeze(kwargs),
+            self._config_key(config),
+        )
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        data = select_rows(source, **select) if select and source is not None else source
+        fig = func(data, config, *args, **kwargs)
+        self._put(key, fig)
+        return fig
+
+    def _put(self, key: Hashable, fig: go.Figure) -> None:
+        size = figure_nbytes(fig)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            self._entries[key] = (fig, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes and self._entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self) -> str:
+        lookups = self.hits + self.misses
+        rate = 100.0 * self.hits / lookups if lookups else 0.0
+        return (
+            f"Figuren-Cache: {len(self)} Figur(en), "
+            f"{self.nbytes / 1e6:.1f} MB von {self.max_bytes / 1e6:.0f} MB, "
+            f"{self.hits} hit(s) ({rate:.0f}%), {self.misses} miss(es), {self.evictions} verdrängt"
+        )
@@ -0,0 +1,195 @@
+"""
+Sortierte, indizierte Sichten auf die Tabellen.
+
+Statt bei jeder Auswahl eine boolesche Maske über die ganze Tabelle zu bilden und das Ergebnis zu
+kopieren, wird eine Tabelle einmal nach ihren Auswahlschlüsseln sortiert. Für jedes Präfix der
+Schlüssel (Zieljahr, Zieljahr × Zone, …) liegen die Zeilenbereiche vor; eine Auswahl ist dann ein
+Dictionary-Zugriff plus `iloc`-Slice ohne Kopie.
+
+Innerhalb einer feinsten Gruppe ist die Tabelle zeitlich geordnet; ein Zeitfenster (`window=`)
+wird deshalb per binärer Suche auf der Zeitachse ausgeschnitten – z.B. der sichtbare Ausschnitt
+einer Dashboard-Zeitreihe, der dann mit demselben Punktbudget feiner aufgelöst wird.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+from .sketch import SketchSet
+
+TIME_COLUMN = "datetime"
+
+# Auswahlschlüssel pro Tabelle, gröbster zuerst: Zieljahr allein ist damit ebenfalls ein Slice
+INDEX_KEYS: dict[str, tuple[str, ...]] = {
+    "adequacy": ("target_year", "study_zone"),
+    "adequacy_hour_month": ("target_year", "study_zone"),
+    "dispatch": ("target_year", "study_zone", "technology"),
+    "net_position": ("target_year", "study_zone"),
+    "prices": ("target_year", "study_zone"),
+    "storage": ("target_year", "study_zone", "storage_type"),
+}
+
+
+class TableIndex:
+    """
+    Tabelle sortiert nach `keys` (innerhalb einer Gruppe nach `order`, z.B. datetime) mit
+    Gruppen-Offsets.
+
+    `select()` auf einem Präfix der Schlüssel liefert Slices der sortierten Tabelle; Bedingungen auf
+    weitere Spalten werden danach nur noch auf dem Ausschnitt ausgewertet. `window=(start, stop)`
+    schneidet zusätzlich auf der ersten Datumsspalte aus `order` aus (Grenzen inklusive,
+    None = offen).
+    """
+
+    def __init__(
+        self, df: pd.DataFrame, keys: Iterable[str], order: Iterable[str] = (TIME_COLUMN,)
+    ):
+        self.keys = [k for k in keys if k in df.columns]
+        by = [*self.keys, *(c for c in order if c in df.columns and c not in self.keys)]
+        self.frame = df.sort_values(by, kind="stable").reset_index(drop=True) if by else df
+        # _offsets[i]: (Werte der ersten i+1 Schlüssel) → (start, stop) in self.frame
+        self._offsets: list[dict[tuple, tuple[int, int]]] = []
+        is_time = pd.api.types.is_datetime64_any_dtype
+        self.time = next((c for c in by[len(self.keys):] if is_time(self.frame[c])), None)
+        self._times = self.frame[self.time].to_numpy() if self.time else None
+        n = len(self.frame)
+        # Bereiche der feinsten Gruppen (darin ist `time` sortiert)
+        self._leaf_starts = np.zeros(min(n, 1), dtype=np.int64)
+        self._leaf_stops = np.full(min(n, 1), n, dtype=np.int64)
+        if self.frame.empty:
+            self._offsets = [{} for _ in self.keys]
+            return
+        changed = np.zeros(n - 1, dtype=bool)
+        for depth, key in enumerate(self.keys):
+            codes = pd.factorize(self.frame[key], use_na_sentinel=False)[0]
+            changed |= codes[1:] != codes[:-1]
+            starts = np.concatenate([[0], np.flatnonzero(changed) + 1])
+            stops = np.append(starts[1:], n)
+            prefix = self.keys[: depth + 1]
+            labels = zip(*(self.frame[k].to_numpy()[starts].tolist() for k in prefix))
+            self._offsets.append(dict(zip(labels, zip(starts.tolist(), stops.tolist()))))
+            self._leaf_starts, self._leaf_stops = starts, stops
+
+    @property
+    def columns(self) -> pd.Index:
+        return self.frame.columns
+
+    @property
+    def empty(self) -> bool:
+        return self.frame.empty
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @property
+    def nbytes(self) -> int:
+        """Sortierte Kopie der Tabelle (die Offsets fallen dagegen nicht ins Gewicht)."""
+        return int(self.frame.memory_usage(index=True, deep=True).sum())
+
+    def labels(self, key: str) -> list:
+        """Vorkommende Werte eines Schlüssels (in Sortierreihenfolge)."""
+        depth = self.keys.index(key)
+        return list(dict.fromkeys(group[depth] for group in self._offsets[depth]))
+
+    @functools.cached_property
+    def time_range(self) -> tuple[pd.Timestamp, pd.Timestamp] | None:
+        """Erster und letzter Zeitpunkt der Tabelle (None ohne Datumsspalte oder ohne Zeilen)."""
+        if self._times is None or not len(self._times):
+            return None
+        return pd.Timestamp(self._times.min()), pd.Timestamp(self._times.max())
+
+    def select(self, window: tuple[Any, Any] | None = None, **labels: Any) -> pd.DataFrame:
+        """
+        Zeilen der Auswahl: Einzelwert oder Liste pro Spalte, None = alle; `window` = Zeitfenster.
+
+        Ein einzelner Gruppenbereich ist eine Sicht (keine Kopie); mehrere Bereiche werden in
+        Schlüsselreihenfolge zusammengesetzt.
+        """
+        labels = {col: wanted for col, wanted in labels.items() if wanted is not None}
+        depth = 0
+        while depth < len(self.keys) and self.keys[depth] in labels:
+            depth += 1
+        ranges = [(0, len(self.frame))]
+        if depth:
+            choices = [_as_list(labels.pop(k)) for k in self.keys[:depth]]
+            found = map(self._offsets[depth - 1].get, itertools.product(*choices))
+            ranges = sorted(r for r in found if r)
+        if window is not None and self._times is not None:
+            ranges = self._clip(ranges, window)
+        if not ranges:
+            out = self.frame.iloc[:0]
+        elif len(ranges) == 1:
+            out = self.frame.iloc[ranges[0][0]:ranges[0][1]]
+        else:
+            rows = np.concatenate([np.arange(start, stop) for start, stop in ranges])
+            out = self.frame.iloc[rows]
+        return select(out, **labels)
+
+    def _clip(
+        self, ranges: list[tuple[int, int]], window: tuple[Any, Any]
+    ) -> list[tuple[int, int]]:
+        """Bereiche auf das Zeitfenster kürzen: pro feinster Gruppe zwei binäre Suchen."""
+        dtype = self._times.dtype
+        start, stop = (
+            None if w is None else np.datetime64(pd.Timestamp(w)).astype(dtype) for w in window
+        )
+        out = []
+        for a, b in ranges:
+            i, j = np.searchsorted(self._leaf_starts, [a, b])
+            for lo, hi in zip(self._leaf_starts[i:j].tolist(), self._leaf_stops[i:j].tolist()):
+                times = self._times[lo:hi]
+                first = lo + (0 if start is None else int(np.searchsorted(times, start, "left")))
+                last = lo + (
+                    len(times) if stop is None else int(np.searchsorted(times, stop, "right"))
+                )
+                if first < last:
+                    out.append((first, last))
+        return out
+
+
+def select(
+    data: pd.DataFrame | TableIndex | SketchSet,
+    window: tuple[Any, Any] | None = None,
+    **labels: Any,
+) -> pd.DataFrame | SketchSet:
+    """
+    Auswahl auf einem TableIndex (Slices), SketchSet (Gruppen) oder DataFrame (Maske).
+
+    Spalten, die fehlen, werden ignoriert. `window=(start, stop)`: Zeitfenster auf `datetime`
+    (Grenzen inklusive, None = offen; für Sketches ohne Bedeutung).
+    """
+    if isinstance(data, TableIndex):
+        return data.select(window, **labels)
+    if isinstance(data, SketchSet):
+        return data.select(**labels)
+    mask = None
+    has_time = TIME_COLUMN in data.columns and pd.api.types.is_datetime64_any_dtype(
+        data[TIME_COLUMN]
+    )
+    if window is not None and has_time:
+        start, stop = window
+        if start is not None:
+            mask = data[TIME_COLUMN] >= pd.Timestamp(start)
+        if stop is not None:
+            cond = data[TIME_COLUMN] <= pd.Timestamp(stop)
+            mask = cond if mask is None else mask & cond
+    for col, wanted in labels.items():
+        if wanted is None or col not in data.columns:
+            continue
+        if isinstance(wanted, (list, tuple, set)):
+            cond = data[col].isin(wanted)
+        else:
+            cond = data[col] == wanted
+        mask = cond if mask is None else mask & cond
+    return data if mask is None else data[mask]
+
+
+def _as_list(wanted: Any) -> list:
+    if isinstance(wanted, (list, tuple, set, np.ndarray, pd.Index)):
+        return list(wanted)
+    return [wanted]
@@ -2,93 +2,1020 @@
 
 from __future__ import annotations
 
+import csv
+import functools
+import logging
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Iterator, NamedTuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as pa_ds
+from pyarrow import csv as pa_csv
 
+from .aggregations import TIME_SERIES_KEYS, TIME_SERIES_VALUES, RunMeanAccumulator
+from .cache import TableCache
+from .catalog import CATALOG_DIMS, INT_DIMS, plain_values
 from .config import Config
 from .models import (
+    DEFAULT_DTYPES,
     ERAADataset,
+    LazyERAADataset,
+    TableInfo,
     adequacy_from_dataframe,
     dispatch_from_dataframe,
     net_position_from_dataframe,
+    normalize_time,
     prices_from_dataframe,
     storage_from_dataframe,
 )
+from .sketch import SKETCH_KEYS, SketchSet
 
+logger = logging.getLogger(__name__)
 
-def _read_table(path: Path) -> pd.DataFrame | None:
+TABLES = ("adequacy", "adequacy_hour_month", "dispatch", "net_position", "prices", "storage")
+
+# Mögliche Quellen pro Tabelle in data_dir (erste vorhandene gewinnt;
+# ohne Endung = partitioniertes Verzeichnis)
+SOURCE_NAMES: dict[str, tuple[str, ...]] = {
+    "adequacy": ("adequacy.csv", "adequacy.parquet", "lole_ens.csv", "adequacy"),
+    "adequacy_hour_month": (
+        "adequacy_hour_month.csv", "adequacy_hour_month.parquet", "adequacy_hour_month"
+    ),
+    "dispatch": ("dispatch.csv", "dispatch.parquet", "generation.csv", "dispatch"),
+    "net_position": (
+        "net_position.csv", "net_position.parquet", "netpositions.csv", "net_position"
+    ),
+    "prices": ("prices.csv", "prices.parquet", "prices"),
+    "storage": ("storage.csv", "storage.parquet", "storage_levels.csv", "storage"),
+}
+
+
+def table_dtypes(config: Config, table: str) -> dict[str, str]:
+    """Effektive Dtypes einer Tabelle: Standard aus models + Überschreibungen aus config.dtypes."""
+    return {**DEFAULT_DTYPES.get(table, {}), **getattr(config.dtypes, table, {})}
+
+
+def _source_dtypes(dtypes: dict[str, str] | None, schema: dict[str, str] | None) -> dict[str, str]:
+    """Übersetzt Dtypes von kanonischen Spaltennamen auf die Spaltennamen in der Datei."""
+    schema = schema or {}
+    return {schema.get(col, col): dtype for col, dtype in (dtypes or {}).items()}
+
+
+# pandas-Dtype → Arrow-Typ für den CSV-Reader (Kategorien als Dictionary → pd.Categorical)
+_ARROW_TYPES = {
+    "category": pa.dictionary(pa.int32(), pa.string()),
+    "str": pa.string(),
+    "string": pa.string(),
+    "bool": pa.bool_(),
+    "int8": pa.int8(),
+    "int16": pa.int16(),
+    "int32": pa.int32(),
+    "int64": pa.int64(),
+    "float32": pa.float32(),
+    "float64": pa.float64(),
+}
+
+
+def _apply_dtypes(df: pd.DataFrame, dtypes: dict[str, str]) -> pd.DataFrame:
+    """
+    Castet vorhandene Spalten; Spalten, die sich nicht casten lassen (z.B. NaN in int16),
+    bleiben unverändert.
+    """
+    casts = {}
+    for col, dtype in dtypes.items():
+        if col not in df.columns or str(df[col].dtype) == dtype:
+            continue
+        current = df[col].dtype
+        if dtype in ("str", "string") and (
+            pd.api.types.is_string_dtype(current) or pd.api.types.is_datetime64_any_dtype(current)
+        ):
+            # Bereits normalisierte Zeitspalten nicht zurück in Strings wandeln
+            continue
+        try:
+            casts[col] = df[col].astype(dtype)
+        except (TypeError, ValueError):
+            continue
+    return df.assign(**casts) if casts else df
+
+
+# Filter: Spaltenname → zulässige Werte,
+# z.B. {"target_year": [2030], "study_zone": ["DE00", "FR00"]}
+Filters = dict[str, list]
+
+
+def _source_filters(filters: Filters | None, schema: dict[str, str] | None) -> Filters:
+    schema = schema or {}
+    return {schema.get(col, col): list(values) for col, values in (filters or {}).items()}
+
+
+def filters_to_arrow(filters: Filters | None) -> list[tuple[str, str, list]] | None:
+    """Filter im DNF-Format von pyarrow/pandas (`pd.read_parquet(filters=...)`)."""
+    return [(col, "in", list(values)) for col, values in filters.items()] if filters else None
+
+
+def filter_frame(df: pd.DataFrame, filters: Filters | None) -> pd.DataFrame:
+    """Filter auf einen bereits geladenen DataFrame anwenden (CSV-Eingaben)."""
+    if not filters:
+        return df
+    mask = pd.Series(True, index=df.index)
+    for col, values in filters.items():
+        if col in df.columns:
+            mask &= df[col].isin(values)
+    return df if mask.all() else df[mask].reset_index(drop=True)
+
+
+def _csv_header(path: Path) -> list[str]:
+    with open(path, encoding="utf-8", newline="") as f:
+        return next(csv.reader(f), [])
+
+
+def _read_partitioned(
+    root: Path, filters: Filters | None, columns: list[str] | None = None
+) -> pd.DataFrame:
+    """
+    Hive-partitioniertes Parquet-Verzeichnis lesen (z.B. target_year=2030/study_zone=DE00/…).
+
+    Filter werden an pyarrow übergeben: nicht passende Partitionen werden gar nicht geöffnet,
+    in den übrigen Dateien werden Row Groups über die Parquet-Statistiken übersprungen.
+    """
+    dataset = pa_ds.dataset(root, format="parquet", partitioning="hive")
+    if columns is not None:
+        columns = [c for c in dataset.schema.names if c in columns]
+    expression = _arrow_expression(dataset.schema.names, filters)
+    return dataset.to_table(columns=columns, filter=expression).to_pandas()
+
+
+def _arrow_expression(names: list[str], filters: Filters | None) -> pc.Expression | None:
+    expr = None
+    for col, values in (filters or {}).items():
+        if col not in names:
+            continue
+        cond = pc.field(col).isin(values)
+        expr = cond if expr is None else expr & cond
+    return expr
+
+
+def _read_csv_typed(
+    path: Path, dtypes: dict[str, str], columns: list[str] | None = None
+) -> pd.DataFrame:
+    """CSV mit dem pyarrow-Reader lesen; Spaltentypen werden direkt beim Parsen gesetzt."""
+    column_types = {col: _ARROW_TYPES[d] for col, d in dtypes.items() if d in _ARROW_TYPES}
+    try:
+        table = pa_csv.read_csv(
+            path,
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types, include_columns=columns
+            ),
+        )
+    except pa.ArrowInvalid:
+        # z.B. Dezimalwerte in einer int16-Spalte: untypisiert lesen, dann spaltenweise casten
+        return _apply_dtypes(pd.read_csv(path, usecols=columns), dtypes)
+    return _apply_dtypes(table.to_pandas(), dtypes)
+
+
+def _read_table(
+    path: Path,
+    dtypes: dict[str, str] | None = None,
+    filters: Filters | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame | None:
+    """
+    Eine Quelle lesen. `columns` projiziert auf die angegebenen Spalten (fehlende werden
+    ignoriert); Filterspalten werden dafür bei Bedarf mitgelesen und danach verworfen.
+    """
     if not path.exists():
         return None
+    if path.is_dir():
+        df = _read_partitioned(path, filters, columns)
+        return _apply_dtypes(df, dtypes) if dtypes else df
     suf = path.suffix.lower()
     if suf == ".csv":
-        return pd.read_csv(path)
+        usecols = None
+        if columns is not None:
+            wanted = set(columns) | set(filters or {})
+            usecols = [c for c in _csv_header(path) if c in wanted]
+        if dtypes:
+            df = _read_csv_typed(path, dtypes, usecols)
+        else:
+            df = pd.read_csv(path, usecols=usecols)
+        return _project(filter_frame(df, filters), columns)
     if suf in (".parquet", ".pq"):
-        return pd.read_parquet(path)
+        present = pa_ds.dataset(path, format="parquet").schema.names
+        pq_filters = {c: v for c, v in (filters or {}).items() if c in present}
+        cols = [c for c in present if c in columns] if columns is not None else None
+        df = pd.read_parquet(path, columns=cols, filters=filters_to_arrow(pq_filters))
+        return _apply_dtypes(df, dtypes) if dtypes else df
     return None
 
 
-def load_adequacy(data_dir: Path, schema: dict[str, str]) -> pd.DataFrame | None:
-    for name in ("adequacy.csv", "adequacy.parquet", "lole_ens.csv"):
-        df = _read_table(data_dir / name)
-        if df is not None:
-            return adequacy_from_dataframe(df, schema)
-    return None
+# --- Shards: eine Datei pro Lauf, z.B. dispatch_CY12_S3.parquet ---
 
+# Threads für das parallele Lesen der Shards einer Tabelle (pyarrow gibt dabei den GIL frei)
+SHARD_READ_WORKERS = 8
 
-def load_dispatch(data_dir: Path, schema: dict[str, str]) -> pd.DataFrame | None:
-    for name in ("dispatch.csv", "dispatch.parquet", "generation.csv"):
-        df = _read_table(data_dir / name)
-        if df is not None:
-            return dispatch_from_dataframe(df, schema)
-    return None
+_SHARD_SUFFIXES = (".csv", ".parquet", ".pq")
 
 
-def load_net_position(data_dir: Path, schema: dict[str, str]) -> pd.DataFrame | None:
-    for name in ("net_position.csv", "net_position.parquet", "netpositions.csv"):
-        df = _read_table(data_dir / name)
-        if df is not None:
-            return net_position_from_dataframe(df, schema)
-    return None
+class Shard(NamedTuple):
+    path: Path
+    climate_year: int | None
+    sample_id: int | None
 
 
-def load_prices(data_dir: Path, schema: dict[str, str]) -> pd.DataFrame | None:
-    for name in ("prices.csv", "prices.parquet"):
-        df = _read_table(data_dir / name)
-        if df is not None:
-            return prices_from_dataframe(df, schema)
-    return None
+def _shard_pattern(stem: str) -> re.Pattern[str]:
+    return re.compile(
+        rf"^{re.escape(stem)}(?:_CY(?P<cy>\d+))?(?:_S(?P<sid>\d+))?\.(?:csv|parquet|pq)$",
+        re.IGNORECASE,
+    )
 
 
-def load_storage(data_dir: Path, schema: dict[str, str]) -> pd.DataFrame | None:
-    for name in ("storage.csv", "storage.parquet", "storage_levels.csv"):
-        df = _read_table(data_dir / name)
-        if df is not None:
-            return storage_from_dataframe(df, schema)
-    return None
+def find_shards(data_dir: Path, names: tuple[str, ...]) -> list[Shard]:
+    """
+    Shard-Dateien einer Tabelle: `<stem>_CY<n>_S<m>.<csv|parquet>` (CY oder S allein genügt).
 
+    Gesucht wird in `data_dir` und im gleichnamigen Unterverzeichnis `data_dir/<stem>/`;
+    `stem` sind die Dateinamen aus `SOURCE_NAMES` ohne Endung (z.B. dispatch, generation).
+    Ergebnis nach (Klimajahr, Sample) sortiert.
+    """
+    stems = dict.fromkeys(Path(n).stem for n in names)
+    shards: dict[Path, Shard] = {}
+    for stem in stems:
+        pattern = _shard_pattern(stem)
+        for folder in (data_dir, data_dir / stem):
+            if not folder.is_dir():
+                continue
+            for path in folder.glob(f"{stem}_*"):
+                m = pattern.match(path.name)
+                if m is None or (m["cy"] is None and m["sid"] is None):
+                    continue
+                shards[path] = Shard(
+                    path,
+                    int(m["cy"]) if m["cy"] is not None else None,
+                    int(m["sid"]) if m["sid"] is not None else None,
+                )
+    return sorted(
+        shards.values(), key=lambda sh: (sh.climate_year or 0, sh.sample_id or 0, sh.path.name)
+    )
 
-def load_adequacy_hour_month(data_dir: Path) -> pd.DataFrame | None:
-    """Lädt Adequacy nach Stunde/Monat (Spalten: study_zone, target_year, month, hour, ggf. climate_year, sample_id, lole_h, ens_mwh)."""
-    for name in ("adequacy_hour_month.csv", "adequacy_hour_month.parquet"):
-        df = _read_table(data_dir / name)
+
+def _shard_selected(shard: Shard, filters: Filters | None) -> bool:
+    """Shards, deren Klimajahr/Sample laut Dateiname nicht zum Filter passt, nicht öffnen."""
+    for col, value in (("climate_year", shard.climate_year), ("sample_id", shard.sample_id)):
+        if value is not None and filters and col in filters and value not in filters[col]:
+            return False
+    return True
+
+
+def _read_shard_arrow(
+    shard: Shard,
+    dtypes: dict[str, str],
+    filters: Filters | None,
+    columns: list[str] | None,
+    run_cols: dict[str, str],
+) -> pa.Table:
+    """
+    Einen Shard als Arrow-Tabelle lesen (Spaltennamen der Datei).
+
+    Fehlen die Spalten für Klimajahr/Sample (`run_cols`: kanonisch → Dateiname), werden sie
+    als Konstante aus dem Dateinamen ergänzt.
+    """
+    path = shard.path
+    if path.suffix.lower() == ".csv":
+        names = _csv_header(path)
+        wanted = set(columns) | set(filters or {}) if columns is not None else None
+        include = [c for c in names if c in wanted] if wanted is not None else None
+        column_types = {
+            col: _ARROW_TYPES[d] for col, d in dtypes.items() if d in _ARROW_TYPES and col in names
+        }
+        try:
+            options = pa_csv.ConvertOptions(column_types=column_types, include_columns=include)
+            table = pa_csv.read_csv(path, convert_options=options)
+        except pa.ArrowInvalid:
+            options = pa_csv.ConvertOptions(include_columns=include)
+            table = pa_csv.read_csv(path, convert_options=options)
+        expr = _arrow_expression(table.schema.names, filters)
+        if expr is not None:
+            table = table.filter(expr)
+    else:
+        dataset = pa_ds.dataset(path, format="parquet")
+        names = dataset.schema.names
+        wanted = set(columns) | set(filters or {}) if columns is not None else None
+        cols = [c for c in names if c in wanted] if wanted is not None else None
+        table = dataset.to_table(columns=cols, filter=_arrow_expression(names, filters))
+    for canonical, value in (("climate_year", shard.climate_year), ("sample_id", shard.sample_id)):
+        col = run_cols[canonical]
+        if value is None or col in table.schema.names:
+            continue
+        if columns is not None and col not in columns:
+            continue
+        arrow_type = _ARROW_TYPES.get(dtypes.get(col, ""), pa.int64())
+        table = table.append_column(col, pa.array(np.full(table.num_rows, value), type=arrow_type))
+    if columns is not None:
+        table = table.select([c for c in table.schema.names if c in columns])
+    return table
+
+
+def _read_shards(
+    shards: list[Shard],
+    schema: dict[str, str] | None,
+    dtypes: dict[str, str] | None,
+    filters: Filters | None,
+    columns: list[str] | None,
+) -> pd.DataFrame:
+    """
+    Shards parallel lesen und zu einem DataFrame zusammenführen (Spaltennamen der Datei).
+
+    Die Shards werden als Arrow-Tabellen aneinandergehängt (ohne Kopie) und erst am Ende
+    einmal nach pandas konvertiert; Kategorien verschiedener Shards werden dabei vereinheitlicht.
+    """
+    schema = schema or {}
+    run_cols = {c: schema.get(c, c) for c in ("climate_year", "sample_id")}
+    src_dtypes = _source_dtypes(dtypes, schema)
+    src_filters = _source_filters(filters, schema)
+    src_cols = [schema.get(c, c) for c in columns] if columns is not None else None
+    selected = [sh for sh in shards if _shard_selected(sh, filters)]
+    if not selected:
+        return pd.DataFrame(columns=src_cols or [])
+    with ThreadPoolExecutor(max_workers=min(SHARD_READ_WORKERS, len(selected))) as pool:
+        tables = list(
+            pool.map(
+                lambda sh: _read_shard_arrow(sh, src_dtypes, src_filters, src_cols, run_cols),
+                selected,
+            )
+        )
+    combined = pa.concat_tables(tables, promote_options="permissive")
+    return _apply_dtypes(combined.to_pandas(), src_dtypes)
+
+
+def _iter_shards(
+    shards: list[Shard],
+    schema: dict[str, str] | None,
+    dtypes: dict[str, str] | None,
+    filters: Filters | None,
+    columns: list[str] | None,
+) -> Iterator[pd.DataFrame]:
+    """Shards nacheinander lesen (ein Shard = ein Block beim Streaming)."""
+    for shard in shards:
+        if _shard_selected(shard, filters):
+            yield _read_shards([shard], schema, dtypes, filters, columns)
+
+
+def _csv_block_size(path: Path, rows: int) -> int:
+    """Blockgröße in Bytes für ca. `rows` CSV-Zeilen (geschätzt aus dem Dateianfang)."""
+    with open(path, "rb") as f:
+        head = f.read(1 << 16)
+    bytes_per_row = len(head) / max(1, head.count(b"\n"))
+    return max(1 << 20, int(rows * bytes_per_row))
+
+
+def _iter_chunks(
+    path: Path,
+    dtypes: dict[str, str],
+    filters: Filters | None,
+    columns: list[str] | None,
+    chunk_rows: int,
+) -> Iterator[pd.DataFrame]:
+    """Quelle blockweise lesen (Spaltennamen der Datei; typisiert, gefiltert, projiziert)."""
+    if path.is_dir() or path.suffix.lower() in (".parquet", ".pq"):
+        partitioning = "hive" if path.is_dir() else None
+        dataset = pa_ds.dataset(path, format="parquet", partitioning=partitioning)
+        names = dataset.schema.names
+        cols = [c for c in names if c in columns] if columns is not None else None
+        expr = _arrow_expression(names, filters)
+        for batch in dataset.to_batches(columns=cols, filter=expr, batch_size=chunk_rows):
+            yield _apply_dtypes(batch.to_pandas(), dtypes)
+        return
+    usecols = None
+    if columns is not None:
+        wanted = set(columns) | set(filters or {})
+        usecols = [c for c in _csv_header(path) if c in wanted]
+    column_types = {col: _ARROW_TYPES[d] for col, d in dtypes.items() if d in _ARROW_TYPES}
+    reader = pa_csv.open_csv(
+        path,
+        read_options=pa_csv.ReadOptions(block_size=_csv_block_size(path, chunk_rows)),
+        convert_options=pa_csv.ConvertOptions(column_types=column_types, include_columns=usecols),
+    )
+    for batch in reader:
+        chunk = _apply_dtypes(batch.to_pandas(), dtypes)
+        yield _project(filter_frame(chunk, filters), columns)
+
+
+def _stream_run_mean(
+    path: Path | list[Shard],
+    table: str,
+    schema: dict[str, str] | None,
+    dtypes: dict[str, str] | None,
+    from_dataframe: Callable[[pd.DataFrame, dict[str, str] | None], pd.DataFrame] | None,
+    filters: Filters | None,
+    columns: list[str] | None,
+    chunk_rows: int,
+) -> pd.DataFrame:
+    """
+    Sample-Mittel einer Zeitreihen-Tabelle blockweise berechnen (Rohdaten nie vollständig
+    im RAM).
+    """
+    keys = TIME_SERIES_KEYS[table]
+    values = [v for v in TIME_SERIES_VALUES[table] if columns is None or v in columns]
+    # Kennzahlen fest als float lesen: der CSV-Reader inferiert Typen sonst nur aus dem ersten Block
+    dtypes = {**{v: "float64" for v in values}, **(dtypes or {})}
+    src_cols = [(schema or {}).get(c, c) for c in (*keys, *values)]
+    acc = RunMeanAccumulator(keys, values, compact_rows=chunk_rows)
+    if isinstance(path, list):
+        chunks = _iter_shards(path, schema, dtypes, filters, [*keys, *values])
+    else:
+        chunks = _iter_chunks(
+            path,
+            _source_dtypes(dtypes, schema),
+            _source_filters(filters, schema),
+            src_cols,
+            chunk_rows,
+        )
+    for chunk in chunks:
+        acc.update(from_dataframe(chunk, schema) if from_dataframe is not None else chunk)
+    return normalize_time(_apply_dtypes(acc.result(), dtypes))
+
+
+def _project(df: pd.DataFrame, columns: list[str] | None) -> pd.DataFrame:
+    if columns is None:
+        return df
+    keep = [c for c in df.columns if c in columns]
+    return df if len(keep) == len(df.columns) else df[keep]
+
+
+def _load_table(
+    data_dir: Path,
+    names: tuple[str, ...],
+    schema: dict[str, str] | None,
+    dtypes: dict[str, str] | None,
+    from_dataframe: Callable[[pd.DataFrame, dict[str, str] | None], pd.DataFrame] | None,
+    cache: TableCache | None = None,
+    filters: Filters | None = None,
+    columns: list[str] | None = None,
+    chunk_rows: int | None = None,
+) -> pd.DataFrame | None:
+    """
+    Erste vorhandene Quelle aus `names` (Datei, Verzeichnis oder Shards) lesen.
+
+    `columns` beschränkt auf kanonische Spalten; mit `chunk_rows` nur das Sample-Mittel.
+    """
+    shards = find_shards(data_dir, names)
+    for name in names:
+        path = data_dir / name
+        # Ein Verzeichnis mit Shard-Dateien ist kein partitioniertes Dataset
+        if not path.exists() or (path.is_dir() and shards):
+            continue
+
+        if chunk_rows:
+            table = next(t for t, n in SOURCE_NAMES.items() if n == names)
+            entry = None
+            if cache is not None and path.is_file():
+                entry = cache.lookup(path, schema, dtypes)
+            if entry is not None:
+                # Cache-Eintrag hat bereits kanonische Spaltennamen
+                return _stream_run_mean(
+                    entry, table, None, dtypes, None, filters, columns, chunk_rows
+                )
+            return _stream_run_mean(
+                path, table, schema, dtypes, from_dataframe, filters, columns, chunk_rows
+            )
+
+        def build(
+            path: Path = path,
+            filters: Filters | None = filters,
+            columns: list[str] | None = columns,
+        ) -> pd.DataFrame | None:
+            src_cols = [(schema or {}).get(c, c) for c in columns] if columns is not None else None
+            df = _read_table(
+                path, _source_dtypes(dtypes, schema), _source_filters(filters, schema), src_cols
+            )
+            if df is not None and from_dataframe is not None:
+                df = from_dataframe(df, schema)
+            # Zeit einmalig hier parsen (landet so auch im Cache), nicht in jedem Plot
+            return normalize_time(df)
+
+        if cache is not None and path.is_file() and path.suffix.lower() == ".csv":
+            # Cache enthält immer die ganze Tabelle; Filter und Projektion greifen beim Lesen
+            # des Eintrags
+            df = cache.get_or_build(
+                path,
+                schema,
+                dtypes,
+                lambda: build(filters=None, columns=None),
+                filters_to_arrow(filters),
+                columns,
+            )
+            return normalize_time(_project(filter_frame(df, filters), columns))
+        df = build()
         if df is not None:
             return df
+
+    if shards:
+        if chunk_rows:
+            table = next(t for t, n in SOURCE_NAMES.items() if n == names)
+            return _stream_run_mean(
+                shards, table, schema, dtypes, from_dataframe, filters, columns, chunk_rows
+            )
+        df = _read_shards(shards, schema, dtypes, filters, columns)
+        if from_dataframe is not None:
+            df = from_dataframe(df, schema)
+        return normalize_time(df)
     return None
 
 
-def load_dataset(config: Config | None = None) -> ERAADataset:
-    """Lädt alle verfügbaren ERAA-Daten aus config.paths.data_dir."""
+def _sketch_chunks(
+    chunks: Iterator[pd.DataFrame],
+    value: str,
+    schema: dict[str, str] | None,
+    from_dataframe: Callable[[pd.DataFrame, dict[str, str] | None], pd.DataFrame] | None,
+    k: int,
+) -> SketchSet:
+    sketch = SketchSet(value, k=k)
+    for chunk in chunks:
+        sketch.update(from_dataframe(chunk, schema) if from_dataframe is not None else chunk)
+    return sketch
+
+
+def _sketch_table(
+    data_dir: Path,
+    names: tuple[str, ...],
+    value: str,
+    schema: dict[str, str] | None,
+    dtypes: dict[str, str] | None,
+    from_dataframe: Callable[[pd.DataFrame, dict[str, str] | None], pd.DataFrame] | None,
+    cache: TableCache | None = None,
+    filters: Filters | None = None,
+    chunk_rows: int = 1_000_000,
+    k: int = 200,
+) -> SketchSet | None:
+    """Quantil-Sketch pro (Zone, Zieljahr) über alle Läufe, blockweise aus der ersten Quelle."""
+    columns = [*SKETCH_KEYS, value]
+    # Dieselben Dtypes wie beim Laden der Tabelle: Cache-Schlüssel und gelesene Daten stimmen
+    # überein; SketchSet rechnet ohnehin in float64
+    dtypes = dtypes or {}
+    src_cols = [(schema or {}).get(c, c) for c in columns]
+    shards = find_shards(data_dir, names)
+    for name in names:
+        path = data_dir / name
+        if not path.exists() or (path.is_dir() and shards):
+            continue
+        entry = cache.lookup(path, schema, dtypes) if cache is not None and path.is_file() else None
+        if entry is not None:
+            chunks = _iter_chunks(entry, dtypes, filters, columns, chunk_rows)
+            return _sketch_chunks(chunks, value, None, None, k)
+        chunks = _iter_chunks(
+            path,
+            _source_dtypes(dtypes, schema),
+            _source_filters(filters, schema),
+            src_cols,
+            chunk_rows,
+        )
+        return _sketch_chunks(chunks, value, schema, from_dataframe, k)
+
+    selected = [shard for shard in shards if _shard_selected(shard, filters)]
+    if not selected:
+        return None
+
+    def sketch_shard(shard: Shard) -> SketchSet:
+        chunks = _iter_shards([shard], schema, dtypes, filters, columns)
+        return _sketch_chunks(chunks, value, schema, from_dataframe, k)
+
+    with ThreadPoolExecutor(max_workers=min(SHARD_READ_WORKERS, len(selected))) as pool:
+        parts = list(pool.map(sketch_shard, selected))
+    return functools.reduce(SketchSet.merge, parts)
+
+
+def sketch_prices(
+    data_dir: Path,
+    schema: dict[str, str],
+    dtypes: dict[str, str] | None = None,
+    cache: TableCache | None = None,
+    filters: Filters | None = None,
+    chunk_rows: int = 1_000_000,
+    k: int = 200,
+) -> SketchSet | None:
+    """Preisverteilung pro (Zone, Zieljahr) als Quantil-Sketch, ohne alle Rohdaten zu laden."""
+    names = SOURCE_NAMES["prices"]
+    return _sketch_table(
+        data_dir, names, "price_eur_mwh", schema, dtypes, prices_from_dataframe,
+        cache, filters, chunk_rows, k,
+    )
+
+
+def load_adequacy(
+    data_dir: Path,
+    schema: dict[str, str],
+    dtypes: dict[str, str] | None = None,
+    cache: TableCache | None = None,
+    filters: Filters | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame | None:
+    names = SOURCE_NAMES["adequacy"]
+    return _load_table(
+        data_dir, names, schema, dtypes, adequacy_from_dataframe, cache, filters, columns
+    )
+
+
+def load_dispatch(
+    data_dir: Path,
+    schema: dict[str, str],
+    dtypes: dict[str, str] | None = None,
+    cache: TableCache | None = None,
+    filters: Filters | None = None,
+    columns: list[str] | None = None,
+    chunk_rows: int | None = None,
+) -> pd.DataFrame | None:
+    names = SOURCE_NAMES["dispatch"]
+    return _load_table(
+        data_dir, names, schema, dtypes, dispatch_from_dataframe,
+        cache, filters, columns, chunk_rows,
+    )
+
+
+def load_net_position(
+    data_dir: Path,
+    schema: dict[str, str],
+    dtypes: dict[str, str] | None = None,
+    cache: TableCache | None = None,
+    filters: Filters | None = None,
+    columns: list[str] | None = None,
+    chunk_rows: int | None = None,
+) -> pd.DataFrame | None:
+    names = SOURCE_NAMES["net_position"]
+    return _load_table(
+        data_dir, names, schema, dtypes, net_position_from_dataframe,
+        cache, filters, columns, chunk_rows,
+    )
+
+
+def load_prices(
+    data_dir: Path,
+    schema: dict[str, str],
+    dtypes: dict[str, str] | None = None,
+    cache: TableCache | None = None,
+    filters: Filters | None = None,
+    columns: list[str] | None = None,
+    chunk_rows: int | None = None,
+) -> pd.DataFrame | None:
+    names = SOURCE_NAMES["prices"]
+    return _load_table(
+        data_dir, names, schema, dtypes, prices_from_dataframe,
+        cache, filters, columns, chunk_rows,
+    )
+
+
+def load_storage(
+    data_dir: Path,
+    schema: dict[str, str],
+    dtypes: dict[str, str] | None = None,
+    cache: TableCache | None = None,
+    filters: Filters | None = None,
+    columns: list[str] | None = None,
+    chunk_rows: int | None = None,
+) -> pd.DataFrame | None:
+    names = SOURCE_NAMES["storage"]
+    return _load_table(
+        data_dir, names, schema, dtypes, storage_from_dataframe,
+        cache, filters, columns, chunk_rows,
+    )
+
+
+def load_adequacy_hour_month(
+    data_dir: Path,
+    dtypes: dict[str, str] | None = None,
+    cache: TableCache | None = None,
+    filters: Filters | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame | None:
+    """Lädt Adequacy nach Stunde/Monat (Spalten: study_zone, target_year, month, hour, ggf. climate_year, sample_id, lole_h, ens_mwh)."""
+    names = SOURCE_NAMES["adequacy_hour_month"]
+    return _load_table(data_dir, names, None, dtypes, None, cache, filters, columns)
+
+
+def table_cache(config: Config) -> TableCache | None:
+    """Cache gemäß config.paths.cache_dir (None = Cache deaktiviert)."""
+    return TableCache(config.paths.cache_dir) if config.paths.cache_dir else None
+
+
+def load_dataset(
+    config: Config | None = None,
+    cache: TableCache | None = None,
+    filters: Filters | None = None,
+    columns: dict[str, list[str] | None] | None = None,
+    lazy: bool = False,
+) -> ERAADataset:
+    """
+    Lädt alle verfügbaren ERAA-Daten aus config.paths.data_dir.
+
+    Args:
+        cache: Parquet-Cache für CSV-Quellen (Standard: gemäß config.paths.cache_dir).
+        filters: Auswahl pro Dimension, z.B. {"target_year": [2030]}; gilt für alle Tabellen.
+        columns: Tabelle → benötigte Spalten (None = alle); fehlende Tabellen werden übersprungen.
+        lazy: LazyERAADataset zurückgeben, das jede Tabelle erst beim ersten Zugriff lädt.
+    """
     config = config or Config.load()
     data_dir = Path(config.paths.data_dir)
     data_dir.mkdir(parents=True, exist_ok=True)
+    cache = cache if cache is not None else table_cache(config)
 
     s = config.schema
-    return ERAADataset(
-        adequacy=load_adequacy(data_dir, s.adequacy),
-        adequacy_hour_month=load_adequacy_hour_month(data_dir),
-        dispatch=load_dispatch(data_dir, s.dispatch),
-        net_position=load_net_position(data_dir, s.net_position),
-        prices=load_prices(data_dir, s.prices),
-        storage=load_storage(data_dir, s.storage),
-    )
+
+    chunk_rows = config.loading.chunk_rows if config.loading.stream_time_series else None
+
+    def opts(table: str) -> dict:
+        return {
+            "dtypes": table_dtypes(config, table),
+            "filters": filters,
+            "columns": columns.get(table) if columns is not None else None,
+        }
+
+    stream = {"chunk_rows": chunk_rows}
+    tasks: dict[str, tuple[Callable, tuple, dict]] = {
+        "adequacy": (load_adequacy, (data_dir, s.adequacy), opts("adequacy")),
+        "adequacy_hour_month": (load_adequacy_hour_month, (data_dir,), opts("adequacy_hour_month")),
+        "dispatch": (load_dispatch, (data_dir, s.dispatch), {**opts("dispatch"), **stream}),
+        "net_position": (
+            load_net_position, (data_dir, s.net_position), {**opts("net_position"), **stream}
+        ),
+        "prices": (load_prices, (data_dir, s.prices), {**opts("prices"), **stream}),
+        "storage": (load_storage, (data_dir, s.storage), {**opts("storage"), **stream}),
+    }
+    if columns is not None:
+        # Tabellen ohne Spaltendeklaration werden gar nicht gelesen
+        # (z.B. adequacy_hour_month in der Pipeline)
+        tasks = {table: task for table, task in tasks.items() if table in columns}
+    sketch_tasks: dict[str, tuple[Callable, tuple, dict]] = {}
+    if chunk_rows and "prices" in tasks:
+        # Sample-Mittel allein verliert die Verteilung: Preis-Quantile über alle Läufe als Sketch
+        sketch_opts = {
+            "dtypes": table_dtypes(config, "prices"),
+            "filters": filters,
+            "chunk_rows": chunk_rows,
+            "k": config.loading.sketch_k,
+        }
+        sketch_tasks["prices"] = (sketch_prices, (data_dir, s.prices), sketch_opts)
+    if lazy:
+        loaders = {
+            table: functools.partial(func, *args, cache=cache, **kwargs)
+            for table, (func, args, kwargs) in tasks.items()
+        }
+
+        def describe(table: str) -> TableInfo | None:
+            if table not in tasks:
+                return None
+            schema = getattr(s, table, None)
+            return describe_table(data_dir, table, schema, table_dtypes(config, table), cache)
+
+        sketches = {
+            table: functools.partial(func, *args, cache=cache, **kwargs)
+            for table, (func, args, kwargs) in sketch_tasks.items()
+        }
+        fingerprint = functools.partial(source_fingerprint, data_dir)
+        return LazyERAADataset(loaders, describe, sketches, fingerprint)
+    tasks.update({f"{table}_sketch": task for table, task in sketch_tasks.items()})
+    frames = _run_loads(tasks, cache, config.loading.workers, config.loading.executor)
+    sketches = {table: frames.pop(f"{table}_sketch") for table in sketch_tasks}
+    sketches = {table: sketch for table, sketch in sketches.items() if sketch is not None}
+    return ERAADataset(**frames, sketches=sketches)
+
+
+def warm_table_cache(config: Config, cache: TableCache) -> list[str]:
+    """Parquet-Cache für alle Tabellen mit CSV-Quelle bauen; gibt die Tabellen zurück."""
+    data_dir = Path(config.paths.data_dir)
+    loading = config.loading.model_copy(update={"stream_time_series": False, "workers": 1})
+    full = config.model_copy(update={"loading": loading})
+    warmed = []
+    for table, names in SOURCE_NAMES.items():
+        shards = find_shards(data_dir, names)
+        sources = [data_dir / n for n in names if (data_dir / n).exists()]
+        sources = [p for p in sources if not (p.is_dir() and shards)]
+        # Nur einzelne CSV-Dateien landen im Cache (Parquet und Shards werden direkt gelesen)
+        if sources and sources[0].is_file() and sources[0].suffix.lower() == ".csv":
+            load_dataset(full, cache=cache, columns={table: None})
+            warmed.append(table)
+    return warmed
+
+
+def _count_csv_rows(path: Path) -> int:
+    """Datenzeilen einer CSV zählen (Zeilenumbrüche, ohne zu parsen)."""
+    lines, last = 0, b"\n"
+    with open(path, "rb") as f:
+        while block := f.read(1 << 20):
+            lines += block.count(b"\n")
+            last = block[-1:]
+    if last != b"\n":
+        lines += 1
+    return max(0, lines - 1)
+
+
+def _distinct(table: pa.Table, column: str) -> list:
+    if column not in table.column_names:
+        return []
+    values = pc.unique(table.column(column).combine_chunks()).to_pylist()
+    return sorted(v for v in values if v is not None)
+
+
+def _describe_source(src: Path, dim_cols: dict[str, str]) -> tuple[list[str], int, pa.Table] | None:
+    """
+    Spalten, Zeilenzahl und Dimensionsspalten (Dimension → Quellspalte) einer Quelle.
+
+    Liest nur den Parquet-Footer bzw. CSV-Header und die Dimensionsspalten.
+    """
+    if src.is_dir() or src.suffix.lower() in (".parquet", ".pq"):
+        partitioning = "hive" if src.is_dir() else None
+        dataset = pa_ds.dataset(src, format="parquet", partitioning=partitioning)
+        names = dataset.schema.names
+        dims = dataset.to_table(columns=[c for c in dim_cols.values() if c in names])
+        return names, dataset.count_rows(), dims
+    if src.suffix.lower() == ".csv":
+        names = _csv_header(src)
+        dims = pa_csv.read_csv(
+            src,
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=[c for c in dim_cols.values() if c in names],
+                # Bezeichner immer als Text (auch wenn sie wie Zahlen aussehen)
+                column_types={c: pa.string() for dim, c in dim_cols.items() if dim not in INT_DIMS},
+            ),
+        )
+        return names, _count_csv_rows(src), dims
+    return None
+
+
+def _source_dimensions(dims: pa.Table, dim_cols: dict[str, str]) -> dict[str, list]:
+    return {
+        dim: plain_values(_distinct(dims, col), dim)
+        for dim, col in dim_cols.items()
+        if col in dims.column_names
+    }
+
+
+def source_fingerprint(data_dir: Path, table: str) -> tuple:
+    """
+    Pfad, Größe und mtime aller Quelldateien einer Tabelle (Datei, Verzeichnis, Shards).
+
+    Dieselben Angaben wie im Schlüssel des Parquet-Caches: ändert sich eine Quelle, ändern sich
+    Cache-Eintrag und Fingerprint gemeinsam (siehe LazyERAADataset.info).
+    """
+    files = [shard.path for shard in find_shards(data_dir, SOURCE_NAMES[table])]
+    for name in SOURCE_NAMES[table]:
+        path = data_dir / name
+        if path.is_dir():
+            files += sorted(p for p in path.rglob("*") if p.is_file())
+        elif path.is_file():
+            files.append(path)
+    stamps = []
+    for path in files:
+        st = path.stat()
+        stamps.append((str(path), st.st_size, st.st_mtime_ns))
+    return tuple(stamps)
+
+
+def describe_table(
+    data_dir: Path,
+    table: str,
+    schema: dict[str, str] | None = None,
+    dtypes: dict[str, str] | None = None,
+    cache: TableCache | None = None,
+) -> TableInfo | None:
+    """Metadaten einer Tabelle (Zeilen, Spalten, Dimensionen) ohne die Kennzahlen zu laden."""
+    schema = schema or {}
+    canonical = {v: k for k, v in schema.items()}
+    shards = find_shards(data_dir, SOURCE_NAMES[table])
+    for name in SOURCE_NAMES[table]:
+        path = data_dir / name
+        if not path.exists() or (path.is_dir() and shards):
+            continue
+        src, names_map = path, canonical
+        if cache is not None and path.is_file() and path.suffix.lower() == ".csv":
+            entry = cache.entry_path(path, schema, dtypes)
+            if entry.exists():
+                src, names_map = entry, {}
+        dim_cols = {dim: schema.get(dim, dim) if names_map else dim for dim in CATALOG_DIMS}
+        described = _describe_source(src, dim_cols)
+        if described is None:
+            continue
+        names, rows, dims = described
+        dimensions = _source_dimensions(dims, dim_cols)
+        return TableInfo(
+            source=str(src),
+            columns=[names_map.get(c, c) for c in names],
+            row_count=rows,
+            study_zones=dimensions.get("study_zone", []),
+            target_years=dimensions.get("target_year", []),
+            dimensions=dimensions,
+        )
+    if shards:
+        dim_cols = {dim: schema.get(dim, dim) for dim in CATALOG_DIMS}
+        columns: dict[str, None] = {}
+        rows, values = 0, {}
+        for shard in shards:
+            names, n, dims = _describe_source(shard.path, dim_cols)
+            columns.update(dict.fromkeys(canonical.get(c, c) for c in names))
+            rows += n
+            found = _source_dimensions(dims, dim_cols)
+            for dim, run in (("climate_year", shard.climate_year), ("sample_id", shard.sample_id)):
+                if run is not None:
+                    found.setdefault(dim, []).append(run)
+            for dim, vals in found.items():
+                values.setdefault(dim, set()).update(vals)
+        for run_col in ("climate_year", "sample_id"):
+            columns.setdefault(run_col, None)
+        dimensions = {dim: sorted(values[dim]) for dim in CATALOG_DIMS if dim in values}
+        first = shards[0].path
+        pattern = re.sub(r"(_CY\d+)?(_S\d+)?\.\w+$", "_*", first.name, flags=re.I)
+        return TableInfo(
+            source=str(first.with_name(pattern)),
+            columns=list(columns),
+            row_count=rows,
+            study_zones=dimensions.get("study_zone", []),
+            target_years=dimensions.get("target_year", []),
+            dimensions=dimensions,
+        )
+    return None
+
+
+def _timed_load(
+    table: str, func: Callable, args: tuple, kwargs: dict, cache_dir: Path | None
+) -> tuple[str, pd.DataFrame | None, float, int, int]:
+    """Eine Tabelle laden; liefert Laufzeit und Cache-Statistik mit (auch aus Worker-Prozessen)."""
+    cache = TableCache(cache_dir) if cache_dir is not None else None
+    t0 = time.perf_counter()
+    df = func(*args, cache=cache, **kwargs)
+    hits, misses = (cache.hits, cache.misses) if cache is not None else (0, 0)
+    return table, df, time.perf_counter() - t0, hits, misses
+
+
+def _run_loads(
+    tasks: dict[str, tuple[Callable, tuple, dict]],
+    cache: TableCache | None,
+    workers: int,
+    executor: str,
+) -> dict[str, pd.DataFrame | None]:
+    """Tabellen sequentiell (workers <= 1) oder parallel im Thread-/Prozess-Pool laden."""
+    cache_dir = cache.cache_dir if cache is not None else None
+    calls = [
+        (table, func, args, kwargs, cache_dir) for table, (func, args, kwargs) in tasks.items()
+    ]
+    t0 = time.perf_counter()
+    if workers <= 1:
+        results = [_timed_load(*call) for call in calls]
+    else:
+        pool_cls = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        with pool_cls(max_workers=min(workers, len(calls))) as pool:
+            results = list(pool.map(_timed_load, *zip(*calls)))
+    frames = {}
+    for table, df, seconds, hits, misses in results:
+        rows = 0 if df is None else len(df)
+        logger.info("Loaded %-20s %10d rows in %6.2f s", table, rows, seconds)
+        if cache is not None:
+            cache.hits += hits
+            cache.misses += misses
+        frames[table] = df
+    seconds = time.perf_counter() - t0
+    logger.info("Loaded dataset in %.2f s (workers=%d, %s)", seconds, workers, executor)
+    return frames
+
+
+def write_partitioned(
+    df: pd.DataFrame,
+    root: Path,
+    partition_cols: tuple[str, ...] = ("target_year", "study_zone"),
+) -> Path:
+    """Schreibt eine Tabelle Hive-partitioniert als Parquet (Layout für `load_*` mit Filtern)."""
+    df.to_parquet(root, partition_cols=list(partition_cols), index=False)
+    return root
+
+
+def _untyped_nbytes(s: pd.Series) -> int:
+    """Speicherbedarf einer Spalte mit Standard-Dtypes (object-Strings, int64, float64)."""
+    if isinstance(s.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(s.dtype):
+        return int(s.astype(object).memory_usage(index=False, deep=True))
+    if pd.api.types.is_numeric_dtype(s.dtype) and not pd.api.types.is_bool_dtype(s.dtype):
+        return 8 * len(s)
+    return int(s.memory_usage(index=False, deep=True))
+
+
+def memory_report(dataset: ERAADataset) -> pd.DataFrame:
+    """Speicherbedarf pro Tabelle mit typisiertem Einlesen vs. Standard-Dtypes (in MB)."""
+    rows = []
+    for table in TABLES:
+        df = getattr(dataset, table)
+        if df is None:
+            continue
+        typed = int(df.memory_usage(index=False, deep=True).sum())
+        untyped = sum(_untyped_nbytes(df[c]) for c in df.columns)
+        rows.append({
+            "table": table,
+            "rows": len(df),
+            "typed_mb": typed / 1e6,
+            "untyped_mb": untyped / 1e6,
+            "saved_mb": (untyped - typed) / 1e6,
+            "saved_pct": 100.0 * (untyped - typed) / untyped if untyped else 0.0,
+        })
+    columns = ["table", "rows", "typed_mb", "untyped_mb", "saved_mb", "saved_pct"]
+    return pd.DataFrame(rows, columns=columns)
@@ -13,11 +13,98 @@ Dimensionen: target_year, climate_year, sample_id (z.B. 36 × 10 = 360 Läufe).
 
 from __future__ import annotations
 
-from typing import Any
+import logging
+import threading
+from collections.abc import Mapping
+from typing import Any, Callable, Iterator
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, Field
 
+from .aggregations import PROFILE_DIMS, HourMonthProfile, run_mean
+from .catalog import DimensionCatalog, frame_dimensions
+from .cube import RunCube, cube_dims
+from .index import INDEX_KEYS, TableIndex
+from .sketch import SketchSet
+
+logger = logging.getLogger(__name__)
+
+# --- Spalten-Dtypes beim Einlesen (Standard; per config.yaml `dtypes` überschreibbar) ---
+# Dimensionen als Kategorien bzw. kleine Integer; Kennzahlen bleiben float64,
+# sofern in der Konfiguration nicht float32 gesetzt ist. Die Zeitspalte bleibt ungecastet:
+# ISO-Strings und ganzzahlige Stundenindizes wertet normalize_time aus.
+_DIM_DTYPES = {
+    "study_zone": "category",
+    "target_year": "int16",
+    "climate_year": "int16",
+    "sample_id": "int16",
+}
+
+DEFAULT_DTYPES: dict[str, dict[str, str]] = {
+    "adequacy": {**_DIM_DTYPES, "scenario": "category"},
+    "adequacy_hour_month": {**_DIM_DTYPES, "month": "int8", "hour": "int8"},
+    "dispatch": {**_DIM_DTYPES, "technology": "category"},
+    "net_position": dict(_DIM_DTYPES),
+    "prices": dict(_DIM_DTYPES),
+    "storage": {**_DIM_DTYPES, "storage_type": "category"},
+}
+
+
+_TABLES = tuple(DEFAULT_DTYPES)
+
+
+def _nbytes(obj: Any) -> int:
+    """Speicherbedarf einer Tabelle bzw. abgeleiteten Darstellung (DataFrame: inkl. Strings)."""
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=True, deep=True).sum())
+    return int(getattr(obj, "nbytes", 0) or 0)
+
+
+# Bezugsjahr für ganzzahlige Stundenindizes (datetime = Stunde des Jahres, 0-basiert), wenn die
+# Zeile kein target_year hat
+HOUR_INDEX_YEAR = 2025
+
+
+def normalize_time(df: pd.DataFrame | None, column: str = "datetime") -> pd.DataFrame | None:
+    """
+    Zeitspalte normalisieren (datetime64[s]) und hour (0–23), month (1–12) ergänzen.
+
+    Ganzzahlige Stundenindizes zählen ab dem 1.1. des target_year der Zeile.
+    """
+    if df is None or column not in df.columns:
+        return df
+    col = df[column]
+    if pd.api.types.is_datetime64_any_dtype(col):
+        ts = col.dt.as_unit("s")
+        if ts.dtype != col.dtype:
+            # z.B. aus Parquet gelesen (dort mindestens ms-Auflösung)
+            df = df.assign(**{column: ts})
+        if "hour" in df.columns and "month" in df.columns:
+            return df
+    elif pd.api.types.is_integer_dtype(col):
+        years = np.full(len(df), HOUR_INDEX_YEAR, dtype="float64")
+        if "target_year" in df.columns:
+            years = df["target_year"].to_numpy(dtype="float64", na_value=np.nan)
+            years = np.where(np.isnan(years), HOUR_INDEX_YEAR, years)
+        starts = (years.astype("int64") - 1970).astype("datetime64[Y]").astype("datetime64[s]")
+        hours = col.to_numpy(dtype="int64").astype("timedelta64[h]")
+        ts = pd.Series(starts + hours, index=df.index)
+    else:
+        ts = pd.to_datetime(col, format="ISO8601", errors="coerce").dt.as_unit("s")
+        if ts.isna().all() and len(col):
+            return df
+        bad = ts.isna() & col.notna()
+        if bad.any():
+            logger.warning(
+                "%d Zeitpunkt(e) in %r nicht lesbar (z.B. %r), fehlen in Aggregationen",
+                int(bad.sum()), column, col[bad].iloc[0],
+            )
+        df = df.assign(**{column: ts})
+    hour, month = ts.dt.hour, ts.dt.month
+    int_dtype = "Int8" if hour.isna().any() else "int8"
+    return df.assign(hour=hour.astype(int_dtype), month=month.astype(int_dtype))
+
 
 # --- Adequacy ---
 class AdequacyRecord(BaseModel):
@@ -199,7 +286,7 @@ def storage_from_dataframe(df: pd.DataFrame, schema: dict[str, str] | None = Non
 
 # --- Aggregierte Container für die Pipeline ---
 class ERAADataset:
-    """Container für alle geladenen ERAA-Output-Daten (kein Pydantic wegen DataFrame)."""
+    """Container für alle ERAA-Output-Daten (kein Pydantic wegen DataFrame); wird nur gelesen."""
 
     def __init__(
         self,
@@ -209,6 +296,7 @@ class ERAADataset:
         net_position: pd.DataFrame | None = None,
         prices: pd.DataFrame | None = None,
         storage: pd.DataFrame | None = None,
+        sketches: dict[str, SketchSet] | None = None,
     ):
         self.adequacy = adequacy
         self.adequacy_hour_month = adequacy_hour_month
@@ -216,3 +304,245 @@ class ERAADataset:
         self.net_position = net_position
         self.prices = prices
         self.storage = storage
+        # Quantil-Sketches aus dem Streaming (Tabelle → SketchSet), z.B. Preise über alle Läufe
+        self.sketches = sketches or {}
+        self._lock = threading.RLock()
+        # Abgeleitete Darstellungen: (Art, Tabelle, Parameter) → (Quell-DataFrame, Ergebnis)
+        self._derived: dict[tuple[str, str, Any], tuple[pd.DataFrame, Any]] = {}
+        self._building: dict[tuple[str, str, Any], threading.Lock] = {}
+
+    def _key_lock(self, key: tuple) -> threading.Lock:
+        """
+        Lock für genau einen Bau (Tabelle, Ableitung, Katalog): gleichzeitige Anfragen warten auf
+        denselben Bau, alle anderen laufen weiter. Der Dataset-Lock wird nur kurz gehalten.
+        """
+        with self._lock:
+            return self._building.setdefault(key, threading.Lock())
+
+    def _memo(self, kind: str, table: str, param: Any, build: Callable[[pd.DataFrame], Any]) -> Any:
+        """Einmal aus der Tabelle ableiten und merken, solange die Tabelle nicht ersetzt wird."""
+        df = getattr(self, table)
+        if df is None:
+            return None
+        key = (kind, table, param)
+        with self._key_lock(key):
+            cached = self._derived.get(key)
+            if cached is None or cached[0] is not df:
+                cached = (df, build(df))
+                self._derived[key] = cached
+        return cached[1]
+
+    def _loaded(self) -> dict[str, pd.DataFrame | None]:
+        return {table: getattr(self, table) for table in _TABLES}
+
+    def _loaded_sketches(self) -> dict[str, SketchSet]:
+        return dict(self.sketches)
+
+    def _table_dimensions(self, table: str) -> dict[str, list] | None:
+        df = getattr(self, table)
+        if df is None or df.empty:
+            return None
+        return self._memo("dimensions", table, None, frame_dimensions)
+
+    @property
+    def catalog(self) -> DimensionCatalog:
+        """Zonen, Zieljahre, Technologien, … pro Tabelle (pro Tabelle gemerkt)."""
+        dims = {table: self._table_dimensions(table) for table in _TABLES}
+        return DimensionCatalog({table: d for table, d in dims.items() if d is not None})
+
+    def memory_usage(self) -> pd.DataFrame:
+        """
+        Speicherbedarf (MB) der geladenen Tabellen, abgeleiteten Darstellungen und Sketches.
+
+        Lädt nichts nach; eine Zeile pro Objekt mit Tabelle, Art (table, run_mean, index, …) und MB.
+        """
+        loaded = self._loaded().items()
+        rows = [(table, "table", _nbytes(df)) for table, df in loaded if df is not None]
+        with self._lock:
+            derived = list(self._derived.items())
+        rows += [
+            (table, kind, _nbytes(obj)) for (kind, table, _), (_, obj) in derived if obj is not None
+        ]
+        sketches = self._loaded_sketches()
+        rows += [(table, "sketch", sketch.nbytes) for table, sketch in sketches.items()]
+        out = pd.DataFrame(rows, columns=["table", "kind", "mb"])
+        out["mb"] = out["mb"] / 1e6
+        return out
+
+    def cube(self, table: str, value: str) -> RunCube | None:
+        """Kennzahl einer Zeitreihen-Tabelle als dichtes Array (siehe `cube.RunCube`)."""
+        df = getattr(self, table)
+        if df is None or value not in df.columns:
+            return None
+        return self._memo(
+            "cube", table, value, lambda d: RunCube.from_long(d, cube_dims(table), value)
+        )
+
+    def run_mean(self, table: str, stats: bool = False) -> pd.DataFrame | None:
+        """
+        Sample-Mittel einer Zeitreihen-Tabelle (siehe `aggregations.run_mean`), einmal berechnet
+        und für alle Plots wiederverwendet; hour/month sind wie bei den Rohdaten enthalten.
+        """
+        return self._memo(
+            "run_mean", table, stats, lambda d: normalize_time(run_mean(d, table, stats))
+        )
+
+    def index(self, table: str, mean: bool = False) -> TableIndex | None:
+        """Nach (Zieljahr, Zone[, …]) sortierte Sicht; `mean=True` indiziert das Sample-Mittel."""
+        return self._memo(
+            "index", table, mean,
+            lambda d: TableIndex(self.run_mean(table) if mean else d, INDEX_KEYS[table]),
+        )
+
+    def hour_month_profile(self, table: str, value: str) -> HourMonthProfile | None:
+        """Stunde×Monat-Profil einer Kennzahl über alle Zonen/Zieljahre (einmal gebaut, gemerkt)."""
+        df = getattr(self, table)
+        if df is None or value not in df.columns:
+            return None
+        return self._memo(
+            "hour_month", table, value,
+            lambda d: HourMonthProfile.from_long(normalize_time(d), value, PROFILE_DIMS[table]),
+        )
+
+
+class TableInfo(BaseModel):
+    """Metadaten einer Tabelle aus Datei-Footer/Header bzw. Partitionen, ohne die Daten zu laden."""
+
+    source: str
+    columns: list[str]
+    row_count: int | None = None
+    study_zones: list[str] = Field(default_factory=list)
+    target_years: list[int] = Field(default_factory=list)
+    # Ausprägungen aller Katalog-Dimensionen (siehe catalog.CATALOG_DIMS), soweit vorhanden
+    dimensions: dict[str, list] = Field(default_factory=dict)
+
+
+class _LazyTable:
+    """Descriptor: lädt die Tabelle beim ersten Zugriff über den registrierten Loader (gemerkt)."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: "LazyERAADataset | None", objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        # Ein Lock pro Tabelle: das Laden blockiert weder andere Tabellen noch Sitzungen
+        with obj._key_lock(("table", self.name, None)):
+            if self.name not in obj._frames:
+                loader = obj._loaders.get(self.name)
+                df = loader() if loader is not None else None
+                with obj._lock:
+                    obj._frames[self.name] = df
+            return obj._frames[self.name]
+
+    def __set__(self, obj: "LazyERAADataset", value: pd.DataFrame | None) -> None:
+        with obj._lock:
+            obj._frames[self.name] = value
+
+
+class _LazySketches(Mapping):
+    """Quantil-Sketches (Tabelle → SketchSet), die erst beim ersten Zugriff gebaut werden."""
+
+    def __init__(self, loaders: dict[str, Callable[[], SketchSet | None]]):
+        self._loaders = loaders
+        self._sketches: dict[str, SketchSet | None] = {}
+        self._lock = threading.Lock()
+        self._building: dict[str, threading.Lock] = {}
+
+    def __getitem__(self, table: str) -> SketchSet:
+        if table not in self._loaders:
+            raise KeyError(table)
+        with self._lock:
+            lock = self._building.setdefault(table, threading.Lock())
+        with lock:
+            if table not in self._sketches:
+                self._sketches[table] = self._loaders[table]()
+        sketch = self._sketches[table]
+        if sketch is None:
+            raise KeyError(table)
+        return sketch
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._loaders)
+
+    def __len__(self) -> int:
+        return len(self._loaders)
+
+    def loaded(self) -> dict[str, SketchSet]:
+        """Bereits gebaute Sketches (baut nichts nach)."""
+        with self._lock:
+            return {table: sketch for table, sketch in self._sketches.items() if sketch is not None}
+
+
+class LazyERAADataset(ERAADataset):
+    """ERAADataset, dessen Tabellen und Sketches erst beim ersten Zugriff geladen werden."""
+
+    adequacy = _LazyTable()
+    adequacy_hour_month = _LazyTable()
+    dispatch = _LazyTable()
+    net_position = _LazyTable()
+    prices = _LazyTable()
+    storage = _LazyTable()
+
+    def __init__(
+        self,
+        loaders: dict[str, Callable[[], pd.DataFrame | None]],
+        describe: Callable[[str], TableInfo | None] | None = None,
+        sketches: dict[str, Callable[[], SketchSet | None]] | None = None,
+        fingerprint: Callable[[str], Any] | None = None,
+    ):
+        self._lock = threading.RLock()
+        self._loaders = loaders
+        self._describe = describe
+        self._fingerprint = fingerprint
+        self._frames: dict[str, pd.DataFrame | None] = {}
+        # Tabelle → (Fingerprint der Quellen, Metadaten)
+        self._infos: dict[str, tuple[Any, TableInfo | None]] = {}
+        self._derived = {}
+        self._building = {}
+        self.sketches = _LazySketches(sketches or {})
+
+    def _loaded(self) -> dict[str, pd.DataFrame | None]:
+        with self._lock:
+            return dict(self._frames)
+
+    def _loaded_sketches(self) -> dict[str, SketchSet]:
+        return self.sketches.loaded()
+
+    def _table_dimensions(self, table: str) -> dict[str, list] | None:
+        # Aus den Metadaten der Quelle, ohne die Tabelle zu laden
+        info = self.info(table)
+        return info.dimensions if info is not None else None
+
+    def is_loaded(self, table: str) -> bool:
+        return table in self._frames
+
+    def info(self, table: str) -> TableInfo | None:
+        """
+        Metadaten einer Tabelle (None, wenn keine Quelle vorhanden ist).
+
+        Mit `fingerprint` werden sie neu gelesen, sobald sich die Quelldateien ändern.
+        """
+        with self._key_lock(("info", table, None)):
+            stamp = self._fingerprint(table) if self._fingerprint is not None else None
+            cached = self._infos.get(table)
+            if cached is None or cached[0] != stamp:
+                cached = (stamp, self._describe(table) if self._describe is not None else None)
+                self._infos[table] = cached
+            return cached[1]
+
+    def row_count(self, table: str) -> int | None:
+        info = self.info(table)
+        return info.row_count if info is not None else None
+
+    def columns(self, table: str) -> list[str]:
+        info = self.info(table)
+        return info.columns if info is not None else []
+
+    def study_zones(self, table: str) -> list[str]:
+        info = self.info(table)
+        return info.study_zones if info is not None else []
+
+    def target_years(self, table: str) -> list[int]:
+        info = self.info(table)
+        return info.target_years if info is not None else []
@@ -4,22 +4,33 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from .cache import TableCache
 from .config import Config
 from .loaders import load_dataset
-from .plots import run_all_plots
+from .plots import PIPELINE_PLOTS, required_columns, run_all_plots
 
 
-def run_pipeline(config_path: str | Path | None = None) -> list[Path]:
+def run_pipeline(
+    config_path: str | Path | None = None,
+    cache: TableCache | None = None,
+    jobs: int | None = None,
+    force: bool = False,
+) -> list[Path]:
     """
     Lädt Konfiguration, lädt alle verfügbaren ERAA-Daten und erzeugt alle Plots als HTML.
 
+    Args:
+        cache: Optionaler Parquet-Cache (Standard: gemäß config.paths.cache_dir).
+        jobs: Prozesse zum Rendern der Plots (Standard: config.visualization.jobs).
+        force: Alle Plots neu bauen, auch wenn ihr Fingerprint unverändert ist.
+
     Returns:
-        Liste der geschriebenen HTML-Dateipfade.
+        Liste der aktuellen HTML-Dateipfade (neu gebaut oder unverändert übersprungen).
     """
     config = Config.load(config_path or "config.yaml")
     Path(config.paths.output_dir).mkdir(parents=True, exist_ok=True)
-    dataset = load_dataset(config)
-    return run_all_plots(dataset, config)
+    dataset = load_dataset(config, cache=cache, columns=required_columns(PIPELINE_PLOTS))
+    return run_all_plots(dataset, config, jobs=jobs, force=force)
 
 
 if __name__ == "__main__":
@@ -6,13 +6,94 @@ Erzeugt Boxplots, Heatmaps und Zeitreihen; speichert alle Plots als HTML.
 
 from __future__ import annotations
 
+import logging
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
+from .aggregations import PROFILE_DIMS, HourMonthProfile, box_stats
 from .config import Config
+from .cube import RunCube
+from .downsample import downsample_columns, downsample_frame
+from .index import TableIndex, select
+from .models import normalize_time
+from .render import PlotTask, render_tasks
+from .report import write_figure, write_manifest
+from .sketch import SketchSet
+
+if TYPE_CHECKING:
+    from .models import ERAADataset
+
+logger = logging.getLogger(__name__)
+
+
+def _as_frame(data: pd.DataFrame | RunCube, reduce_runs: bool = True) -> pd.DataFrame:
+    """RunCube → lange Tabelle (standardmäßig über die Läufe gemittelt); sonst unverändert."""
+    if isinstance(data, RunCube):
+        return (data.mean() if reduce_runs else data).to_frame()
+    return data
+
+
+def _no_values(data: pd.DataFrame | SketchSet, value: str) -> bool:
+    if isinstance(data, SketchSet):
+        return data.value != value or len(data) == 0
+    return data.empty or value not in data.columns
+
+
+def _boxplot(
+    df: pd.DataFrame | SketchSet,
+    config: Config,
+    x: str,
+    y: str,
+    color: str | None,
+    title: str,
+    labels: dict[str, str],
+    colors: list[str] | None = None,
+) -> go.Figure:
+    """Boxplot je nach visualization.boxplot_mode (summary: Kennwerte, raw: alle Werte)."""
+    vis = config.visualization
+    if isinstance(df, SketchSet):
+        stats = df.box_stats(vis.boxplot_percentiles)
+        outliers = stats.iloc[:0]
+    elif vis.boxplot_mode == "raw":
+        return px.box(
+            df, x=x, y=y, color=color, color_discrete_sequence=colors, title=title, labels=labels
+        )
+    else:
+        keys = [x] + ([color] if color else [])
+        stats, outliers = box_stats(df, keys, y, vis.boxplot_percentiles, vis.boxplot_max_outliers)
+    colors = colors or px.colors.qualitative.Plotly
+    groups = stats.groupby(color, observed=True) if color else [(None, stats)]
+    fig = go.Figure()
+    for i, (key, part) in enumerate(groups):
+        name = str(key) if key is not None else labels.get(y, y)
+        points = outliers[outliers[color] == key] if color else outliers
+        marker = dict(color=colors[i % len(colors)])
+        fig.add_trace(go.Box(
+            x=part[x].astype(str),
+            q1=part["q1"], median=part["median"], q3=part["q3"],
+            lowerfence=part["lowerfence"], upperfence=part["upperfence"],
+            name=name, marker=marker, offsetgroup=name, legendgroup=name, showlegend=bool(color),
+        ))
+        if len(points):
+            fig.add_trace(go.Scatter(
+                x=points[x].astype(str), y=points[y], mode="markers",
+                marker=dict(size=4, **marker), name=name, offsetgroup=name, legendgroup=name,
+                showlegend=False,
+            ))
+    fig.update_layout(
+        title=title,
+        boxmode="group",
+        scattermode="group",
+        xaxis_title=labels.get(x, x),
+        yaxis_title=labels.get(y, y),
+        legend_title_text=labels.get(color, color) if color else None,
+    )
+    return fig
 
 
 def _fig_defaults(fig: go.Figure, config: Config) -> None:
@@ -27,25 +108,72 @@ def _fig_defaults(fig: go.Figure, config: Config) -> None:
     )
 
 
-def _write_html(fig: go.Figure, path: Path, config: Config) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    fig.write_html(
-        str(path),
-        config=dict(displayModeBar=True, responsive=True),
-        include_plotlyjs=config.visualization.html.include_plotlyjs,
+def _downsample_traces(agg: pd.DataFrame, y: str, by: list[str], config: Config) -> pd.DataFrame:
+    """Zeitreihe pro Trace (`by`) auf das Punktbudget aus visualization reduzieren."""
+    vis = config.visualization
+    max_points = vis.timeseries_max_points
+    if vis.timeseries_figure_max_points > 0 and not agg.empty:
+        by_cols = [c for c in by if c in agg.columns]
+        traces = agg.groupby(by_cols, observed=True).ngroups if by_cols else 1
+        per_trace = max(4, vis.timeseries_figure_max_points // traces)
+        max_points = per_trace if max_points <= 0 else min(max_points, per_trace)
+    return downsample_frame(agg, "datetime", y, max_points, vis.downsample_method, by)
+
+
+def _render_mode(points: int, config: Config) -> str:
+    """SVG für kleine Figuren, WebGL (Scattergl) ab visualization.webgl_min_points Punkten."""
+    threshold = config.visualization.webgl_min_points
+    return "webgl" if threshold is not None and points >= threshold else "svg"
+
+
+def _time_heatmap(pivot: pd.DataFrame, config: Config) -> tuple[np.ndarray, list[str]]:
+    """Pivot (Zeilen × Zeit) → (z, x-Labels), Zeitachse auf heatmap_max_timesteps reduziert."""
+    vis = config.visualization
+    z, starts = downsample_columns(
+        pivot.to_numpy(dtype="float64"), vis.heatmap_max_timesteps, vis.downsample_method
     )
+    return z, [str(x) for x in pivot.columns[starts]]
+
+
+def _write_html(fig: go.Figure, path: Path, config: Config) -> None:
+    write_figure(fig, path, config)
+
+
+def uses_columns(table: str, *columns: str, version: int = 1) -> Callable[[Callable], Callable]:
+    """Deklariert Tabelle, Spalten und Version (für den Fingerprint) einer Plot-Funktion."""
+
+    def deco(func: Callable) -> Callable:
+        func.table = table
+        func.columns = tuple(columns)
+        func.version = version
+        return func
+
+    return deco
+
+
+def required_columns(plot_funcs: Iterable[Callable]) -> dict[str, list[str]]:
+    """
+    Vereinigt die Spaltendeklarationen mehrerer Plot-Funktionen pro Tabelle
+    (für load_dataset(columns=...)).
+    """
+    out: dict[str, list[str]] = {}
+    for func in plot_funcs:
+        cols = out.setdefault(func.table, [])
+        cols.extend(c for c in func.columns if c not in cols)
+    return out
 
 
 # --- Adequacy ---
 
 
+@uses_columns("adequacy", "study_zone", "target_year", "lole")
 def plot_adequacy_lole_boxplot(
-    df: pd.DataFrame,
+    df: pd.DataFrame | SketchSet,
     config: Config,
     output_path: Path | None = None,
 ) -> go.Figure:
     """LOLE pro Study Zone und Target Year als Boxplot (über climate_year × sample)."""
-    if df.empty or "lole" not in df.columns:
+    if _no_values(df, "lole"):
         fig = go.Figure()
         fig.add_annotation(text="No adequacy data (lole) available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
         if output_path:
@@ -53,12 +181,13 @@ def plot_adequacy_lole_boxplot(
         return fig
 
     # Eine Zeile pro Zone/Jahr/Klimajahr/Sample → Box pro Zone und Target Year
-    fig = px.box(
+    fig = _boxplot(
         df,
+        config,
         x="study_zone",
         y="lole",
         color="target_year",
-        color_discrete_sequence=px.colors.qualitative.Set2,
+        colors=px.colors.qualitative.Set2,
         title="LOLE (Loss of Load Expectation) by Study Zone and Target Year",
         labels={"lole": "LOLE [h/year]", "study_zone": "Study Zone"},
     )
@@ -69,25 +198,27 @@ def plot_adequacy_lole_boxplot(
     return fig
 
 
+@uses_columns("adequacy", "study_zone", "target_year", "ens")
 def plot_adequacy_ens_boxplot(
-    df: pd.DataFrame,
+    df: pd.DataFrame | SketchSet,
     config: Config,
     output_path: Path | None = None,
 ) -> go.Figure:
     """ENS (Energy Not Served) pro Zone und Target Year als Boxplot."""
-    if df.empty or "ens" not in df.columns:
+    if _no_values(df, "ens"):
         fig = go.Figure()
         fig.add_annotation(text="No adequacy data (ens) available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
         if output_path:
             _write_html(fig, output_path, config)
         return fig
 
-    fig = px.box(
+    fig = _boxplot(
         df,
+        config,
         x="study_zone",
         y="ens",
         color="target_year",
-        color_discrete_sequence=px.colors.qualitative.Set2,
+        colors=px.colors.qualitative.Set2,
         title="ENS (Energy Not Served) by Study Zone and Target Year",
         labels={"ens": "ENS [GWh]", "study_zone": "Study Zone"},
     )
@@ -98,6 +229,7 @@ def plot_adequacy_ens_boxplot(
     return fig
 
 
+@uses_columns("adequacy", "study_zone", "target_year", "lole")
 def plot_adequacy_lole_heatmap(
     df: pd.DataFrame,
     config: Config,
@@ -111,7 +243,7 @@ def plot_adequacy_lole_heatmap(
             _write_html(fig, output_path, config)
         return fig
 
-    agg = df.groupby(["study_zone", "target_year"], as_index=False)["lole"].mean()
+    agg = df.groupby(["study_zone", "target_year"], as_index=False, observed=True)["lole"].mean()
     pivot = agg.pivot(index="study_zone", columns="target_year", values="lole")
     pivot = pivot.fillna(0)
 
@@ -137,17 +269,31 @@ def plot_adequacy_lole_heatmap(
     return fig
 
 
+@uses_columns(
+    "adequacy_hour_month", "study_zone", "target_year", "hour", "month", "lole_h", "value", "lole"
+)
 def plot_adequacy_lole_heatmap_hour_month(
-    df: pd.DataFrame,
+    df: pd.DataFrame | TableIndex | HourMonthProfile,
     config: Config,
-    study_zone: str | None = None,
-    target_year: int | None = None,
+    study_zone: str | list[str] | None = None,
+    target_year: int | list[int] | None = None,
     output_path: Path | None = None,
 ) -> go.Figure:
-    """Heatmap: LOLE nach Tagesstunde (0–23) × Monat (1–12). Erwartet Spalten hour, month, lole_h (oder value)."""
+    """
+    Heatmap: LOLE nach Tagesstunde (0–23) × Monat (1–12).
+
+    Erwartet Spalten hour, month, lole_h (oder value) oder ein HourMonthProfile.
+    """
+    if isinstance(df, HourMonthProfile):
+        val_col = df.value
+    elif "lole_h" in df.columns:
+        val_col = "lole_h"
+    else:
+        val_col = "value" if "value" in df.columns else "lole"
     need = ["hour", "month"]
-    val_col = "lole_h" if "lole_h" in df.columns else "value" if "value" in df.columns else "lole"
-    if df.empty or val_col not in df.columns or not all(c in df.columns for c in need):
+    if not isinstance(df, HourMonthProfile) and (
+        df.empty or val_col not in df.columns or not all(c in df.columns for c in need)
+    ):
         fig = go.Figure()
         fig.add_annotation(
             text="No hour×month LOLE data (hour, month, lole_h/value) available",
@@ -156,14 +302,9 @@ def plot_adequacy_lole_heatmap_hour_month(
         if output_path:
             _write_html(fig, output_path, config)
         return fig
-    work = df.copy()
-    if study_zone and "study_zone" in work.columns:
-        work = work[work["study_zone"] == study_zone]
-    if target_year is not None and "target_year" in work.columns:
-        work = work[work["target_year"] == target_year]
-    agg = work.groupby(["hour", "month"], as_index=False)[val_col].mean()
-    pivot = agg.pivot(index="hour", columns="month", values=val_col).fillna(0)
-    pivot = pivot.reindex(index=range(24), columns=range(1, 13)).fillna(0)
+    pivot = _hour_month_pivot(
+        df, "adequacy_hour_month", val_col, study_zone=study_zone or None, target_year=target_year
+    )
     fig = go.Figure(
         data=go.Heatmap(
             z=pivot.values,
@@ -173,8 +314,10 @@ def plot_adequacy_lole_heatmap_hour_month(
             colorbar=dict(title="LOLE [h]" if val_col == "lole_h" else "LOLE"),
         )
     )
+    zone_label = f" – {_selection_label(study_zone)}" if study_zone else ""
+    year_label = f" – TY{_selection_label(target_year)}" if target_year else ""
     fig.update_layout(
-        title=f"LOLE – Stunde × Monat (Mittel){' – ' + study_zone if study_zone else ''}{' – TY' + str(target_year) if target_year else ''}",
+        title=f"LOLE – Stunde × Monat (Mittel){zone_label}{year_label}",
         xaxis_title="Monat",
         yaxis_title="Stunde (UTC)",
         template=config.visualization.template,
@@ -186,17 +329,31 @@ def plot_adequacy_lole_heatmap_hour_month(
     return fig
 
 
+@uses_columns(
+    "adequacy_hour_month", "study_zone", "target_year", "hour", "month", "ens_mwh", "value", "ens"
+)
 def plot_adequacy_ens_heatmap_hour_month(
-    df: pd.DataFrame,
+    df: pd.DataFrame | TableIndex | HourMonthProfile,
     config: Config,
-    study_zone: str | None = None,
-    target_year: int | None = None,
+    study_zone: str | list[str] | None = None,
+    target_year: int | list[int] | None = None,
     output_path: Path | None = None,
 ) -> go.Figure:
-    """Heatmap: ENS nach Tagesstunde (0–23) × Monat (1–12). Erwartet hour, month, ens_mwh (oder value)."""
+    """
+    Heatmap: ENS nach Tagesstunde (0–23) × Monat (1–12).
+
+    Erwartet hour, month, ens_mwh (oder value) oder ein HourMonthProfile.
+    """
+    if isinstance(df, HourMonthProfile):
+        val_col = df.value
+    elif "ens_mwh" in df.columns:
+        val_col = "ens_mwh"
+    else:
+        val_col = "value" if "value" in df.columns else "ens"
     need = ["hour", "month"]
-    val_col = "ens_mwh" if "ens_mwh" in df.columns else "value" if "value" in df.columns else "ens"
-    if df.empty or val_col not in df.columns or not all(c in df.columns for c in need):
+    if not isinstance(df, HourMonthProfile) and (
+        df.empty or val_col not in df.columns or not all(c in df.columns for c in need)
+    ):
         fig = go.Figure()
         fig.add_annotation(
             text="No hour×month ENS data (hour, month, ens_mwh/value) available",
@@ -205,14 +362,9 @@ def plot_adequacy_ens_heatmap_hour_month(
         if output_path:
             _write_html(fig, output_path, config)
         return fig
-    work = df.copy()
-    if study_zone and "study_zone" in work.columns:
-        work = work[work["study_zone"] == study_zone]
-    if target_year is not None and "target_year" in work.columns:
-        work = work[work["target_year"] == target_year]
-    agg = work.groupby(["hour", "month"], as_index=False)[val_col].mean()
-    pivot = agg.pivot(index="hour", columns="month", values=val_col).fillna(0)
-    pivot = pivot.reindex(index=range(24), columns=range(1, 13)).fillna(0)
+    pivot = _hour_month_pivot(
+        df, "adequacy_hour_month", val_col, study_zone=study_zone or None, target_year=target_year
+    )
     fig = go.Figure(
         data=go.Heatmap(
             z=pivot.values,
@@ -222,8 +374,10 @@ def plot_adequacy_ens_heatmap_hour_month(
             colorbar=dict(title="ENS [MWh]" if val_col == "ens_mwh" else "ENS"),
         )
     )
+    zone_label = f" – {_selection_label(study_zone)}" if study_zone else ""
+    year_label = f" – TY{_selection_label(target_year)}" if target_year else ""
     fig.update_layout(
-        title=f"ENS – Stunde × Monat (Mittel){' – ' + study_zone if study_zone else ''}{' – TY' + str(target_year) if target_year else ''}",
+        title=f"ENS – Stunde × Monat (Mittel){zone_label}{year_label}",
         xaxis_title="Monat",
         yaxis_title="Stunde (UTC)",
         template=config.visualization.template,
@@ -250,8 +404,9 @@ ZONE_TO_ISO3 = {
 }
 
 
+@uses_columns("adequacy", "study_zone", "target_year", "lole", "ens")
 def plot_adequacy_europe_map(
-    df: pd.DataFrame,
+    df: pd.DataFrame | TableIndex,
     config: Config,
     metric: str = "lole",
     target_year: int | None = None,
@@ -264,12 +419,10 @@ def plot_adequacy_europe_map(
         if output_path:
             _write_html(fig, output_path, config)
         return fig
-    work = df.copy()
-    if target_year is not None and "target_year" in work.columns:
-        work = work[work["target_year"] == target_year]
-    work["country_iso3"] = work["study_zone"].map(ZONE_TO_ISO3)
+    work = select(df, target_year=target_year)
+    work = work.assign(country_iso3=work["study_zone"].map(ZONE_TO_ISO3))
     work = work.dropna(subset=["country_iso3"])
-    agg = work.groupby("country_iso3", as_index=False)[metric].mean()
+    agg = work.groupby("country_iso3", as_index=False, observed=True)[metric].mean()
     agg = agg.rename(columns={"country_iso3": "iso3", metric: "value"})
     fig = px.choropleth(
         agg,
@@ -295,14 +448,16 @@ def plot_adequacy_europe_map(
 # --- Dispatch (Generation) ---
 
 
+@uses_columns("dispatch", "study_zone", "target_year", "technology", "datetime", "generation_mw")
 def plot_dispatch_timeseries(
-    df: pd.DataFrame,
+    df: pd.DataFrame | RunCube | TableIndex,
     config: Config,
     study_zone: str | None = None,
     target_year: int | None = None,
     output_path: Path | None = None,
 ) -> go.Figure:
     """Zeitreihe: Erzeugung pro Technologie (aggregiert über Samples/Klimajahre oder gefiltert)."""
+    df = _as_frame(df)
     if df.empty or "generation_mw" not in df.columns:
         fig = go.Figure()
         fig.add_annotation(text="No dispatch data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
@@ -310,29 +465,19 @@ def plot_dispatch_timeseries(
             _write_html(fig, output_path, config)
         return fig
 
-    work = df.copy()
-    if study_zone:
-        work = work[work["study_zone"] == study_zone]
-    if target_year is not None:
-        work = work[work["target_year"] == target_year]
+    work = select(df, target_year=target_year, study_zone=study_zone or None)
 
     # Aggregation über climate_year und sample_id → Mittel
     group_cols = ["datetime", "technology"]
     if "study_zone" in work.columns and work["study_zone"].nunique() > 1:
         group_cols.insert(0, "study_zone")
-    agg = work.groupby(group_cols, as_index=False)["generation_mw"].mean()
-
-    if "datetime" in agg.columns:
-        try:
-            agg["datetime"] = pd.to_datetime(agg["datetime"])
-        except Exception:
-            pass
-        x = agg["datetime"]
-    else:
-        x = agg.index
+    agg = work.groupby(group_cols, as_index=False, observed=True)["generation_mw"].mean()
+    by = [c for c in group_cols if c != "datetime"]
+    agg = _downsample_traces(agg, "generation_mw", by, config)
 
     fig = px.line(
         agg,
+        render_mode=_render_mode(len(agg), config),
         x="datetime",
         y="generation_mw",
         color="technology",
@@ -346,14 +491,16 @@ def plot_dispatch_timeseries(
     return fig
 
 
+@uses_columns("dispatch", "study_zone", "target_year", "technology", "datetime", "generation_mw")
 def plot_dispatch_heatmap(
-    df: pd.DataFrame,
+    df: pd.DataFrame | RunCube | TableIndex,
     config: Config,
     study_zone: str,
     target_year: int,
     output_path: Path | None = None,
 ) -> go.Figure:
     """Heatmap: Generation (MW) Technologie × Zeit (downsampled wenn nötig)."""
+    df = _as_frame(df)
     if df.empty or "generation_mw" not in df.columns:
         fig = go.Figure()
         fig.add_annotation(text="No dispatch data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
@@ -361,24 +508,17 @@ def plot_dispatch_heatmap(
             _write_html(fig, output_path, config)
         return fig
 
-    work = df[(df["study_zone"] == study_zone) & (df["target_year"] == target_year)].copy()
-    work = work.groupby(["technology", "datetime"], as_index=False)["generation_mw"].mean()
-
-    max_ts = config.visualization.heatmap_max_timesteps
-    if work["datetime"].nunique() > max_ts:
-        work["datetime"] = pd.to_datetime(work["datetime"], errors="coerce")
-        if work["datetime"].isna().all():
-            work = work.iloc[: max_ts * work["technology"].nunique()]
-        else:
-            work = work.sort_values("datetime").groupby("technology").apply(
-                lambda g: g.iloc[:: max(1, len(g) // max_ts)]
-            ).reset_index(drop=True)
-
+    work = select(df, target_year=target_year, study_zone=study_zone)
+    work = (
+        work.groupby(["technology", "datetime"], as_index=False, observed=True)["generation_mw"]
+        .mean()
+    )
     pivot = work.pivot(index="technology", columns="datetime", values="generation_mw").fillna(0)
+    z, x = _time_heatmap(pivot, config)
     fig = go.Figure(
         data=go.Heatmap(
-            z=pivot.values,
-            x=[str(x) for x in pivot.columns],
+            z=z,
+            x=x,
             y=pivot.index.tolist(),
             colorscale="Blues",
             colorbar=dict(title="Generation [MW]"),
@@ -398,21 +538,34 @@ def plot_dispatch_heatmap(
 
 
 def _add_hour_month(df: pd.DataFrame, datetime_col: str = "datetime") -> pd.DataFrame:
-    """Fügt Spalten hour (0–23) und month (1–12) aus datetime hinzu."""
-    if datetime_col not in df.columns:
+    """Stellt Spalten hour (0–23) und month (1–12) sicher."""
+    if "hour" in df.columns and "month" in df.columns:
         return df
-    out = df.copy()
-    try:
-        dt = pd.to_datetime(out[datetime_col], errors="coerce")
-        out["hour"] = dt.dt.hour
-        out["month"] = dt.dt.month
-    except Exception:
-        pass
-    return out
+    return normalize_time(df, datetime_col)
+
 
+def _hour_month_pivot(
+    df: pd.DataFrame | TableIndex | HourMonthProfile, table: str, value: str, **selection
+) -> pd.DataFrame | None:
+    """Stunde×Monat-Mittel (Index 0–23, Spalten 1–12); None, wenn hour/month fehlen."""
+    if isinstance(df, HourMonthProfile):
+        return df.pivot(**selection)
+    work = _add_hour_month(select(df, **selection))
+    if "hour" not in work.columns or "month" not in work.columns:
+        return None
+    return HourMonthProfile.from_long(work, value, PROFILE_DIMS[table]).pivot(**selection)
 
+
+def _selection_label(value) -> str:
+    return ", ".join(map(str, value)) if isinstance(value, (list, tuple, set)) else str(value)
+
+
+@uses_columns(
+    "dispatch", "study_zone", "target_year", "technology", "datetime", "hour", "month",
+    "generation_mw",
+)
 def plot_dispatch_heatmap_hour_month(
-    df: pd.DataFrame,
+    df: pd.DataFrame | RunCube | TableIndex | HourMonthProfile,
     config: Config,
     study_zone: str,
     target_year: int,
@@ -420,25 +573,23 @@ def plot_dispatch_heatmap_hour_month(
     output_path: Path | None = None,
 ) -> go.Figure:
     """Heatmap: Erzeugung [MW] nach Stunde (0–23) × Monat (1–12)."""
-    if df.empty or "generation_mw" not in df.columns:
+    df = _as_frame(df)
+    if not isinstance(df, HourMonthProfile) and (df.empty or "generation_mw" not in df.columns):
         fig = go.Figure()
         fig.add_annotation(text="No dispatch data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
         if output_path:
             _write_html(fig, output_path, config)
         return fig
-    work = df[(df["study_zone"] == study_zone) & (df["target_year"] == target_year)].copy()
-    work = _add_hour_month(work)
-    if "month" not in work.columns or "hour" not in work.columns:
+    pivot = _hour_month_pivot(
+        df, "dispatch", "generation_mw",
+        study_zone=study_zone, target_year=target_year, technology=technology or None,
+    )
+    if pivot is None:
         fig = go.Figure()
         fig.add_annotation(text="Could not parse datetime for hour/month", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
         if output_path:
             _write_html(fig, output_path, config)
         return fig
-    if technology:
-        work = work[work["technology"] == technology]
-    agg = work.groupby(["hour", "month"], as_index=False)["generation_mw"].mean()
-    pivot = agg.pivot(index="hour", columns="month", values="generation_mw").fillna(0)
-    pivot = pivot.reindex(index=range(24), columns=range(1, 13)).fillna(0)
     fig = go.Figure(
         data=go.Heatmap(
             z=pivot.values,
@@ -464,13 +615,15 @@ def plot_dispatch_heatmap_hour_month(
 # --- Net Position ---
 
 
+@uses_columns("net_position", "study_zone", "target_year", "datetime", "net_position_mw")
 def plot_net_position_timeseries(
-    df: pd.DataFrame,
+    df: pd.DataFrame | RunCube | TableIndex,
     config: Config,
     target_year: int | None = None,
     output_path: Path | None = None,
 ) -> go.Figure:
     """Zeitreihe Net Position (Mittel über Samples) pro Study Zone."""
+    df = _as_frame(df)
     if df.empty or "net_position_mw" not in df.columns:
         fig = go.Figure()
         fig.add_annotation(text="No net position data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
@@ -478,17 +631,16 @@ def plot_net_position_timeseries(
             _write_html(fig, output_path, config)
         return fig
 
-    work = df.copy()
-    if target_year is not None:
-        work = work[work["target_year"] == target_year]
-    agg = work.groupby(["datetime", "study_zone"], as_index=False)["net_position_mw"].mean()
-    try:
-        agg["datetime"] = pd.to_datetime(agg["datetime"])
-    except Exception:
-        pass
+    work = select(df, target_year=target_year)
+    agg = (
+        work.groupby(["datetime", "study_zone"], as_index=False, observed=True)["net_position_mw"]
+        .mean()
+    )
+    agg = _downsample_traces(agg, "net_position_mw", ["study_zone"], config)
 
     fig = px.line(
         agg,
+        render_mode=_render_mode(len(agg), config),
         x="datetime",
         y="net_position_mw",
         color="study_zone",
@@ -501,13 +653,15 @@ def plot_net_position_timeseries(
     return fig
 
 
+@uses_columns("net_position", "study_zone", "target_year", "datetime", "net_position_mw")
 def plot_net_position_heatmap(
-    df: pd.DataFrame,
+    df: pd.DataFrame | RunCube | TableIndex,
     config: Config,
     target_year: int,
     output_path: Path | None = None,
 ) -> go.Figure:
     """Heatmap: Net Position Zone × Zeit (Mittel über Samples)."""
+    df = _as_frame(df)
     if df.empty or "net_position_mw" not in df.columns:
         fig = go.Figure()
         fig.add_annotation(text="No net position data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
@@ -515,18 +669,17 @@ def plot_net_position_heatmap(
             _write_html(fig, output_path, config)
         return fig
 
-    work = df[df["target_year"] == target_year].copy()
-    agg = work.groupby(["study_zone", "datetime"], as_index=False)["net_position_mw"].mean()
-    max_ts = config.visualization.heatmap_max_timesteps
-    if agg["datetime"].nunique() > max_ts:
-        agg = agg.sort_values("datetime").groupby("study_zone").apply(
-            lambda g: g.iloc[:: max(1, len(g) // max_ts)]
-        ).reset_index(drop=True)
+    work = select(df, target_year=target_year)
+    agg = (
+        work.groupby(["study_zone", "datetime"], as_index=False, observed=True)["net_position_mw"]
+        .mean()
+    )
     pivot = agg.pivot(index="study_zone", columns="datetime", values="net_position_mw").fillna(0)
+    z, x = _time_heatmap(pivot, config)
     fig = go.Figure(
         data=go.Heatmap(
-            z=pivot.values,
-            x=[str(x) for x in pivot.columns],
+            z=z,
+            x=x,
             y=pivot.index.tolist(),
             colorscale="RdBu",
             zmid=0,
@@ -546,31 +699,33 @@ def plot_net_position_heatmap(
     return fig
 
 
+@uses_columns(
+    "net_position", "study_zone", "target_year", "datetime", "hour", "month", "net_position_mw"
+)
 def plot_net_position_heatmap_hour_month(
-    df: pd.DataFrame,
+    df: pd.DataFrame | RunCube | TableIndex | HourMonthProfile,
     config: Config,
     study_zone: str,
     target_year: int,
     output_path: Path | None = None,
 ) -> go.Figure:
     """Heatmap: Net Position [MW] nach Stunde × Monat."""
-    if df.empty or "net_position_mw" not in df.columns:
+    df = _as_frame(df)
+    if not isinstance(df, HourMonthProfile) and (df.empty or "net_position_mw" not in df.columns):
         fig = go.Figure()
         fig.add_annotation(text="No net position data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
         if output_path:
             _write_html(fig, output_path, config)
         return fig
-    work = df[(df["study_zone"] == study_zone) & (df["target_year"] == target_year)].copy()
-    work = _add_hour_month(work)
-    if "month" not in work.columns or "hour" not in work.columns:
+    pivot = _hour_month_pivot(
+        df, "net_position", "net_position_mw", study_zone=study_zone, target_year=target_year
+    )
+    if pivot is None:
         fig = go.Figure()
         fig.add_annotation(text="Could not parse datetime", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
         if output_path:
             _write_html(fig, output_path, config)
         return fig
-    agg = work.groupby(["hour", "month"], as_index=False)["net_position_mw"].mean()
-    pivot = agg.pivot(index="hour", columns="month", values="net_position_mw").fillna(0)
-    pivot = pivot.reindex(index=range(24), columns=range(1, 13)).fillna(0)
     fig = go.Figure(
         data=go.Heatmap(
             z=pivot.values,
@@ -597,14 +752,16 @@ def plot_net_position_heatmap_hour_month(
 # --- Prices ---
 
 
+@uses_columns("prices", "study_zone", "target_year", "datetime", "price_eur_mwh")
 def plot_prices_timeseries(
-    df: pd.DataFrame,
+    df: pd.DataFrame | RunCube | TableIndex,
     config: Config,
     study_zone: str | None = None,
     target_year: int | None = None,
     output_path: Path | None = None,
 ) -> go.Figure:
     """Zeitreihe Preise [€/MWh] (Mittel über Samples)."""
+    df = _as_frame(df)
     if df.empty or "price_eur_mwh" not in df.columns:
         fig = go.Figure()
         fig.add_annotation(text="No price data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
@@ -612,19 +769,16 @@ def plot_prices_timeseries(
             _write_html(fig, output_path, config)
         return fig
 
-    work = df.copy()
-    if study_zone:
-        work = work[work["study_zone"] == study_zone]
-    if target_year is not None:
-        work = work[work["target_year"] == target_year]
-    agg = work.groupby(["datetime", "study_zone"], as_index=False)["price_eur_mwh"].mean()
-    try:
-        agg["datetime"] = pd.to_datetime(agg["datetime"])
-    except Exception:
-        pass
+    work = select(df, target_year=target_year, study_zone=study_zone or None)
+    agg = (
+        work.groupby(["datetime", "study_zone"], as_index=False, observed=True)["price_eur_mwh"]
+        .mean()
+    )
+    agg = _downsample_traces(agg, "price_eur_mwh", ["study_zone"], config)
 
     fig = px.line(
         agg,
+        render_mode=_render_mode(len(agg), config),
         x="datetime",
         y="price_eur_mwh",
         color="study_zone",
@@ -637,28 +791,37 @@ def plot_prices_timeseries(
     return fig
 
 
+@uses_columns("prices", "study_zone", "target_year", "price_eur_mwh")
 def plot_prices_boxplot(
-    df: pd.DataFrame,
+    df: pd.DataFrame | RunCube | TableIndex | SketchSet,
     config: Config,
     target_year: int | None = None,
     output_path: Path | None = None,
 ) -> go.Figure:
-    """Boxplot Preise pro Zone und ggf. Target Year."""
-    if df.empty or "price_eur_mwh" not in df.columns:
+    """
+    Boxplot Preise pro Zone und ggf. Target Year (SketchSet: Verteilung über alle Läufe beim
+    Streaming).
+    """
+    df = _as_frame(df, reduce_runs=False)
+    if _no_values(df, "price_eur_mwh"):
         fig = go.Figure()
         fig.add_annotation(text="No price data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
         if output_path:
             _write_html(fig, output_path, config)
         return fig
 
-    work = df.copy()
-    if target_year is not None:
-        work = work[work["target_year"] == target_year]
-    fig = px.box(
+    if isinstance(df, SketchSet):
+        work = df.select(target_year=target_year)
+        several_years = len(work.labels("target_year")) > 1
+    else:
+        work = select(df, target_year=target_year)
+        several_years = "target_year" in work.columns and work["target_year"].nunique() > 1
+    fig = _boxplot(
         work,
+        config,
         x="study_zone",
         y="price_eur_mwh",
-        color="target_year" if "target_year" in work.columns and work["target_year"].nunique() > 1 else None,
+        color="target_year" if several_years else None,
         title=f"Price Distribution by Zone — TY {target_year or 'All'}",
         labels={"price_eur_mwh": "Price [€/MWh]", "study_zone": "Study Zone"},
     )
@@ -669,31 +832,31 @@ def plot_prices_boxplot(
     return fig
 
 
+@uses_columns("prices", "study_zone", "target_year", "datetime", "hour", "month", "price_eur_mwh")
 def plot_prices_heatmap_hour_month(
-    df: pd.DataFrame,
+    df: pd.DataFrame | RunCube | TableIndex | HourMonthProfile,
     config: Config,
     study_zone: str,
     target_year: int,
     output_path: Path | None = None,
 ) -> go.Figure:
     """Heatmap: Preis [€/MWh] nach Stunde × Monat."""
-    if df.empty or "price_eur_mwh" not in df.columns:
+    df = _as_frame(df)
+    if not isinstance(df, HourMonthProfile) and (df.empty or "price_eur_mwh" not in df.columns):
         fig = go.Figure()
         fig.add_annotation(text="No price data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
         if output_path:
             _write_html(fig, output_path, config)
         return fig
-    work = df[(df["study_zone"] == study_zone) & (df["target_year"] == target_year)].copy()
-    work = _add_hour_month(work)
-    if "month" not in work.columns or "hour" not in work.columns:
+    pivot = _hour_month_pivot(
+        df, "prices", "price_eur_mwh", study_zone=study_zone, target_year=target_year
+    )
+    if pivot is None:
         fig = go.Figure()
         fig.add_annotation(text="Could not parse datetime", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
         if output_path:
             _write_html(fig, output_path, config)
         return fig
-    agg = work.groupby(["hour", "month"], as_index=False)["price_eur_mwh"].mean()
-    pivot = agg.pivot(index="hour", columns="month", values="price_eur_mwh").fillna(0)
-    pivot = pivot.reindex(index=range(24), columns=range(1, 13)).fillna(0)
     fig = go.Figure(
         data=go.Heatmap(
             z=pivot.values,
@@ -719,8 +882,11 @@ def plot_prices_heatmap_hour_month(
 # --- Storage ---
 
 
+@uses_columns(
+    "storage", "study_zone", "target_year", "storage_type", "datetime", "level_pct", "level_mwh"
+)
 def plot_storage_level_timeseries(
-    df: pd.DataFrame,
+    df: pd.DataFrame | RunCube | TableIndex,
     config: Config,
     study_zone: str | None = None,
     storage_type: str | None = None,
@@ -728,6 +894,7 @@ def plot_storage_level_timeseries(
     output_path: Path | None = None,
 ) -> go.Figure:
     """Zeitreihe Speicherfüllstand (level_pct oder level_mwh)."""
+    df = _as_frame(df)
     if df.empty:
         fig = go.Figure()
         fig.add_annotation(text="No storage data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
@@ -743,22 +910,20 @@ def plot_storage_level_timeseries(
             _write_html(fig, output_path, config)
         return fig
 
-    work = df.copy()
-    if study_zone:
-        work = work[work["study_zone"] == study_zone]
-    if storage_type:
-        work = work[work["storage_type"] == storage_type]
-    if target_year is not None:
-        work = work[work["target_year"] == target_year]
-    agg = work.groupby(["datetime", "study_zone", "storage_type"], as_index=False)[y_col].mean()
-    try:
-        agg["datetime"] = pd.to_datetime(agg["datetime"])
-    except Exception:
-        pass
-    agg["series"] = agg["study_zone"] + " — " + agg["storage_type"]
+    work = select(
+        df,
+        target_year=target_year,
+        study_zone=study_zone or None,
+        storage_type=storage_type or None,
+    )
+    keys = ["datetime", "study_zone", "storage_type"]
+    agg = work.groupby(keys, as_index=False, observed=True)[y_col].mean()
+    agg = _downsample_traces(agg, y_col, ["study_zone", "storage_type"], config)
+    agg["series"] = agg["study_zone"].astype(str) + " — " + agg["storage_type"].astype(str)
 
     fig = px.line(
         agg,
+        render_mode=_render_mode(len(agg), config),
         x="datetime",
         y=y_col,
         color="series",
@@ -771,53 +936,101 @@ def plot_storage_level_timeseries(
     return fig
 
 
-def run_all_plots(dataset: "ERAADataset", config: Config) -> list[Path]:
-    """Führt alle verfügbaren Plots aus und gibt die gespeicherten HTML-Pfade zurück."""
-    written: list[Path] = []
+# Plot-Funktionen, die run_all_plots aufruft (Spaltenprojektion der Pipeline)
+PIPELINE_PLOTS = (
+    plot_adequacy_lole_boxplot,
+    plot_adequacy_ens_boxplot,
+    plot_adequacy_lole_heatmap,
+    plot_dispatch_timeseries,
+    plot_dispatch_heatmap,
+    plot_net_position_timeseries,
+    plot_net_position_heatmap,
+    plot_prices_timeseries,
+    plot_prices_boxplot,
+    plot_storage_level_timeseries,
+)
+
+
+def plot_tasks(dataset: ERAADataset, config: Config) -> list[PlotTask]:
+    """Alle verfügbaren Plots als Aufgaben mit festem Ausgabepfad."""
+    tasks: list[PlotTask] = []
+
+    def add(func: Callable, data, category: str, filename: str, *args) -> None:
+        tasks.append(PlotTask(func, data, config.output_path(category, filename), args))
 
     if dataset.adequacy is not None and not dataset.adequacy.empty:
-        p = config.output_path("adequacy", "adequacy_lole_boxplot.html")
-        plot_adequacy_lole_boxplot(dataset.adequacy, config, p)
-        written.append(p)
-        p = config.output_path("adequacy", "adequacy_ens_boxplot.html")
-        plot_adequacy_ens_boxplot(dataset.adequacy, config, p)
-        written.append(p)
-        p = config.output_path("adequacy", "adequacy_lole_heatmap.html")
-        plot_adequacy_lole_heatmap(dataset.adequacy, config, p)
-        written.append(p)
+        add(plot_adequacy_lole_boxplot, dataset.adequacy, "adequacy", "adequacy_lole_boxplot.html")
+        add(plot_adequacy_ens_boxplot, dataset.adequacy, "adequacy", "adequacy_ens_boxplot.html")
+        add(plot_adequacy_lole_heatmap, dataset.adequacy, "adequacy", "adequacy_lole_heatmap.html")
 
+    # Zeitreihen-Plots teilen sich ein Sample-Mittel pro Tabelle (einmal berechnet)
     if dataset.dispatch is not None and not dataset.dispatch.empty:
-        p = config.output_path("dispatch", "dispatch_timeseries_mean.html")
-        plot_dispatch_timeseries(dataset.dispatch, config, output_path=p)
-        written.append(p)
-        zones = dataset.dispatch["study_zone"].unique()[:3]
-        years = dataset.dispatch["target_year"].unique()
+        dispatch = dataset.run_mean("dispatch")
+        add(plot_dispatch_timeseries, dispatch, "dispatch", "dispatch_timeseries_mean.html")
+        zones = dispatch["study_zone"].unique()[:3]
+        years = dispatch["target_year"].unique()
+        # Sortierte Sicht: jede Zone × Jahr-Auswahl ist ein Slice statt einer Maske über die Tabelle
+        dispatch_index = dataset.index("dispatch", mean=True)
         for sz in zones:
             for ty in years:
-                p = config.output_path("dispatch", f"dispatch_heatmap_{sz}_TY{ty}.html")
-                plot_dispatch_heatmap(dataset.dispatch, config, sz, int(ty), p)
-                written.append(p)
+                part = dispatch_index.select(study_zone=sz, target_year=ty)
+                filename = f"dispatch_heatmap_{sz}_TY{ty}.html"
+                add(plot_dispatch_heatmap, part, "dispatch", filename, sz, int(ty))
 
     if dataset.net_position is not None and not dataset.net_position.empty:
-        p = config.output_path("net_position", "net_position_timeseries.html")
-        plot_net_position_timeseries(dataset.net_position, config, output_path=p)
-        written.append(p)
-        for ty in dataset.net_position["target_year"].unique():
-            p = config.output_path("net_position", f"net_position_heatmap_TY{ty}.html")
-            plot_net_position_heatmap(dataset.net_position, config, int(ty), p)
-            written.append(p)
+        net_position = dataset.run_mean("net_position")
+        add(
+            plot_net_position_timeseries, net_position, "net_position",
+            "net_position_timeseries.html",
+        )
+        net_position_index = dataset.index("net_position", mean=True)
+        for ty in net_position["target_year"].unique():
+            part = net_position_index.select(target_year=ty)
+            filename = f"net_position_heatmap_TY{ty}.html"
+            add(plot_net_position_heatmap, part, "net_position", filename, int(ty))
 
     if dataset.prices is not None and not dataset.prices.empty:
-        p = config.output_path("prices", "prices_timeseries.html")
-        plot_prices_timeseries(dataset.prices, config, output_path=p)
-        written.append(p)
-        p = config.output_path("prices", "prices_boxplot.html")
-        plot_prices_boxplot(dataset.prices, config, output_path=p)
-        written.append(p)
+        add(plot_prices_timeseries, dataset.run_mean("prices"), "prices", "prices_timeseries.html")
+        # Boxplot zeigt die Verteilung über die Läufe → Rohdaten;
+        # beim Streaming sind die Preise nur noch Sample-Mittel, die Verteilung steckt im Sketch
+        prices = dataset.sketches.get("prices", dataset.prices)
+        add(plot_prices_boxplot, prices, "prices", "prices_boxplot.html")
 
     if dataset.storage is not None and not dataset.storage.empty:
-        p = config.output_path("storage", "storage_level_timeseries.html")
-        plot_storage_level_timeseries(dataset.storage, config, output_path=p)
-        written.append(p)
+        add(
+            plot_storage_level_timeseries, dataset.run_mean("storage"), "storage",
+            "storage_level_timeseries.html",
+        )
 
+    return tasks
+
+
+def run_all_plots(
+    dataset: ERAADataset, config: Config, jobs: int | None = None, force: bool = False
+) -> list[Path]:
+    """
+    Erzeugt alle veralteten Plots und schreibt manifest.json.
+
+    Args:
+        jobs: Prozesse zum Rendern (Standard: visualization.jobs).
+        force: Alle Plots neu bauen, auch bei unverändertem Fingerprint.
+
+    Returns:
+        Liste der aktuellen HTML-Dateipfade (fehlgeschlagene Plots fehlen).
+    """
+    jobs = config.visualization.jobs if jobs is None else jobs
+    results = render_tasks(plot_tasks(dataset, config), config, jobs, force=force)
+    done = [r for r in results if r.ok]
+    build = {
+        "rebuilt": sum(not r.skipped for r in done),
+        "skipped": sum(r.skipped for r in done),
+        "failed": len(results) - len(done),
+    }
+    written = [r.path for r in done]
+    manifest = write_manifest(written, config, {r.path: r.fingerprint for r in done}, build)
+    logger.info(
+        "%d file(s) rebuilt, %d skipped, %d failed; %d bytes (%d bytes saved)",
+        build["rebuilt"], build["skipped"], build["failed"],
+        manifest["total_bytes"], manifest["bytes_saved"],
+    )
     return written
@@ -0,0 +1,159 @@
+"""
+Plot-Aufgaben und ihre (parallele) Ausführung.
+
+Figurenaufbau und HTML-Serialisierung sind CPU-gebunden; unabhängige Plots laufen deshalb in einem
+Prozess-Pool. Jede Aufgabe trägt nur ihren Datenausschnitt (Zone × Zieljahr, nur die deklarierten
+Spalten) – nicht den ganzen Datensatz – und einen festen Ausgabepfad. Fehler werden pro Aufgabe als
+`RenderResult` gesammelt, statt den Lauf abzubrechen.
+
+Inkrementeller Neubau: Der Fingerprint einer Aufgabe deckt ihren Datenausschnitt, die
+Konfigurationsabschnitte `visualization` und `schema`, die Version der Plot-Funktion (und des
+Pakets) sowie die Aufrufparameter ab. Aufgaben, deren Fingerprint mit dem in manifest.json
+übereinstimmt und deren Ausgabe noch existiert, werden übersprungen.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+import pandas as pd
+
+from . import __version__
+from .config import Config
+from .index import TableIndex
+from .report import ensure_plotlyjs, manifest_key, read_manifest
+from .sketch import SketchSet
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PlotTask:
+    """
+    Aufruf `func(data, config, *args, output_path=path)`; `data` ist bereits auf die Spalten von
+    `func` projiziert.
+    """
+
+    func: Callable
+    data: Any
+    path: Path
+    args: tuple = ()
+
+    def __post_init__(self) -> None:
+        columns = getattr(self.func, "columns", None)
+        if columns and isinstance(self.data, pd.DataFrame):
+            keep = [c for c in self.data.columns if c in columns]
+            if len(keep) < len(self.data.columns):
+                self.data = self.data[keep]
+
+
+@dataclass
+class RenderResult:
+    path: Path
+    seconds: float = 0.0
+    error: str | None = None
+    fingerprint: str | None = None
+    skipped: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _data_digest(data: Any, config: Config) -> bytes | None:
+    """Inhalts-Hash des Datenausschnitts (None = nicht hashbar → Aufgabe immer neu bauen)."""
+    if isinstance(data, TableIndex):
+        data = data.frame
+    if isinstance(data, SketchSet):
+        # Gezeichnet werden nur die Kennwerte; sie hängen nur von den Werten ab, nicht von Seed
+        # oder Blockung beim Laden
+        data = data.box_stats(config.visualization.boxplot_percentiles)
+    if not isinstance(data, pd.DataFrame):
+        return None
+    h = hashlib.sha256(repr([(str(c), str(t)) for c, t in data.dtypes.items()]).encode())
+    h.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+    return h.digest()
+
+
+def task_fingerprint(task: PlotTask, config: Config) -> str | None:
+    """Fingerprint aus Daten, Konfiguration (visualization, schema), Plot-Version und Parametern."""
+    digest = _data_digest(task.data, config)
+    if digest is None:
+        return None
+    h = hashlib.sha256(digest)
+    version = getattr(task.func, "version", 1)
+    func = f"{task.func.__module__}.{task.func.__qualname__}:{version}:{__version__}"
+    for part in (
+        func,
+        repr(task.args),
+        manifest_key(task.path, config),
+        config.visualization.model_dump_json(),
+        config.schema.model_dump_json(),
+    ):
+        h.update(part.encode())
+    return h.hexdigest()
+
+
+def _up_to_date(
+    task: PlotTask, fingerprint: str | None, previous: dict[str, str], config: Config
+) -> bool:
+    if fingerprint is None or previous.get(manifest_key(task.path, config)) != fingerprint:
+        return False
+    outputs = [task.path] + ([Path(f"{task.path}.gz")] if config.visualization.html.gzip else [])
+    return all(p.exists() for p in outputs)
+
+
+def _render(task: PlotTask, config: Config) -> RenderResult:
+    """Eine Aufgabe ausführen (auch im Worker-Prozess); Ausnahmen werden zum Ergebnis."""
+    t0 = time.perf_counter()
+    try:
+        task.func(task.data, config, *task.args, output_path=task.path)
+    except Exception as exc:  # noqa: BLE001 – pro Aufgabe sammeln, Lauf fortsetzen
+        return RenderResult(task.path, time.perf_counter() - t0, f"{type(exc).__name__}: {exc}")
+    return RenderResult(task.path, time.perf_counter() - t0)
+
+
+def render_tasks(
+    tasks: list[PlotTask], config: Config, jobs: int = 1, force: bool = False
+) -> list[RenderResult]:
+    """
+    Veraltete Aufgaben nacheinander (jobs <= 1) oder im Prozess-Pool ausführen.
+
+    Aufgaben mit unverändertem Fingerprint (laut manifest.json) werden übersprungen, außer mit
+    `force`. Ergebnisse kommen in Aufgabenreihenfolge zurück; die Ausgabepfade stehen vorab fest.
+    """
+    if config.visualization.html.mode == "report":
+        # Gemeinsames plotly.js vorab schreiben, damit die Worker nicht um die Datei konkurrieren
+        ensure_plotlyjs(config)
+    files = [] if force else read_manifest(config).get("files", [])
+    previous = {f["path"]: f.get("fingerprint") for f in files if "path" in f}
+    fingerprints = [task_fingerprint(task, config) for task in tasks]
+    results: list[RenderResult | None] = [
+        RenderResult(task.path, fingerprint=fp, skipped=True)
+        if _up_to_date(task, fp, previous, config)
+        else None
+        for task, fp in zip(tasks, fingerprints)
+    ]
+    stale = [i for i, r in enumerate(results) if r is None]
+    t0 = time.perf_counter()
+    if jobs <= 1 or len(stale) <= 1:
+        rendered = [_render(tasks[i], config) for i in stale]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(stale))) as pool:
+            rendered = list(pool.map(_render, [tasks[i] for i in stale], [config] * len(stale)))
+    for i, result in zip(stale, rendered):
+        result.fingerprint = fingerprints[i]
+        results[i] = result
+        if not result.ok:
+            logger.error("Failed %s: %s", result.path, result.error)
+    logger.info(
+        "Rendered %d plot(s) in %.2f s (jobs=%d), %d up to date",
+        len(stale), time.perf_counter() - t0, jobs, len(tasks) - len(stale),
+    )
+    return results
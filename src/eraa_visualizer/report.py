@@ -0,0 +1,167 @@
+"""
+HTML-Ausgabe der Plots und Manifest eines Laufs.
+
+Im Modus `standalone` enthält jede Datei das plotly.js-Bundle (ca. 4–5 MB) und ist für sich
+lauffähig. Im Modus `report` liegt plotly.js einmal als `plotly.min.js` im Ausgabeverzeichnis und
+jede Datei verweist relativ darauf; Zeitachsen werden als Typed Arrays (Epoch-ms) statt als
+ISO-Strings eingebettet. Optional entstehen vorkomprimierte `.html.gz` für Webserver.
+`manifest.json` im Ausgabeverzeichnis listet alle Dateien mit Größen, Fingerprint (für den
+inkrementellen Neubau, siehe render.py) und der Ersparnis.
+"""
+
+from __future__ import annotations
+
+import functools
+import gzip
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import plotly.graph_objects as go
+from plotly.offline import get_plotlyjs
+
+from .config import Config
+
+PLOTLYJS_NAME = "plotly.min.js"
+MANIFEST_NAME = "manifest.json"
+
+_FIGURE_CONFIG = dict(displayModeBar=True, responsive=True)
+
+
+def compact_figure(fig: go.Figure) -> go.Figure:
+    """
+    Zeitachsen (datetime64) → Millisekunden seit Epoche, Zahlenlisten → NumPy-Arrays.
+
+    plotly serialisiert NumPy-Zahlen als base64-Typed-Arrays (`bdata`), Datumswerte dagegen als
+    ISO-Strings; als Zahlen auf einer `date`-Achse sind sie etwa dreimal kleiner. Liefert eine
+    Kopie: die übergebene Figur (z.B. aus dem Figuren-Cache) bleibt unverändert.
+    """
+    fig = go.Figure(fig)
+    for trace in fig.data:
+        for attr in ("x", "y"):
+            value = trace[attr] if attr in trace else None
+            if value is None or isinstance(value, str):
+                continue
+            arr = np.asarray(value)
+            if arr.dtype.kind == "M":
+                trace[attr] = arr.astype("datetime64[ms]").astype("int64").astype("float64")
+                axis = (trace[f"{attr}axis"] or attr).replace(attr, f"{attr}axis", 1)
+                fig.layout[axis].type = "date"
+            elif arr.dtype.kind in "iuf" and not isinstance(value, np.ndarray):
+                trace[attr] = arr
+    return fig
+
+
+def plotlyjs_path(config: Config) -> Path:
+    return Path(config.paths.output_dir) / PLOTLYJS_NAME
+
+
+@functools.lru_cache(maxsize=1)
+def _plotlyjs_bundle() -> bytes:
+    return get_plotlyjs().encode("utf-8")
+
+
+# Ausgabeverzeichnisse, deren plotly.js in diesem Prozess schon geprüft wurde
+_CHECKED_PLOTLYJS: set[Path] = set()
+
+
+def ensure_plotlyjs(config: Config) -> Path:
+    """
+    plotly.js einmal ins Ausgabeverzeichnis schreiben (überschrieben nur bei anderem Inhalt).
+
+    Geprüft wird einmal pro Verzeichnis und Prozess; danach genügt, dass die Datei noch existiert.
+    """
+    path = plotlyjs_path(config)
+    key = path.resolve()
+    if key in _CHECKED_PLOTLYJS and path.exists():
+        return path
+    bundle = _plotlyjs_bundle()
+    # Inhalt statt Größe vergleichen: Versionen gleicher Länge würden sonst nicht ersetzt
+    if not path.exists() or path.read_bytes() != bundle:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(bundle)
+    _CHECKED_PLOTLYJS.add(key)
+    return path
+
+
+def write_figure(fig: go.Figure, path: Path, config: Config) -> None:
+    """Figur gemäß visualization.html (mode, gzip) als HTML schreiben."""
+    html_config = config.visualization.html
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if html_config.mode == "report":
+        fig = compact_figure(fig)
+        bundle = os.path.relpath(ensure_plotlyjs(config), path.parent)
+        include_plotlyjs: bool | str = Path(bundle).as_posix()
+    else:
+        include_plotlyjs = html_config.include_plotlyjs
+    html = fig.to_html(
+        config=_FIGURE_CONFIG,
+        include_plotlyjs=include_plotlyjs,
+        full_html=html_config.full_html,
+    )
+    data = html.encode("utf-8")
+    path.write_bytes(data)
+    if html_config.gzip:
+        Path(f"{path}.gz").write_bytes(gzip.compress(data, compresslevel=6, mtime=0))
+
+
+def manifest_key(path: Path, config: Config) -> str:
+    """Pfad relativ zum Ausgabeverzeichnis, wie er im Manifest steht."""
+    return Path(os.path.relpath(path, config.paths.output_dir)).as_posix()
+
+
+def read_manifest(config: Config) -> dict:
+    """manifest.json des letzten Laufs ({} wenn nicht vorhanden oder unlesbar)."""
+    path = Path(config.paths.output_dir) / MANIFEST_NAME
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def write_manifest(
+    paths: list[Path],
+    config: Config,
+    fingerprints: dict[Path, str | None] | None = None,
+    build: dict[str, int] | None = None,
+) -> dict:
+    """
+    manifest.json schreiben: Dateien mit Größen, Summe und Ersparnis gegenüber eingebettetem
+    plotly.js.
+
+    `bytes_saved` = plotly.js, das im Modus report nicht in jede Datei eingebettet wird, abzüglich
+    der gemeinsamen Kopie, plus (mit gzip) die Differenz zwischen HTML und .html.gz.
+    `fingerprints` (pro Datei) und `build` (z.B. rebuilt/skipped/failed) werden mit abgelegt.
+    """
+    out_dir = Path(config.paths.output_dir)
+    html_config = config.visualization.html
+    fingerprints = fingerprints or {}
+    files = []
+    for path in paths:
+        entry = {"path": manifest_key(path, config), "bytes": path.stat().st_size}
+        if fingerprints.get(path):
+            entry["fingerprint"] = fingerprints[path]
+        gz = Path(f"{path}.gz")
+        if html_config.gzip and gz.exists():
+            entry["gzip_bytes"] = gz.stat().st_size
+        files.append(entry)
+    total = sum(f["bytes"] for f in files)
+    shared = plotlyjs_path(config)
+    manifest: dict = {"mode": html_config.mode, "files": files, "html_bytes": total}
+    saved = 0
+    if html_config.mode == "report" and shared.exists():
+        js_bytes = shared.stat().st_size
+        manifest["plotlyjs"] = {"path": PLOTLYJS_NAME, "bytes": js_bytes}
+        saved += js_bytes * (len(files) - 1)
+        total += js_bytes
+    if html_config.gzip:
+        manifest["gzip_bytes"] = sum(f.get("gzip_bytes", f["bytes"]) for f in files)
+        saved += manifest["html_bytes"] - manifest["gzip_bytes"]
+    manifest["total_bytes"] = total
+    manifest["bytes_saved"] = max(0, saved)
+    if build is not None:
+        manifest["build"] = build
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
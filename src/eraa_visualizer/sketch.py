@@ -0,0 +1,207 @@
+"""
+Mergebare Quantil-Sketches für Verteilungen, die nicht in den Speicher passen.
+
+Stündliche Preise über alle Klimajahre × Samples × Zonen lassen sich nicht vollständig laden.
+`QuantileSketch` (KLL-Verfahren) fasst beliebig viele Werte in O(k · log(n/k)) Speicher zusammen;
+Sketches aus verschiedenen Blöcken, Dateien oder Prozessen werden mit `merge()` vereinigt.
+`SketchSet` hält einen Sketch pro Gruppe (z.B. Zone × Zieljahr) und liefert Boxplot-Kennwerte.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+# Gruppen, für die je ein Sketch geführt wird
+SKETCH_KEYS = ("study_zone", "target_year")
+
+
+class QuantileSketch:
+    """
+    KLL-Sketch: Stufen von Kompaktoren, Elemente auf Stufe h haben Gewicht 2**h.
+
+    Läuft eine Stufe über, wird sie sortiert und jedes zweite Element (zufälliger Versatz) auf die
+    nächste Stufe befördert. Der Rangfehler liegt bei etwa 1.7/k; Minimum, Maximum und Anzahl
+    sind exakt. Der Versatz ist fest geseedet: dieselbe Eingabe ergibt dieselben Quantile.
+    """
+
+    def __init__(self, k: int = 200, seed: int = 0):
+        self.k = k
+        self.levels: list[np.ndarray] = [np.empty(0)]
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        # Obere Stufen voll (k), nach unten geometrisch kleiner (Faktor 2/3)
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values: Iterable[float] | np.ndarray) -> None:
+        values = np.asarray(values, dtype="float64").ravel()
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        self.count += len(values)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        # Stufe 0 als Puffer bis 8·k Werte füllen, erst dann kompaktieren: große Blöcke werden so
+        # in Stücken eingearbeitet (ein einziger Kaskaden-Durchlauf ließe nur wenige, schwere
+        # Elemente übrig), und das Ergebnis hängt nicht davon ab, wie die Eingabe in Blöcke
+        # geteilt ist
+        step = 8 * self.k
+        start = 0
+        while start < len(values):
+            stop = start + step - len(self.levels[0])
+            self.levels[0] = np.concatenate([self.levels[0], values[start:stop]])
+            start = stop
+            if len(self.levels[0]) >= step:
+                self._compress()
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        """Anderen Sketch hinzunehmen (in place); entspricht einem Sketch über beide Eingaben."""
+        if other.count == 0:
+            return self
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, items in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def _compress(self) -> None:
+        while True:
+            full = (h for h, items in enumerate(self.levels) if len(items) > self._capacity(h))
+            level = next(full, None)
+            if level is None:
+                return
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+            items = np.sort(self.levels[level])
+            # Bei ungerader Anzahl bleibt ein Element auf der Stufe
+            keep, items = (items[-1:], items[:-1]) if len(items) % 2 else (items[:0], items)
+            promoted = items[self._rng.integers(2)::2]
+            self.levels[level] = keep
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+
+    @property
+    def nbytes(self) -> int:
+        return sum(items.nbytes for items in self.levels)
+
+    def quantile(self, q: float | Iterable[float]) -> np.ndarray | float:
+        """Geschätzte Quantile (q in [0, 1]); exakt, solange noch nichts kompaktiert wurde."""
+        qs = np.atleast_1d(np.asarray(q, dtype="float64"))
+        if self.count == 0:
+            out = np.full(len(qs), np.nan)
+        elif len(self.levels) == 1:
+            out = np.quantile(self.levels[0], qs)
+        else:
+            items = np.concatenate(self.levels)
+            weights = np.concatenate([np.full(len(lv), 2.0**h) for h, lv in enumerate(self.levels)])
+            order = np.argsort(items, kind="stable")
+            items, weights = items[order], weights[order]
+            cum = np.cumsum(weights)
+            # Element, dessen Gewicht den Rang q · n überdeckt
+            # (keine Interpolation über große Lücken)
+            idx = np.searchsorted(cum, qs * cum[-1], side="left")
+            out = items[np.minimum(idx, len(items) - 1)]
+            out = np.where(qs <= 0, self.min, np.where(qs >= 1, self.max, out))
+        return float(out[0]) if np.isscalar(q) else out
+
+
+class SketchSet:
+    """Ein QuantileSketch pro Gruppe, z.B. (study_zone, target_year) → Sketch über price_eur_mwh."""
+
+    def __init__(self, value: str, keys: Iterable[str] = SKETCH_KEYS, k: int = 200):
+        self.value = value
+        self.keys = tuple(keys)
+        self.k = k
+        self.sketches: dict[tuple, QuantileSketch] = {}
+
+    def update(self, df: pd.DataFrame) -> None:
+        """Einen Block (kanonische Spaltennamen) einarbeiten."""
+        if df.empty or self.value not in df.columns:
+            return
+        values = df[self.value].to_numpy(dtype="float64", na_value=np.nan)
+        groups = df.groupby(list(self.keys), observed=True, sort=False).indices
+        for key, positions in groups.items():
+            key = tuple(_plain(v) for v in (key if isinstance(key, tuple) else (key,)))
+            sketch = self.sketches.get(key)
+            if sketch is None:
+                sketch = self.sketches[key] = QuantileSketch(self.k)
+            sketch.update(values[positions])
+
+    def merge(self, other: SketchSet) -> SketchSet:
+        """Andere Gruppen hinzunehmen (in place); `other` bleibt unverändert."""
+        for key, sketch in other.sketches.items():
+            if key in self.sketches:
+                self.sketches[key].merge(sketch)
+            else:
+                self.sketches[key] = copy.deepcopy(sketch)
+        return self
+
+    def __len__(self) -> int:
+        """Anzahl eingearbeiteter Werte über alle Gruppen."""
+        return sum(s.count for s in self.sketches.values())
+
+    @property
+    def nbytes(self) -> int:
+        return sum(s.nbytes for s in self.sketches.values())
+
+    def labels(self, key: str) -> list:
+        i = self.keys.index(key)
+        return sorted({k[i] for k in self.sketches})
+
+    def select(self, **labels: Any) -> SketchSet:
+        """
+        Teilmenge der Gruppen (Einzelwert oder Liste pro Schlüssel); Sketches werden geteilt,
+        nicht kopiert.
+        """
+        out = SketchSet(self.value, self.keys, self.k)
+        for key, sketch in self.sketches.items():
+            ok = True
+            for name, wanted in labels.items():
+                if wanted is None or name not in self.keys:
+                    continue
+                allowed = wanted if isinstance(wanted, (list, tuple, set)) else [wanted]
+                ok &= key[self.keys.index(name)] in allowed
+            if ok:
+                out.sketches[key] = sketch
+        return out
+
+    def quantiles(self, qs: Iterable[float]) -> pd.DataFrame:
+        """Eine Zeile pro Gruppe: Schlüssel plus eine Spalte pro Quantil (Spaltenname = q)."""
+        qs = list(qs)
+        rows = [(*key, *np.atleast_1d(s.quantile(qs))) for key, s in sorted(self.sketches.items())]
+        return pd.DataFrame(rows, columns=[*self.keys, *qs])
+
+    def box_stats(self, percentiles: Iterable[float] = (5, 25, 50, 75, 95)) -> pd.DataFrame:
+        """
+        Boxplot-Kennwerte wie `aggregations.box_stats` (q1, median, q3, lowerfence, upperfence,
+        count).
+        """
+        pcts = sorted({*percentiles, 25, 50, 75})
+        q = self.quantiles([p / 100 for p in pcts])
+        q.columns = [*self.keys, *pcts]
+        counts = [s.count for _, s in sorted(self.sketches.items())]
+        return pd.DataFrame({
+            **{k: q[k] for k in self.keys},
+            "q1": q[25],
+            "median": q[50],
+            "q3": q[75],
+            "lowerfence": q[pcts[0]],
+            "upperfence": q[pcts[-1]],
+            "count": counts,
+        })
+
+
+def _plain(value: Any) -> Any:
+    """NumPy-Skalare → Python-Werte (stabile, vergleichbare Gruppenschlüssel)."""
+    return value.item() if isinstance(value, np.generic) else value
@@ -5,6 +5,7 @@ from __future__ import annotations
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -125,6 +126,29 @@ def df_storage() -> pd.DataFrame:
     })
 
 
+@pytest.fixture
+def df_dispatch_runs() -> pd.DataFrame:
+    """Dispatch mit mehreren Läufen (3 Klimajahre × 2 Samples) pro Zone/Technologie/Stunde."""
+    rng = np.random.default_rng(0)
+    rows = []
+    for zone in ["DE00", "FR00"]:
+        for tech in ["Solar", "Wind Onshore"]:
+            for hour in range(6):
+                for cy in range(1, 4):
+                    for sid in range(1, 3):
+                        rows.append({
+                            "study_zone": zone,
+                            "target_year": 2025,
+                            "technology": tech,
+                            "datetime": f"2025-01-01T{hour:02d}:00:00",
+                            "climate_year": cy,
+                            "sample_id": sid,
+                            "generation_mw": rng.uniform(0, 1000),
+                            "load_mw": 0.0,
+                        })
+    return pd.DataFrame(rows)
+
+
 @pytest.fixture
 def temp_data_dir(tmp_path):
     """Temporäres Verzeichnis mit Beispieldaten (CSV)."""
@@ -0,0 +1,126 @@
+"""Tests für eraa_visualizer.aggregations."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _expected(df):
+    keys = ["study_zone", "target_year", "technology", "datetime"]
+    return df.groupby(keys, as_index=False)[["generation_mw", "load_mw"]].mean().sort_values(keys)
+
+
+def test_run_mean_accumulator_matches_groupby(df_dispatch_runs):
+    from eraa_visualizer.aggregations import RunMeanAccumulator
+    keys = ["study_zone", "target_year", "technology", "datetime"]
+    acc = RunMeanAccumulator(keys, ["generation_mw", "load_mw"], compact_rows=10)
+    for start in range(0, len(df_dispatch_runs), 7):
+        acc.update(df_dispatch_runs.iloc[start:start + 7])
+    out = acc.result()
+    exp = _expected(df_dispatch_runs)
+    assert len(out) == len(exp)
+    np.testing.assert_allclose(out["generation_mw"].to_numpy(), exp["generation_mw"].to_numpy())
+    assert (out["n_runs"] == 6).all()
+
+
+def test_run_mean_accumulator_sums_float32_in_float64():
+    from eraa_visualizer.aggregations import RunMeanAccumulator
+    # 2**24 + 1 ist in float32 nicht darstellbar
+    chunk = pd.DataFrame({"k": [0, 0], "v": np.array([2**24, 1], dtype="float32")})
+    acc = RunMeanAccumulator(["k"], ["v"])
+    acc.update(chunk)
+    assert acc.result()["v"].iloc[0] == 2**23 + 0.5
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_load_dispatch_streaming(df_dispatch_runs, tmp_path, fmt):
+    from eraa_visualizer.loaders import load_dispatch
+    path = tmp_path / f"dispatch.{fmt}"
+    if fmt == "csv":
+        df_dispatch_runs.to_csv(path, index=False)
+    else:
+        df_dispatch_runs.to_parquet(path, index=False)
+    out = load_dispatch(tmp_path, {}, {"study_zone": "category", "datetime": "str"}, chunk_rows=10)
+    exp = _expected(df_dispatch_runs)
+    assert "climate_year" not in out.columns
+    assert isinstance(out["study_zone"].dtype, pd.CategoricalDtype)
+    np.testing.assert_allclose(out["generation_mw"].to_numpy(), exp["generation_mw"].to_numpy())
+
+
+def test_load_dataset_streaming_with_filters(df_dispatch_runs, tmp_path):
+    from eraa_visualizer.config import Config
+    from eraa_visualizer.loaders import load_dataset
+    df_dispatch_runs.to_csv(tmp_path / "dispatch.csv", index=False)
+    cfg = Config.model_validate({
+        "paths": {"data_dir": str(tmp_path), "cache_dir": str(tmp_path / "cache")},
+        "loading": {"stream_time_series": True, "chunk_rows": 16},
+    })
+    ds = load_dataset(cfg, filters={"study_zone": ["FR00"]})
+    assert set(ds.dispatch["study_zone"]) == {"FR00"}
+    assert len(ds.dispatch) == 12
+
+
+def test_streaming_reads_existing_cache_entry(df_dispatch_runs, tmp_path):
+    from eraa_visualizer.cache import TableCache
+    from eraa_visualizer.loaders import load_dispatch
+    df_dispatch_runs.to_csv(tmp_path / "dispatch.csv", index=False)
+    cache = TableCache(tmp_path / "cache")
+    load_dispatch(tmp_path, {}, cache=cache)
+    out = load_dispatch(tmp_path, {}, cache=cache, chunk_rows=10)
+    assert cache.hits == 1
+    np.testing.assert_allclose(
+        out["generation_mw"].to_numpy(), _expected(df_dispatch_runs)["generation_mw"].to_numpy()
+    )
+
+
+def test_run_mean_matches_groupby(df_dispatch_runs):
+    from eraa_visualizer.aggregations import run_mean
+    out = run_mean(df_dispatch_runs, "dispatch", stats=True)
+    exp = _expected(df_dispatch_runs)
+    np.testing.assert_allclose(out["generation_mw"].to_numpy(), exp["generation_mw"].to_numpy())
+    assert (out["n_runs"] == 6).all()
+    assert (out["generation_mw_min"] <= out["generation_mw"]).all()
+    assert (out["generation_mw"] <= out["generation_mw_max"]).all()
+    assert run_mean(out, "dispatch") is out
+
+
+def test_hour_month_profile_matches_groupby(df_dispatch_runs):
+    from eraa_visualizer.aggregations import PROFILE_DIMS, HourMonthProfile
+    from eraa_visualizer.models import normalize_time
+    df = normalize_time(df_dispatch_runs)
+    profile = HourMonthProfile.from_long(df, "generation_mw", PROFILE_DIMS["dispatch"])
+    assert profile.sums.shape == (2, 1, 2, 24, 12)
+    assert profile.labels("technology") == ["Solar", "Wind Onshore"]
+    sub = df[(df["study_zone"] == "FR00") & (df["technology"] == "Solar")]
+    exp = sub.groupby("hour")["generation_mw"].mean()
+    grid = profile.grid(study_zone="FR00", target_year=2025, technology="Solar")
+    np.testing.assert_allclose(grid[exp.index, 0], exp.to_numpy())
+    assert np.isnan(grid[12:, :]).all()
+    both = profile.grid(study_zone=["DE00", "FR00"])
+    np.testing.assert_allclose(both[:6, 0], df.groupby("hour")["generation_mw"].mean().to_numpy())
+    assert np.isnan(profile.grid(study_zone="XX00")).all()
+    assert profile.pivot(study_zone="XX00").to_numpy().sum() == 0
+
+
+def test_box_stats_quantiles_and_outlier_cap():
+    from eraa_visualizer.aggregations import box_stats
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({
+        "study_zone": pd.Categorical(np.repeat(["DE00", "FR00"], 500)),
+        "price_eur_mwh": rng.normal(80, 20, 1000),
+    })
+    stats, outliers = box_stats(
+        df, ["study_zone"], "price_eur_mwh", [5, 25, 50, 75, 95], max_outliers=10
+    )
+    de = df.loc[df["study_zone"] == "DE00", "price_eur_mwh"].to_numpy()
+    row = stats.set_index("study_zone").loc["DE00"]
+    np.testing.assert_allclose(
+        row[["lowerfence", "q1", "median", "q3", "upperfence"]].to_numpy(dtype=float),
+        np.percentile(de, [5, 25, 50, 75, 95]),
+    )
+    assert row["count"] == 500
+    assert (outliers.groupby("study_zone", observed=True).size() == 10).all()
+    de_out = outliers.loc[outliers["study_zone"] == "DE00", "price_eur_mwh"]
+    assert np.abs(de_out - row["median"]).min() >= np.sort(np.abs(de - row["median"]))[-10] - 1e-9
@@ -0,0 +1,64 @@
+"""Tests für eraa_visualizer.cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+
+def _config(data_dir, cache_dir):
+    from eraa_visualizer.config import Config, PathsConfig
+    paths = PathsConfig(data_dir=str(data_dir), output_dir="output", cache_dir=str(cache_dir))
+    return Config(paths=paths)
+
+
+def test_cache_miss_then_hit(temp_data_dir, tmp_path):
+    from eraa_visualizer.cache import TableCache
+    from eraa_visualizer.loaders import load_dataset
+    cfg = _config(temp_data_dir, tmp_path / "cache")
+    cache = TableCache(cfg.paths.cache_dir)
+    first = load_dataset(cfg, cache=cache)
+    assert cache.hits == 0
+    assert cache.misses == 3
+    second = load_dataset(cfg, cache=cache)
+    assert cache.hits == 3
+    pd.testing.assert_frame_equal(first.dispatch, second.dispatch)
+    assert isinstance(second.dispatch["study_zone"].dtype, pd.CategoricalDtype)
+
+
+def test_cache_rebuilt_on_source_change(temp_data_dir, tmp_path):
+    from eraa_visualizer.cache import TableCache
+    from eraa_visualizer.loaders import load_adequacy
+    cache = TableCache(tmp_path / "cache")
+    load_adequacy(Path(temp_data_dir), {}, None, cache)
+    src = Path(temp_data_dir) / "adequacy.csv"
+    row = "CZ00,2025,A,1,1,2.0,0.3,2,0.2,0,3,0,0.3\n"
+    src.write_text(src.read_text(encoding="utf-8") + row, encoding="utf-8")
+    st = src.stat()
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    df = load_adequacy(Path(temp_data_dir), {}, None, cache)
+    assert cache.misses == 2
+    assert len(df) == 3
+    assert len(list((tmp_path / "cache").glob("adequacy-*.parquet"))) == 1
+
+
+def test_cache_rebuilt_on_schema_change(temp_data_dir, tmp_path):
+    from eraa_visualizer.cache import TableCache
+    from eraa_visualizer.loaders import load_adequacy
+    cache = TableCache(tmp_path / "cache")
+    load_adequacy(Path(temp_data_dir), {}, None, cache)
+    df = load_adequacy(Path(temp_data_dir), {"zone": "study_zone"}, None, cache)
+    assert cache.misses == 2
+    assert "zone" in df.columns
+
+
+def test_cache_clear(temp_data_dir, tmp_path):
+    from eraa_visualizer.cache import TableCache
+    from eraa_visualizer.loaders import load_dataset
+    cfg = _config(temp_data_dir, tmp_path / "cache")
+    cache = TableCache(cfg.paths.cache_dir)
+    load_dataset(cfg, cache=cache)
+    assert cache.clear() == 3
+    assert cache.clear() == 0
@@ -0,0 +1,30 @@
+"""Tests für eraa_visualizer.catalog."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def test_catalog_from_frames_and_values():
+    from eraa_visualizer.catalog import DimensionCatalog
+    adequacy = pd.DataFrame({
+        "study_zone": pd.Categorical(["DE00", "AT00", "DE00"]),
+        "target_year": np.array([2030, 2025, 2030], dtype="int16"),
+        "lole_h": [1.0, 2.0, 3.0],
+    })
+    prices = pd.DataFrame(
+        {"study_zone": ["FR00", None], "target_year": [2035, 2035], "climate_year": [1, 1]}
+    )
+    frames = {"adequacy": adequacy, "prices": prices, "storage": None}
+    catalog = DimensionCatalog.from_frames(frames)
+    assert catalog.tables == ["adequacy", "prices"]
+    assert "storage" not in catalog
+    assert catalog.dimensions("adequacy") == {
+        "study_zone": ["AT00", "DE00"], "target_year": [2025, 2030]
+    }
+    assert catalog.values("study_zone", "prices") == ["FR00"]
+    assert catalog.values("target_year") == [2025, 2030, 2035]
+    assert catalog.values("target_year", ["adequacy", "storage"]) == [2025, 2030]
+    assert all(type(v) is int for v in catalog.values("target_year"))
+    assert catalog.dimensions("storage") == {}
@@ -29,3 +29,61 @@ def test_cli_help():
     assert result.exit_code == 0
     assert "config" in result.output.lower()
     assert "list-only" in result.output
+
+
+def test_cli_warm_and_clear_cache(temp_data_dir, tmp_path):
+    from eraa_visualizer.cli import main
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text(
+        f"paths:\n  data_dir: '{temp_data_dir}'\n  output_dir: '{tmp_path / 'out'}'\n"
+        f"  cache_dir: '{tmp_path / 'cache'}'\n",
+        encoding="utf-8",
+    )
+    runner = CliRunner()
+    result = runner.invoke(main, ["--warm-cache", "--config", str(cfg)])
+    assert result.exit_code == 0
+    assert "3 miss(es)" in result.output
+    result = runner.invoke(main, ["--warm-cache", "--config", str(cfg)])
+    assert "3 hit(s)" in result.output
+    result = runner.invoke(main, ["--clear-cache", "--config", str(cfg)])
+    assert result.exit_code == 0
+    assert "3 Datei(en)" in result.output
+
+
+def test_cli_warm_cache_covers_streamed_tables(temp_data_dir, tmp_path):
+    from eraa_visualizer.cache import TableCache
+    from eraa_visualizer.cli import main
+    from eraa_visualizer.config import Config
+    from eraa_visualizer.loaders import load_dataset
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text(
+        f"paths:\n  data_dir: '{temp_data_dir}'\n  output_dir: '{tmp_path / 'out'}'\n"
+        f"  cache_dir: '{tmp_path / 'cache'}'\n"
+        "loading:\n  stream_time_series: true\n  chunk_rows: 10\n",
+        encoding="utf-8",
+    )
+    result = CliRunner().invoke(main, ["--warm-cache", "--config", str(cfg)])
+    assert result.exit_code == 0
+    assert "3 miss(es)" in result.output
+    # Das Streaming liest Dispatch danach aus dem Cache-Eintrag
+    cache = TableCache(tmp_path / "cache")
+    ds = load_dataset(Config.load(cfg), cache=cache)
+    assert cache.hits == 3 and cache.misses == 0
+    assert "climate_year" not in ds.dispatch.columns
+
+
+def test_cli_reports_rebuilt_and_skipped(temp_data_dir, tmp_path):
+    from eraa_visualizer.cli import main
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text(
+        f"paths:\n  data_dir: '{temp_data_dir}'\n  output_dir: '{tmp_path / 'out'}'\n",
+        encoding="utf-8",
+    )
+    runner = CliRunner()
+    result = runner.invoke(main, ["--config", str(cfg)])
+    assert result.exit_code == 0
+    assert "skipped 0" in result.output
+    result = runner.invoke(main, ["--config", str(cfg)])
+    assert "Rebuilt 0," in result.output
+    result = runner.invoke(main, ["--config", str(cfg), "--force"])
+    assert "skipped 0" in result.output
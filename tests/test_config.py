@@ -18,6 +18,8 @@ def test_config_defaults(config_empty):
     assert 2025 in c.dimensions.target_years
     assert c.visualization.figure_width == 1200
     assert c.visualization.template == "plotly_white"
+    # Downsampling ist auch ohne config.yaml aktiv (gleicher Standard wie dort)
+    assert c.visualization.timeseries_figure_max_points == 50_000
 
 
 def test_config_load(project_root):
@@ -0,0 +1,77 @@
+"""Tests für eraa_visualizer.cube."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def test_run_cube_from_long(df_dispatch_runs):
+    from eraa_visualizer.cube import RunCube, cube_dims
+    cube = RunCube.from_long(df_dispatch_runs, cube_dims("dispatch"), "generation_mw")
+    assert cube.dims == [
+        "study_zone", "target_year", "technology", "datetime", "climate_year", "sample_id"
+    ]
+    assert cube.data.shape == (2, 1, 2, 6, 3, 2)
+    assert not np.isnan(cube.data).any()
+    back = cube.to_frame().sort_values(list(cube.dims)).reset_index(drop=True)
+    exp = df_dispatch_runs.sort_values(list(cube.dims)).reset_index(drop=True)
+    np.testing.assert_allclose(back["generation_mw"], exp["generation_mw"])
+
+
+def test_run_cube_reductions_match_groupby(df_dispatch_runs):
+    from eraa_visualizer.cube import table_cubes
+    cube = table_cubes(df_dispatch_runs, "dispatch")["generation_mw"]
+    keys = ["study_zone", "target_year", "technology", "datetime"]
+    g = df_dispatch_runs.groupby(keys)["generation_mw"]
+    for stat, exp in [
+        (cube.mean(), g.mean()),
+        (cube.min(), g.min()),
+        (cube.max(), g.max()),
+        (cube.quantile(0.9), g.quantile(0.9)),
+    ]:
+        assert stat.dims == keys
+        out = stat.to_frame().set_index(keys)["generation_mw"]
+        np.testing.assert_allclose(out.sort_index(), exp.sort_index())
+    qs = cube.quantile([0.1, 0.5])
+    assert qs.dims[0] == "quantile"
+    assert qs.data.shape[0] == 2
+
+
+def test_run_cube_missing_cells_and_sel(df_dispatch_runs):
+    from eraa_visualizer.cube import RunCube, cube_dims
+    runs = df_dispatch_runs
+    df = runs[~((runs["study_zone"] == "FR00") & (runs["technology"] == "Solar"))]
+    cube = RunCube.from_long(df, cube_dims("dispatch"), "generation_mw")
+    mean = cube.mean()
+    fr = mean.sel(study_zone="FR00", target_year=2025)
+    assert fr.dims == ["technology", "datetime"]
+    assert np.isnan(fr.sel(technology="Solar").data).all()
+    assert len(mean.to_frame()) == 3 * 6
+    sub = mean.sel(study_zone=["FR00", "XX00"], technology=["Wind Onshore"])
+    assert list(sub.axes["study_zone"]) == ["FR00"]
+    assert sub.data.shape == (1, 1, 1, 6)
+
+
+def test_run_cube_missing_keys_and_duplicates():
+    from eraa_visualizer.cube import RunCube
+    df = pd.DataFrame({"study_zone": ["AT00", "DE00", None], "value": [1.0, 2.0, 99.0]})
+    # Zeile ohne Zone wird verworfen, statt in die Zelle der letzten Zone zu schreiben
+    cube = RunCube.from_long(df, ["study_zone"], "value")
+    assert list(cube.axes["study_zone"]) == ["AT00", "DE00"]
+    np.testing.assert_array_equal(cube.data, [1.0, 2.0])
+    with pytest.raises(ValueError, match="Doppelte Gitterpunkte"):
+        duplicates = pd.DataFrame({"study_zone": ["AT00", "AT00"], "value": [1.0, 2.0]})
+        RunCube.from_long(duplicates, ["study_zone"], "value")
+
+
+def test_dataset_cube_memoised(df_dispatch_runs):
+    from eraa_visualizer.models import ERAADataset
+    ds = ERAADataset(dispatch=df_dispatch_runs)
+    cube = ds.cube("dispatch", "generation_mw")
+    assert ds.cube("dispatch", "generation_mw") is cube
+    assert ds.cube("dispatch", "missing") is None
+    assert ds.cube("prices", "price_eur_mwh") is None
+    ds.dispatch = df_dispatch_runs.head(12)
+    assert ds.cube("dispatch", "generation_mw") is not cube
@@ -0,0 +1,53 @@
+"""Tests für eraa_visualizer.downsample."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def _series(n: int = 8760) -> np.ndarray:
+    y = np.random.default_rng(0).normal(100, 10, n)
+    y[1234], y[5000] = 900.0, -300.0
+    return y
+
+
+def test_m4_and_lttb_keep_peaks_within_budget():
+    from eraa_visualizer.downsample import lttb, m4
+    y = _series()
+    idx = m4(y, 400)
+    assert len(idx) <= 400 and np.all(np.diff(idx) > 0)
+    assert {0, 1234, 5000, len(y) - 1} <= set(idx.tolist())
+    idx = lttb(np.arange(len(y), dtype=float), y, 400)
+    assert len(idx) == 400 and np.all(np.diff(idx) > 0)
+    assert {0, 1234, 5000, len(y) - 1} <= set(idx.tolist())
+    np.testing.assert_array_equal(m4(y[:100], 400), np.arange(100))
+
+
+def test_block_mean_and_columns():
+    from eraa_visualizer.downsample import block_mean, downsample_columns
+    y = np.arange(12, dtype=float)
+    starts, means = block_mean(y, 4)
+    np.testing.assert_array_equal(starts, [0, 3, 6, 9])
+    np.testing.assert_allclose(means, [1, 4, 7, 10])
+    z = np.vstack([_series(), -_series()])
+    peaks, starts = downsample_columns(z, 100)
+    assert peaks.shape == (2, 100) and len(starts) == 100
+    assert peaks[0].max() == 900 and peaks[0].min() == -300 and peaks[1].min() == -900
+    means, _ = downsample_columns(z, 100, "mean")
+    np.testing.assert_allclose(means.mean(axis=1), z.mean(axis=1), rtol=1e-3)
+
+
+def test_downsample_frame_per_trace():
+    from eraa_visualizer.downsample import downsample_frame
+    y = _series()
+    one = pd.DataFrame({"datetime": pd.date_range("2030-01-01", periods=len(y), freq="h"), "v": y})
+    df = pd.concat([one.assign(zone="DE00"), one.assign(zone="FR00", v=y / 2)], ignore_index=True)
+    for method in ("m4", "lttb", "mean"):
+        out = downsample_frame(df, "datetime", "v", 200, method, by=["zone"])
+        sizes = out.groupby("zone").size()
+        assert sizes.max() <= 200 and list(sizes.index) == ["DE00", "FR00"]
+        assert out.groupby("zone")["datetime"].apply(lambda s: s.is_monotonic_increasing).all()
+        if method != "mean":
+            assert out.groupby("zone")["v"].max().tolist() == [900, 450]
+    assert downsample_frame(df, "datetime", "v", 0, by=["zone"]) is df
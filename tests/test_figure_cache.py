@@ -0,0 +1,41 @@
+"""Tests für eraa_visualizer.figure_cache."""
+
+from __future__ import annotations
+
+
+def test_figure_cache_hits_and_keys(config, df_prices):
+    from eraa_visualizer.figure_cache import FigureCache
+    from eraa_visualizer.index import TableIndex
+    from eraa_visualizer.plots import plot_prices_boxplot, plot_prices_timeseries
+    cache = FigureCache()
+    index = TableIndex(df_prices, ["target_year", "study_zone"])
+    sel = {"target_year": [2025], "study_zone": None}
+    fig = cache.figure(plot_prices_timeseries, index, config, select=sel)
+    same = {"study_zone": None, "target_year": (2025,)}
+    assert cache.figure(plot_prices_timeseries, index, config, select=same) is fig
+    assert (cache.hits, cache.misses) == (1, 1)
+    # andere Funktion, Auswahl, Quelle oder Konfiguration → eigener Eintrag
+    cache.figure(plot_prices_boxplot, index, config, select=sel)
+    cache.figure(plot_prices_timeseries, index, config, select={"target_year": [2030]})
+    cache.figure(plot_prices_timeseries, TableIndex(df_prices, ["target_year"]), config, select=sel)
+    vis = config.visualization.model_copy(update={"template": "plotly_dark"})
+    dark_cfg = config.model_copy(update={"visualization": vis})
+    dark = cache.figure(plot_prices_timeseries, index, dark_cfg, select=sel)
+    assert dark is not fig
+    assert (cache.hits, cache.misses, len(cache)) == (1, 5, 5)
+    assert cache.nbytes > 0
+    assert "1 hit(s)" in cache.stats()
+
+
+def test_figure_cache_evicts_least_recently_used(config, df_prices):
+    from eraa_visualizer.figure_cache import FigureCache, figure_nbytes
+    from eraa_visualizer.plots import plot_prices_heatmap_hour_month
+    probe = plot_prices_heatmap_hour_month(df_prices, config, "DE00", 2025)
+    cache = FigureCache(max_bytes=int(2.5 * figure_nbytes(probe)))
+    first = cache.figure(plot_prices_heatmap_hour_month, df_prices, config, "DE00", 2025)
+    cache.figure(plot_prices_heatmap_hour_month, df_prices, config, "FR00", 2025)
+    cache.figure(plot_prices_heatmap_hour_month, df_prices, config, "DE00", 2025)  # zuletzt genutzt
+    cache.figure(plot_prices_heatmap_hour_month, df_prices, config, "AT00", 2025)
+    assert cache.evictions == 1 and len(cache) == 2
+    assert cache.nbytes <= cache.max_bytes
+    assert cache.figure(plot_prices_heatmap_hour_month, df_prices, config, "DE00", 2025) is first
@@ -0,0 +1,83 @@
+"""Tests für eraa_visualizer.index."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def _sorted(df: pd.DataFrame) -> pd.DataFrame:
+    cols = ["target_year", "study_zone", "technology", "datetime", "climate_year", "sample_id"]
+    return df.sort_values(cols).reset_index(drop=True)
+
+
+def test_table_index_select_matches_mask(df_dispatch_runs):
+    from eraa_visualizer.index import INDEX_KEYS, TableIndex, select
+    df = pd.concat([df_dispatch_runs.assign(target_year=2030), df_dispatch_runs], ignore_index=True)
+    index = TableIndex(df, INDEX_KEYS["dispatch"])
+    assert len(index) == len(df)
+    assert index.labels("target_year") == [2025, 2030]
+    assert index.labels("study_zone") == ["DE00", "FR00"]
+    for labels in [
+        {"target_year": 2030},
+        {"target_year": 2030, "study_zone": "FR00"},
+        {"target_year": 2030, "study_zone": ["FR00", "DE00"], "technology": "Solar"},
+        {"study_zone": "DE00"},
+        {"target_year": 2030, "study_zone": "DE00", "climate_year": [1, 3]},
+        {"target_year": 1999},
+    ]:
+        got = index.select(**labels)
+        exp = select(df, **labels)
+        pd.testing.assert_frame_equal(_sorted(got), _sorted(exp))
+    # Eine Gruppe ist ein zusammenhängender Slice der sortierten Tabelle, zeitlich geordnet
+    part = index.select(target_year=2030, study_zone="DE00", technology="Solar")
+    values = index.frame["generation_mw"].to_numpy()
+    assert np.shares_memory(part["generation_mw"].to_numpy(), values)
+    assert part["datetime"].is_monotonic_increasing
+
+
+def test_table_index_time_window(df_dispatch_runs):
+    from eraa_visualizer.index import INDEX_KEYS, TableIndex, select
+    df = df_dispatch_runs.assign(datetime=pd.to_datetime(df_dispatch_runs["datetime"]))
+    df = pd.concat([df.assign(target_year=2030), df], ignore_index=True)
+    index = TableIndex(df, INDEX_KEYS["dispatch"])
+    assert index.time_range == (pd.Timestamp("2025-01-01 00:00"), pd.Timestamp("2025-01-01 05:00"))
+    windows = [
+        ("2025-01-01 01:00", "2025-01-01 03:00"),
+        (None, "2025-01-01 00:00"),
+        ("2025-01-01 04:30", None),
+        ("2026", None),
+    ]
+    selections = [
+        {},
+        {"target_year": 2030},
+        {"target_year": [2025, 2030], "study_zone": "FR00"},
+        {"technology": "Solar"},
+    ]
+    for window in windows:
+        for labels in selections:
+            got = index.select(window=window, **labels)
+            exp = select(df, window=window, **labels)
+            pd.testing.assert_frame_equal(_sorted(got), _sorted(exp))
+    # Ein Fenster in einer Gruppe bleibt ein Slice ohne Kopie
+    part = index.select(
+        window=("2025-01-01 02:00", "2025-01-01 03:00"),
+        target_year=2030,
+        study_zone="DE00",
+        technology="Solar",
+    )
+    assert len(part) == 12
+    source = index.frame["generation_mw"].to_numpy()
+    assert np.shares_memory(part["generation_mw"].to_numpy(), source)
+
+
+def test_dataset_index_memoised(df_dispatch_runs):
+    from eraa_visualizer.models import ERAADataset
+    ds = ERAADataset(dispatch=df_dispatch_runs)
+    index = ds.index("dispatch")
+    assert ds.index("dispatch") is index
+    means = ds.index("dispatch", mean=True)
+    assert len(means) == len(ds.run_mean("dispatch"))
+    assert ds.index("prices") is None
+    ds.dispatch = df_dispatch_runs.iloc[:10]
+    assert len(ds.index("dispatch")) == 10
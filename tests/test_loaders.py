@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 import pytest
 
 
@@ -60,3 +62,402 @@ def test_load_dataset_empty_dir(tmp_path):
     assert dataset.adequacy is None
     assert dataset.dispatch is None
     assert dataset.adequacy_hour_month is None
+
+
+def test_load_dispatch_typed(temp_data_dir):
+    from eraa_visualizer.config import Config
+    from eraa_visualizer.loaders import load_dispatch, table_dtypes
+    cfg = Config.model_validate({"dtypes": {"dispatch": {"generation_mw": "float32"}}})
+    df = load_dispatch(Path(temp_data_dir), cfg.schema.dispatch, table_dtypes(cfg, "dispatch"))
+    assert isinstance(df["study_zone"].dtype, pd.CategoricalDtype)
+    assert isinstance(df["technology"].dtype, pd.CategoricalDtype)
+    assert df["target_year"].dtype == "int16"
+    assert df["climate_year"].dtype == "int16"
+    assert df["generation_mw"].dtype == "float32"
+    assert df["datetime"].iloc[0] == pd.Timestamp("2025-01-15 08:00:00")
+    assert pd.api.types.is_datetime64_any_dtype(df["datetime"])
+    assert df["hour"].dtype == "int8"
+    assert df["hour"].tolist() == [8, 12]
+    assert df["month"].tolist() == [1, 6]
+
+
+def test_load_dispatch_typed_renamed_columns(tmp_path):
+    from eraa_visualizer.loaders import load_dispatch
+    (tmp_path / "dispatch.csv").write_text(
+        "Zone,target_year,technology,datetime,climate_year,sample_id,generation_mw,load_mw\n"
+        "DE00,2025,Solar,2025-06-15T12:00:00,1,1,500,0\n",
+        encoding="utf-8",
+    )
+    df = load_dispatch(tmp_path, {"study_zone": "Zone"}, {"study_zone": "category"})
+    assert isinstance(df["study_zone"].dtype, pd.CategoricalDtype)
+
+
+def test_memory_report(temp_data_dir):
+    from eraa_visualizer.config import Config, PathsConfig
+    from eraa_visualizer.loaders import load_dataset, memory_report
+    cfg = Config(paths=PathsConfig(data_dir=str(temp_data_dir), output_dir="output"))
+    report = memory_report(load_dataset(cfg))
+    assert set(report["table"]) == {"adequacy", "adequacy_hour_month", "dispatch"}
+    assert (report["typed_mb"] <= report["untyped_mb"]).all()
+
+
+def _dispatch_frame():
+    import numpy as np
+    rows = []
+    for zone in ["AT00", "DE00", "FR00"]:
+        for ty in [2025, 2030]:
+            for cy in [1, 2]:
+                rows.append({
+                    "study_zone": zone,
+                    "target_year": ty,
+                    "technology": "Solar",
+                    "datetime": "2025-06-15T12:00:00",
+                    "climate_year": cy,
+                    "sample_id": 1,
+                    "generation_mw": float(np.random.default_rng(cy).uniform(0, 100)),
+                    "load_mw": 0.0,
+                })
+    return pd.DataFrame(rows)
+
+
+def test_load_dispatch_partitioned_with_filters(tmp_path):
+    from eraa_visualizer.loaders import load_dispatch, write_partitioned
+    write_partitioned(_dispatch_frame(), tmp_path / "dispatch")
+    assert (tmp_path / "dispatch" / "target_year=2030" / "study_zone=DE00").is_dir()
+    filters = {"target_year": [2030], "study_zone": ["DE00", "FR00"]}
+    df = load_dispatch(tmp_path, {}, {"target_year": "int16"}, filters=filters)
+    assert len(df) == 4
+    assert set(df["study_zone"]) == {"DE00", "FR00"}
+    assert set(df["target_year"]) == {2030}
+    assert df["target_year"].dtype == "int16"
+    full = load_dispatch(tmp_path, {})
+    assert len(full) == 12
+
+
+def test_load_dispatch_filters_parquet_and_csv(tmp_path):
+    from eraa_visualizer.loaders import load_dispatch
+    df = _dispatch_frame()
+    (tmp_path / "pq").mkdir()
+    df.to_parquet(tmp_path / "pq" / "dispatch.parquet", index=False)
+    (tmp_path / "csv").mkdir()
+    df.to_csv(tmp_path / "csv" / "dispatch.csv", index=False)
+    flt = {"target_year": [2025], "study_zone": ["AT00"]}
+    for sub in ("pq", "csv"):
+        out = load_dispatch(tmp_path / sub, {}, filters=flt)
+        assert len(out) == 2
+        assert set(out["study_zone"]) == {"AT00"}
+
+
+def test_load_dataset_filters_with_cache(temp_data_dir, tmp_path):
+    from eraa_visualizer.cache import TableCache
+    from eraa_visualizer.config import Config, PathsConfig
+    from eraa_visualizer.loaders import load_dataset
+    cfg = Config(paths=PathsConfig(data_dir=str(temp_data_dir), output_dir="output"))
+    cache = TableCache(tmp_path / "cache")
+    for _ in range(2):
+        ds = load_dataset(cfg, cache=cache, filters={"study_zone": ["AT00"]})
+        assert set(ds.adequacy["study_zone"]) == {"AT00"}
+        assert ds.dispatch.empty
+    assert cache.hits == 3
+
+
+def test_load_dataset_columns(temp_data_dir, tmp_path):
+    from eraa_visualizer.cache import TableCache
+    from eraa_visualizer.config import Config, PathsConfig
+    from eraa_visualizer.loaders import load_dataset
+    cfg = Config(paths=PathsConfig(data_dir=str(temp_data_dir), output_dir="output"))
+    columns = {"adequacy": ["study_zone", "target_year", "lole", "not_there"]}
+    for cache in (None, TableCache(tmp_path / "cache"), TableCache(tmp_path / "cache")):
+        ds = load_dataset(cfg, cache=cache, columns=columns)
+        assert list(ds.adequacy.columns) == ["study_zone", "target_year", "lole"]
+        # Nicht aufgeführte Tabellen werden gar nicht gelesen
+        assert ds.dispatch is None and ds.adequacy_hour_month is None
+    lazy = load_dataset(cfg, columns=columns, lazy=True)
+    assert lazy.dispatch is None and lazy.info("dispatch") is None
+    assert lazy.catalog.tables == ["adequacy"]
+    assert "climate_year" in load_dataset(cfg).dispatch.columns
+
+
+def test_load_columns_partitioned_and_renamed(tmp_path):
+    from eraa_visualizer.loaders import load_dispatch, write_partitioned
+    df = _dispatch_frame().rename(columns={"generation_mw": "gen"})
+    write_partitioned(df, tmp_path / "dispatch")
+    out = load_dispatch(
+        tmp_path, {"generation_mw": "gen"},
+        filters={"target_year": [2025]}, columns=["study_zone", "generation_mw"],
+    )
+    assert sorted(out.columns) == ["generation_mw", "study_zone"]
+    assert len(out) == 6
+    (tmp_path / "csv").mkdir()
+    df.to_csv(tmp_path / "csv" / "dispatch.csv", index=False)
+    out = load_dispatch(
+        tmp_path / "csv", {"generation_mw": "gen"}, {"study_zone": "category"},
+        filters={"target_year": [2025]}, columns=["study_zone", "generation_mw"],
+    )
+    assert list(out.columns) == ["study_zone", "generation_mw"]
+    assert len(out) == 6
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_load_dataset_parallel(temp_data_dir, tmp_path, executor, caplog):
+    import logging
+
+    from eraa_visualizer.cache import TableCache
+    from eraa_visualizer.config import Config
+    from eraa_visualizer.loaders import load_dataset
+    base = {"paths": {"data_dir": str(temp_data_dir)}}
+    sequential = load_dataset(Config.model_validate(base))
+    cfg = Config.model_validate({**base, "loading": {"workers": 4, "executor": executor}})
+    cache = TableCache(tmp_path / "cache")
+    with caplog.at_level(logging.INFO, logger="eraa_visualizer.loaders"):
+        parallel = load_dataset(cfg, cache=cache)
+    pd.testing.assert_frame_equal(sequential.dispatch, parallel.dispatch)
+    pd.testing.assert_frame_equal(sequential.adequacy, parallel.adequacy)
+    assert parallel.prices is None
+    assert cache.misses == 3
+    assert "dispatch" in caplog.text
+
+
+def test_load_dataset_lazy(temp_data_dir):
+    from eraa_visualizer.config import Config, PathsConfig
+    from eraa_visualizer.loaders import load_dataset
+    cfg = Config(paths=PathsConfig(data_dir=str(temp_data_dir), output_dir="output"))
+    ds = load_dataset(cfg, lazy=True)
+    assert ds.row_count("adequacy") == 2
+    assert ds.study_zones("adequacy") == ["AT00", "BE00"]
+    assert ds.target_years("dispatch") == [2025]
+    assert "generation_mw" in ds.columns("dispatch")
+    assert ds.info("prices") is None
+    assert not ds.is_loaded("adequacy")
+    assert len(ds.adequacy) == 2
+    assert ds.is_loaded("adequacy")
+    assert ds.prices is None
+
+
+def test_load_integer_hour_index(tmp_path):
+    from eraa_visualizer.cache import TableCache
+    from eraa_visualizer.loaders import load_prices
+    from eraa_visualizer.models import DEFAULT_DTYPES
+    df = pd.DataFrame({
+        "study_zone": "DE00",
+        "target_year": 2030,
+        "datetime": [0, 1, 31 * 24 + 5],  # Stunde des Jahres
+        "climate_year": 1,
+        "sample_id": 1,
+        "price_eur_mwh": [1.0, 2.0, 3.0],
+    })
+    (tmp_path / "csv").mkdir()
+    df.to_csv(tmp_path / "csv" / "prices.csv", index=False)
+    (tmp_path / "pq").mkdir()
+    df.to_parquet(tmp_path / "pq" / "prices.parquet", index=False)
+    dtypes = DEFAULT_DTYPES["prices"]
+    cache = TableCache(tmp_path / "cache")
+    for out in [
+        load_prices(tmp_path / "csv", {}, dtypes),
+        load_prices(tmp_path / "pq", {}, dtypes),
+        load_prices(tmp_path / "csv", {}, dtypes, cache=cache),
+        load_prices(tmp_path / "csv", {}, dtypes, cache=cache),
+        load_prices(tmp_path / "csv", {}, dtypes, chunk_rows=2),
+    ]:
+        assert pd.api.types.is_integer_dtype(out["datetime"])
+        assert list(out["hour"]) == [0, 1, 5]
+        assert list(out["month"]) == [1, 1, 2]
+    assert cache.hits == 1
+
+
+def test_describe_table_parquet_and_partitioned(tmp_path):
+    from eraa_visualizer.loaders import describe_table, write_partitioned
+    df = _dispatch_frame()
+    write_partitioned(df, tmp_path / "part" / "dispatch")
+    (tmp_path / "pq").mkdir()
+    df.to_parquet(tmp_path / "pq" / "dispatch.parquet", index=False)
+    for sub in ("part", "pq"):
+        info = describe_table(tmp_path / sub, "dispatch")
+        assert info.row_count == 12
+        assert info.study_zones == ["AT00", "DE00", "FR00"]
+        assert info.target_years == [2025, 2030]
+        assert "generation_mw" in info.columns
+        assert info.dimensions["technology"] == ["Solar"]
+        assert info.dimensions["climate_year"] == [1, 2]
+
+
+def _write_dispatch_shards(df, folder, suffix=".parquet"):
+    folder.mkdir(parents=True, exist_ok=True)
+    for (cy, sid), part in df.groupby(["climate_year", "sample_id"]):
+        path = folder / f"dispatch_CY{cy}_S{sid}{suffix}"
+        part = part.drop(columns=["climate_year", "sample_id"])
+        if suffix == ".csv":
+            part.to_csv(path, index=False)
+        else:
+            part.to_parquet(path, index=False)
+
+
+def test_load_dispatch_shards(tmp_path):
+    from eraa_visualizer.loaders import find_shards, load_dispatch
+    df = _dispatch_frame()
+    (tmp_path / "single").mkdir()
+    df.to_parquet(tmp_path / "single" / "dispatch.parquet", index=False)
+    _write_dispatch_shards(df, tmp_path / "pq")
+    _write_dispatch_shards(df, tmp_path / "csv" / "dispatch", suffix=".csv")
+    shards = find_shards(tmp_path / "pq", ("dispatch.csv", "dispatch"))
+    assert [s.climate_year for s in shards] == [1, 2]
+    dtypes = {"study_zone": "category", "climate_year": "int16", "sample_id": "int16"}
+    key = ["climate_year", "study_zone", "target_year"]
+    expected = load_dispatch(tmp_path / "single", {}, dtypes)
+    expected = expected.sort_values(key).reset_index(drop=True)
+    for sub in ("pq", "csv"):
+        out = load_dispatch(tmp_path / sub, {}, dtypes)
+        out = out[expected.columns].sort_values(key).reset_index(drop=True)
+        pd.testing.assert_frame_equal(out, expected)
+    filters = {"climate_year": [2], "study_zone": ["AT00"]}
+    only_cy2 = load_dispatch(tmp_path / "pq", {}, filters=filters)
+    assert len(only_cy2) == 2
+    assert set(only_cy2["climate_year"]) == {2}
+    means = load_dispatch(tmp_path / "pq", {}, chunk_rows=5)
+    assert len(means) == 6
+    assert set(means["n_runs"]) == {2}
+
+
+def test_describe_table_shards(tmp_path):
+    from eraa_visualizer.loaders import describe_table
+    _write_dispatch_shards(_dispatch_frame(), tmp_path)
+    info = describe_table(tmp_path, "dispatch")
+    assert info.row_count == 12
+    assert info.study_zones == ["AT00", "DE00", "FR00"]
+    assert {"climate_year", "sample_id"} <= set(info.columns)
+    assert info.source.endswith("dispatch_*")
+    # Klimajahre/Samples stehen nur in den Dateinamen
+    assert info.dimensions["climate_year"] == [1, 2]
+    assert info.dimensions["sample_id"] == [1]
+
+
+def test_load_dataset_catalog_eager_and_lazy(temp_data_dir):
+    from eraa_visualizer.config import Config, PathsConfig
+    from eraa_visualizer.loaders import load_dataset
+    cfg = Config(paths=PathsConfig(data_dir=str(temp_data_dir), output_dir="output"))
+    eager = load_dataset(cfg).catalog
+    lazy_ds = load_dataset(cfg, lazy=True)
+    lazy = lazy_ds.catalog
+    assert not lazy_ds.is_loaded("dispatch")
+    for table in ("adequacy", "dispatch"):
+        assert lazy.dimensions(table) == eager.dimensions(table)
+    assert eager.values("study_zone", "adequacy") == ["AT00", "BE00"]
+    assert eager.values("target_year", "dispatch") == [2025]
+    assert "prices" not in lazy
+
+
+def test_catalog_built_on_access_and_refreshed(temp_data_dir):
+    import os
+
+    from eraa_visualizer.config import Config, PathsConfig
+    from eraa_visualizer.loaders import load_dataset
+    cfg = Config(paths=PathsConfig(data_dir=str(temp_data_dir), output_dir="output"))
+    eager = load_dataset(cfg)
+    # Kein Katalog-Scan beim Laden
+    assert not any(kind == "dimensions" for kind, _, _ in eager._derived)
+    assert eager.catalog.values("study_zone", "adequacy") == ["AT00", "BE00"]
+    eager.adequacy = eager.adequacy[eager.adequacy["study_zone"] == "AT00"]
+    assert eager.catalog.values("study_zone", "adequacy") == ["AT00"]
+
+    lazy = load_dataset(cfg, lazy=True)
+    assert lazy.catalog.values("study_zone", "adequacy") == ["AT00", "BE00"]
+    path = temp_data_dir / "adequacy.csv"
+    header = path.read_text(encoding="utf-8").splitlines()[0]
+    path.write_text(header + "\nFR00,2030,A,1,1,0.5,0.1,0,0.05,0,1,0,0.1\n", encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert lazy.catalog.values("study_zone", "adequacy") == ["FR00"]
+    assert lazy.info("adequacy").row_count == 1
+    assert lazy.catalog.values("study_zone", "dispatch") == ["DE00"]
+
+
+def test_sketch_prices_csv_and_shards(tmp_path):
+    from eraa_visualizer.loaders import sketch_prices
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({
+        "study_zone": np.repeat(["AT00", "DE00"], 40),
+        "target_year": 2030,
+        "datetime": "2025-01-15T08:00:00",
+        "climate_year": np.tile(np.repeat([1, 2], 20), 2),
+        "sample_id": 1,
+        "price": rng.uniform(20, 120, 80),
+    })
+    (tmp_path / "csv").mkdir()
+    df.to_csv(tmp_path / "csv" / "prices.csv", index=False)
+    for cy, part in df.groupby("climate_year"):
+        (tmp_path / "pq").mkdir(exist_ok=True)
+        shard = tmp_path / "pq" / f"prices_CY{cy}.parquet"
+        part.drop(columns="climate_year").to_parquet(shard, index=False)
+    schema = {"price_eur_mwh": "price"}
+    exp = df.groupby("study_zone")["price"].median().to_numpy()
+    for sub in ("csv", "pq"):
+        sketch = sketch_prices(tmp_path / sub, schema, chunk_rows=16)
+        assert len(sketch) == 80
+        np.testing.assert_allclose(sketch.box_stats()["median"], exp)
+    # Gleicher Cache-Schlüssel wie beim Laden der Tabelle (mit und ohne konfigurierte Dtypes)
+    from eraa_visualizer.cache import TableCache
+    from eraa_visualizer.loaders import load_prices
+    for i, dtypes in enumerate([None, {"price_eur_mwh": "float32"}]):
+        cache = TableCache(tmp_path / f"cache{i}")
+        load_prices(tmp_path / "csv", schema, dtypes, cache=cache)
+        sketch = sketch_prices(tmp_path / "csv", schema, dtypes, cache=cache)
+        assert cache.hits == 1 and len(sketch) == 80
+    filtered = sketch_prices(tmp_path / "pq", schema, filters={"climate_year": [2]})
+    assert len(filtered) == 40
+    assert sketch_prices(tmp_path / "missing", schema) is None
+
+
+def test_load_dataset_streaming_keeps_price_sketch(tmp_path):
+    from eraa_visualizer.config import Config
+    from eraa_visualizer.loaders import load_dataset
+    (tmp_path / "prices.csv").write_text(
+        "study_zone,target_year,datetime,climate_year,sample_id,price_eur_mwh\n"
+        "DE00,2030,2025-01-15T08:00:00,1,1,40\n"
+        "DE00,2030,2025-01-15T08:00:00,2,1,60\n"
+        "DE00,2030,2025-01-15T09:00:00,1,1,80\n"
+        "DE00,2030,2025-01-15T09:00:00,2,1,100\n",
+        encoding="utf-8",
+    )
+    config = Config(
+        paths={"data_dir": str(tmp_path)}, loading={"stream_time_series": True, "chunk_rows": 2}
+    )
+    ds = load_dataset(config)
+    assert list(ds.prices["price_eur_mwh"]) == [50, 90]
+    sketch = ds.sketches["prices"]
+    assert len(sketch) == 4
+    assert sketch.box_stats()["median"].item() == 70
+    assert load_dataset(Config(paths={"data_dir": str(tmp_path)})).sketches == {}
+
+
+def test_lazy_dataset_price_sketch_matches_eager(tmp_path):
+    from eraa_visualizer.config import Config
+    from eraa_visualizer.loaders import load_dataset
+    from eraa_visualizer.plots import plot_prices_boxplot
+    rng = np.random.default_rng(5)
+    pd.DataFrame({
+        "study_zone": np.repeat(["AT00", "DE00"], 60),
+        "target_year": 2030,
+        "datetime": np.tile(pd.date_range("2030-01-01", periods=20, freq="h").astype(str), 6),
+        "climate_year": np.tile(np.repeat([1, 2, 3], 20), 2),
+        "sample_id": 1,
+        "price_eur_mwh": rng.uniform(20, 120, 120),
+    }).to_csv(tmp_path / "prices.csv", index=False)
+    config = Config(
+        paths={"data_dir": str(tmp_path)},
+        loading={"stream_time_series": True, "chunk_rows": 25},
+        dtypes={"prices": {"price_eur_mwh": "float32"}},
+    )
+    eager = load_dataset(config)
+    lazy = load_dataset(config, lazy=True)
+    assert lazy.sketches.loaded() == {}
+    # Boxplot über alle Läufe, nicht über die Sample-Mittel
+    assert len(lazy.sketches["prices"]) == 120
+    assert not lazy.is_loaded("prices")
+    pd.testing.assert_frame_equal(
+        lazy.sketches["prices"].box_stats(), eager.sketches["prices"].box_stats()
+    )
+    figs = [
+        plot_prices_boxplot(ds.sketches.get("prices", ds.prices), config) for ds in (eager, lazy)
+    ]
+    np.testing.assert_allclose(figs[0].data[0].median, figs[1].data[0].median)
+    assert "sketch" in set(lazy.memory_usage()["kind"])
@@ -86,3 +86,183 @@ def test_eraa_dataset_with_data(df_adequacy, df_dispatch):
     assert len(ds.adequacy) == len(df_adequacy)
     assert ds.dispatch is not None
     assert ds.net_position is None
+
+
+def test_lazy_dataset_loads_on_first_access(df_adequacy):
+    from eraa_visualizer.models import LazyERAADataset, TableInfo
+    calls = []
+
+    def load():
+        calls.append(1)
+        return df_adequacy
+
+    ds = LazyERAADataset(
+        {"adequacy": load},
+        describe=lambda t: (
+            TableInfo(source=t, columns=["lole"], row_count=3) if t == "adequacy" else None
+        ),
+    )
+    assert ds.row_count("adequacy") == 3
+    assert not ds.is_loaded("adequacy")
+    assert ds.adequacy is df_adequacy
+    assert ds.adequacy is df_adequacy
+    assert calls == [1]
+    assert ds.is_loaded("adequacy")
+    assert ds.dispatch is None
+    assert ds.study_zones("dispatch") == []
+
+
+def test_normalize_time():
+    from eraa_visualizer.models import normalize_time
+    df = pd.DataFrame({"datetime": ["2025-03-01T05:00:00", "2025-12-31T23:00:00"], "v": [1.0, 2.0]})
+    out = normalize_time(df)
+    assert pd.api.types.is_datetime64_any_dtype(out["datetime"])
+    assert out["hour"].tolist() == [5, 23]
+    assert out["month"].tolist() == [3, 12]
+    assert out["month"].dtype == "int8"
+    assert normalize_time(out)["hour"].tolist() == [5, 23]
+    # Stundenindex: 0 = 1.1. 00:00, 745 = 1.2. 01:00
+    idx = normalize_time(pd.DataFrame({"datetime": [0, 745]}))
+    assert idx["datetime"].tolist() == [0, 745]
+    assert idx["month"].tolist() == [1, 2]
+    assert idx["hour"].tolist() == [0, 1]
+    bad = pd.DataFrame({"datetime": ["t1", "t2"]})
+    assert list(normalize_time(bad).columns) == ["datetime"]
+
+
+def test_normalize_time_hour_index_per_target_year(caplog):
+    from eraa_visualizer.models import normalize_time
+    # Stunde 1416 = 1.1. + 59 Tage: im Schaltjahr 2028 der 29.2., sonst der 1.3.
+    df = pd.DataFrame({"target_year": [2028, 2030], "datetime": [1416, 1416]})
+    out = normalize_time(df.astype({"target_year": "int16"}))
+    assert out["month"].tolist() == [2, 3]
+    # Nicht lesbare Zeitpunkte gehen nicht stillschweigend verloren
+    mixed = pd.DataFrame({"datetime": ["2025-01-01T00:00:00", "kaputt"]})
+    with caplog.at_level("WARNING", logger="eraa_visualizer.models"):
+        out = normalize_time(mixed)
+    assert out["datetime"].isna().tolist() == [False, True]
+    assert "kaputt" in caplog.text
+
+
+def test_dataset_run_mean_memoised(df_dispatch_runs):
+    from eraa_visualizer.models import normalize_time
+    ds = ERAADataset(dispatch=normalize_time(df_dispatch_runs))
+    mean = ds.run_mean("dispatch")
+    assert ds.run_mean("dispatch") is mean
+    assert len(mean) == 2 * 2 * 6
+    assert {"hour", "month", "n_runs"} <= set(mean.columns)
+    assert "climate_year" not in mean.columns
+    assert ds.run_mean("prices") is None
+
+
+def test_memo_builds_once_under_concurrency(df_dispatch_runs):
+    import threading
+    import time
+
+    from eraa_visualizer.models import ERAADataset
+    ds = ERAADataset(dispatch=df_dispatch_runs)
+    calls = []
+
+    def build(df):
+        calls.append(1)
+        time.sleep(0.05)
+        return len(df)
+
+    args = ("test", "dispatch", None, build)
+    threads = [threading.Thread(target=ds._memo, args=args) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+
+
+def test_lazy_tables_load_concurrently(df_adequacy, df_dispatch_runs):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from eraa_visualizer.models import LazyERAADataset
+    # Beide Loader warten aufeinander: nur wenn die Ladevorgänge parallel laufen, kommt die
+    # Barriere zustande
+    barrier = threading.Barrier(2, timeout=5)
+    calls = []
+
+    def loader(df):
+        def load():
+            calls.append(1)
+            barrier.wait()
+            return df
+        return load
+
+    ds = LazyERAADataset({"adequacy": loader(df_adequacy), "dispatch": loader(df_dispatch_runs)})
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        # Dieselbe Tabelle aus zwei Sitzungen wird trotzdem nur einmal geladen
+        futures = [pool.submit(getattr, ds, t) for t in ("adequacy", "dispatch", "dispatch")]
+        frames = [f.result() for f in futures]
+    assert frames[0] is df_adequacy and frames[1] is frames[2] is df_dispatch_runs
+    assert len(calls) == 2
+    assert not barrier.broken
+
+
+def test_memory_usage_lists_tables_and_derived(df_adequacy, df_dispatch_runs):
+    from eraa_visualizer.models import ERAADataset, LazyERAADataset
+    ds = ERAADataset(adequacy=df_adequacy, dispatch=df_dispatch_runs)
+    ds.index("dispatch", mean=True)
+    usage = ds.memory_usage()
+    assert set(zip(usage["table"], usage["kind"])) == {
+        ("adequacy", "table"), ("dispatch", "table"),
+        ("dispatch", "run_mean"), ("dispatch", "index"),
+    }
+    assert (usage["mb"] > 0).all()
+    # Lazy: nur bereits geladene Tabellen, ohne nachzuladen
+    lazy = LazyERAADataset({"adequacy": lambda: df_adequacy, "dispatch": lambda: df_dispatch_runs})
+    _ = lazy.adequacy
+    assert lazy.memory_usage()["table"].tolist() == ["adequacy"]
+    assert not lazy.is_loaded("dispatch")
+
+
+def test_plots_leave_shared_tables_unchanged(
+    config, df_adequacy, df_adequacy_hour_month, df_dispatch_runs, df_net_position, df_prices,
+    df_storage,
+):
+    import eraa_visualizer.plots as plots
+    from eraa_visualizer.models import ERAADataset
+    # Das Dashboard teilt ein Dataset über alle Sessions: Plots dürfen es nur lesen
+    ds = ERAADataset(
+        adequacy=df_adequacy,
+        adequacy_hour_month=df_adequacy_hour_month,
+        dispatch=df_dispatch_runs,
+        net_position=df_net_position,
+        prices=df_prices,
+        storage=df_storage,
+    )
+    shared = {
+        "adequacy": ds.index("adequacy"),
+        "adequacy_hour_month": ds.index("adequacy_hour_month"),
+        "dispatch": ds.index("dispatch", mean=True),
+        "net_position": ds.index("net_position", mean=True),
+        "prices": ds.index("prices", mean=True),
+        "storage": ds.index("storage", mean=True),
+    }
+    before = {table: index.frame.copy(deep=True) for table, index in shared.items()}
+    tables = {table: getattr(ds, table).copy(deep=True) for table in shared}
+    adeq, adeq_hm = shared["adequacy"], shared["adequacy_hour_month"]
+    plots.plot_adequacy_lole_boxplot(ds.adequacy, config)
+    plots.plot_adequacy_ens_boxplot(ds.adequacy, config)
+    plots.plot_adequacy_lole_heatmap(ds.adequacy, config)
+    plots.plot_adequacy_europe_map(adeq, config)
+    plots.plot_adequacy_lole_heatmap_hour_month(adeq_hm, config)
+    plots.plot_adequacy_ens_heatmap_hour_month(adeq_hm, config)
+    plots.plot_dispatch_timeseries(shared["dispatch"], config, "DE00", 2025)
+    plots.plot_dispatch_heatmap(shared["dispatch"], config, "DE00", 2025)
+    plots.plot_dispatch_heatmap_hour_month(shared["dispatch"], config, "DE00", 2025)
+    plots.plot_net_position_timeseries(shared["net_position"], config)
+    plots.plot_net_position_heatmap(shared["net_position"], config, 2025)
+    plots.plot_net_position_heatmap_hour_month(shared["net_position"], config, "DE00", 2025)
+    plots.plot_prices_timeseries(shared["prices"], config)
+    plots.plot_prices_boxplot(shared["prices"], config)
+    plots.plot_prices_heatmap_hour_month(shared["prices"], config, "DE00", 2025)
+    plots.plot_storage_level_timeseries(shared["storage"], config)
+    for table, index in shared.items():
+        pd.testing.assert_frame_equal(index.frame, before[table])
+        pd.testing.assert_frame_equal(getattr(ds, table), tables[table])
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import pytest
@@ -138,3 +139,152 @@ def test_run_all_plots(config, df_adequacy, df_dispatch, df_net_position, df_pri
     for p in written:
         assert hasattr(p, "exists")
         assert p.exists()
+
+
+def test_required_columns():
+    from eraa_visualizer.plots import (
+        PIPELINE_PLOTS,
+        plot_adequacy_ens_boxplot,
+        plot_adequacy_lole_boxplot,
+        required_columns,
+    )
+    cols = required_columns([plot_adequacy_lole_boxplot, plot_adequacy_ens_boxplot])
+    assert cols == {"adequacy": ["study_zone", "target_year", "lole", "ens"]}
+    pipeline_cols = required_columns(PIPELINE_PLOTS)
+    assert "p95_ens" not in pipeline_cols["adequacy"]
+    assert "climate_year" not in pipeline_cols["dispatch"]
+
+
+def test_plots_accept_run_cube(config, df_dispatch_runs):
+    from eraa_visualizer.cube import table_cubes
+    from eraa_visualizer.plots import plot_dispatch_heatmap_hour_month, plot_dispatch_timeseries
+    cube = table_cubes(df_dispatch_runs, "dispatch")["generation_mw"]
+    fig = plot_dispatch_timeseries(cube, config, study_zone="DE00")
+    from_frame = plot_dispatch_timeseries(df_dispatch_runs, config, study_zone="DE00")
+    assert len(fig.data) == len(from_frame.data) == 2
+    assert fig.data[0].y == pytest.approx(from_frame.data[0].y)
+    fig = plot_dispatch_heatmap_hour_month(cube, config, study_zone="DE00", target_year=2025)
+    assert fig.data[0].z.sum() > 0
+
+
+def test_plots_accept_run_mean(config, df_dispatch_runs):
+    from eraa_visualizer.aggregations import run_mean
+    from eraa_visualizer.plots import plot_dispatch_heatmap
+    raw = plot_dispatch_heatmap(df_dispatch_runs, config, "DE00", 2025)
+    pre = plot_dispatch_heatmap(run_mean(df_dispatch_runs, "dispatch"), config, "DE00", 2025)
+    np.testing.assert_allclose(pre.data[0].z, raw.data[0].z)
+
+
+def test_hour_month_heatmaps_from_profile(config, df_dispatch, df_adequacy_hour_month):
+    from eraa_visualizer.models import ERAADataset
+    from eraa_visualizer.plots import (
+        plot_adequacy_lole_heatmap_hour_month,
+        plot_dispatch_heatmap_hour_month,
+    )
+    ds = ERAADataset(dispatch=df_dispatch, adequacy_hour_month=df_adequacy_hour_month)
+    profile = ds.hour_month_profile("dispatch", "generation_mw")
+    assert ds.hour_month_profile("dispatch", "generation_mw") is profile
+    zone, ty = df_dispatch["study_zone"].iloc[0], int(df_dispatch["target_year"].iloc[0])
+    fig = plot_dispatch_heatmap_hour_month(profile, config, zone, ty)
+    ref = plot_dispatch_heatmap_hour_month(df_dispatch, config, zone, ty)
+    np.testing.assert_allclose(fig.data[0].z, ref.data[0].z)
+    lole = ds.hour_month_profile("adequacy_hour_month", "lole_h")
+    fig = plot_adequacy_lole_heatmap_hour_month(lole, config)
+    ref = plot_adequacy_lole_heatmap_hour_month(df_adequacy_hour_month, config)
+    np.testing.assert_allclose(fig.data[0].z, ref.data[0].z)
+
+
+def test_boxplot_summary_and_raw_mode(config, df_prices):
+    from eraa_visualizer.plots import plot_prices_boxplot
+    config.visualization.boxplot_max_outliers = 0
+    fig = plot_prices_boxplot(df_prices, config)
+    boxes = [t for t in fig.data if t.type == "box"]
+    assert boxes and all(t.q1 is not None and t.y is None for t in boxes)
+    assert all(t.type == "box" for t in fig.data)
+    config.visualization.boxplot_mode = "raw"
+    fig = plot_prices_boxplot(df_prices, config)
+    assert fig.data[0].y is not None and fig.data[0].q1 is None
+
+
+def test_boxplots_from_sketches(config, df_prices, df_adequacy):
+    from eraa_visualizer.plots import plot_adequacy_ens_boxplot, plot_prices_boxplot
+    from eraa_visualizer.sketch import SketchSet
+    prices = SketchSet("price_eur_mwh")
+    prices.update(df_prices)
+    config.visualization.boxplot_mode = "raw"
+    fig = plot_prices_boxplot(prices, config)
+    assert [t.type for t in fig.data] == ["box"] * len(prices.labels("target_year"))
+    exp = df_prices.groupby("study_zone", observed=True)["price_eur_mwh"].median()
+    assert len(fig.data) == 1
+    np.testing.assert_allclose(fig.data[0].median, exp.to_numpy())
+    ens = SketchSet("ens")
+    ens.update(df_adequacy)
+    assert len(plot_adequacy_ens_boxplot(ens, config).data) == len(ens.labels("target_year"))
+    assert plot_prices_boxplot(SketchSet("price_eur_mwh"), config).layout.annotations
+
+
+def test_plots_accept_table_index(config, df_dispatch_runs):
+    from eraa_visualizer.index import INDEX_KEYS, TableIndex
+    from eraa_visualizer.plots import plot_dispatch_heatmap, plot_dispatch_timeseries
+    index = TableIndex(df_dispatch_runs, INDEX_KEYS["dispatch"])
+    for plot in (plot_dispatch_heatmap, plot_dispatch_timeseries):
+        a, b = plot(index, config, "FR00", 2025), plot(df_dispatch_runs, config, "FR00", 2025)
+        for ta, tb in zip(a.data, b.data):
+            np.testing.assert_allclose(
+                np.asarray(ta.z if ta.type == "heatmap" else ta.y, dtype=float),
+                np.asarray(tb.z if tb.type == "heatmap" else tb.y, dtype=float),
+            )
+
+
+def test_time_axis_downsampling(config):
+    from eraa_visualizer.plots import plot_net_position_heatmap, plot_prices_timeseries
+    times = pd.date_range("2030-01-01", periods=2000, freq="h")
+    values = np.sin(np.arange(2000) / 24) * 100
+    values[777] = 5000
+    df = pd.DataFrame({
+        "study_zone": np.repeat(["DE00", "FR00"], 2000),
+        "target_year": 2030,
+        "datetime": np.tile(times, 2),
+        "net_position_mw": np.tile(values, 2),
+        "price_eur_mwh": np.tile(values, 2),
+    })
+    config.visualization.heatmap_max_timesteps = 100
+    config.visualization.timeseries_max_points = 300
+    heat = plot_net_position_heatmap(df, config, 2030).data[0]
+    assert len(heat.x) == 100 and np.asarray(heat.z).max() == 5000
+    lines = plot_prices_timeseries(df, config).data
+    assert len(lines) == 2
+    assert all(len(t.y) <= 300 and max(t.y) == 5000 for t in lines)
+    # Budget pro Figur: die beiden Linien teilen sich 200 Punkte
+    config.visualization.timeseries_figure_max_points = 200
+    lines = plot_prices_timeseries(df, config).data
+    assert sum(len(t.y) for t in lines) <= 200
+    assert all(max(t.y) == 5000 for t in lines)
+
+
+def test_time_window_resolves_finer(config):
+    from eraa_visualizer.index import INDEX_KEYS, TableIndex, select
+    from eraa_visualizer.plots import plot_prices_timeseries
+    times = pd.date_range("2030-01-01", periods=8760, freq="h")
+    df = pd.DataFrame({
+        "study_zone": "DE00",
+        "target_year": 2030,
+        "datetime": times,
+        "price_eur_mwh": np.arange(8760, dtype=float),
+    })
+    config.visualization.timeseries_max_points = 400
+    index = TableIndex(df, INDEX_KEYS["prices"])
+    full = plot_prices_timeseries(index, config).data[0]
+    window = (pd.Timestamp("2030-03-01"), pd.Timestamp("2030-03-03 23:00"))
+    zoomed = plot_prices_timeseries(select(index, window=window), config).data[0]
+    # Ganzer Horizont: Budget ausgeschöpft; Ausschnitt (72 h): jede Stunde
+    assert len(full.y) <= 400
+    assert len(zoomed.y) == 72
+
+
+def test_webgl_above_point_threshold(config, df_prices):
+    from eraa_visualizer.plots import plot_prices_timeseries
+    config.visualization.webgl_min_points = None
+    assert {t.type for t in plot_prices_timeseries(df_prices, config).data} == {"scatter"}
+    config.visualization.webgl_min_points = 1
+    assert {t.type for t in plot_prices_timeseries(df_prices, config).data} == {"scattergl"}
@@ -0,0 +1,102 @@
+"""Tests für eraa_visualizer.render."""
+
+from __future__ import annotations
+
+
+def test_render_tasks_collects_errors(config, df_prices, tmp_path):
+    from eraa_visualizer.plots import plot_prices_boxplot
+    from eraa_visualizer.render import PlotTask, render_tasks
+    paths = config.paths.model_copy(update={"output_dir": str(tmp_path)})
+    cfg = config.model_copy(update={"paths": paths})
+    tasks = [
+        PlotTask(plot_prices_boxplot, df_prices.assign(extra=1), tmp_path / "ok.html"),
+        PlotTask(plot_prices_boxplot, None, tmp_path / "fail.html"),
+        PlotTask(plot_prices_boxplot, df_prices, tmp_path / "ok2.html"),
+    ]
+    # nur deklarierte Spalten gehen an den Worker
+    assert "extra" not in tasks[0].data.columns
+    results = render_tasks(tasks, cfg, jobs=2)
+    assert [r.path for r in results] == [t.path for t in tasks]
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[1].error
+    assert (tmp_path / "ok.html").exists() and (tmp_path / "ok2.html").exists()
+
+
+def test_run_all_plots_parallel_matches_sequential(
+    config, df_adequacy, df_dispatch, df_net_position, df_prices, tmp_path
+):
+    from eraa_visualizer.models import ERAADataset
+    from eraa_visualizer.plots import run_all_plots
+    dataset = ERAADataset(
+        adequacy=df_adequacy, dispatch=df_dispatch, net_position=df_net_position, prices=df_prices
+    )
+    written = {}
+    for jobs in (1, 3):
+        out = tmp_path / f"jobs{jobs}"
+        paths = config.paths.model_copy(update={"output_dir": str(out)})
+        cfg = config.model_copy(update={"paths": paths})
+        written[jobs] = [p.relative_to(out) for p in run_all_plots(dataset, cfg, jobs=jobs)]
+    assert written[1] == written[3]
+    assert len(written[1]) >= 5
+
+
+def test_incremental_rebuild_skips_unchanged(config, df_adequacy, df_net_position, tmp_path):
+    import json
+
+    import pandas as pd
+
+    from eraa_visualizer.models import ERAADataset
+    from eraa_visualizer.plots import run_all_plots
+    paths = config.paths.model_copy(update={"output_dir": str(tmp_path)})
+    cfg = config.model_copy(update={"paths": paths})
+
+    def build(dataset, cfg=cfg, **kwargs):
+        written = run_all_plots(dataset, cfg, **kwargs)
+        return written, json.loads((tmp_path / "manifest.json").read_text())["build"]
+
+    written, first = build(ERAADataset(adequacy=df_adequacy, net_position=df_net_position))
+    assert first == {"rebuilt": len(written), "skipped": 0, "failed": 0}
+    _, again = build(ERAADataset(adequacy=df_adequacy, net_position=df_net_position))
+    assert again == {"rebuilt": 0, "skipped": len(written), "failed": 0}
+
+    # Neues Zieljahr: Zeitreihe und neue Heatmap neu, Adequacy und bestehende Heatmap übersprungen
+    grown_df = pd.concat(
+        [df_net_position, df_net_position.assign(target_year=2030)], ignore_index=True
+    )
+    written2, grown = build(ERAADataset(adequacy=df_adequacy, net_position=grown_df))
+    assert len(written2) == len(written) + 1
+    assert grown == {"rebuilt": 2, "skipped": len(written) - 1, "failed": 0}
+
+    # Gelöschte Ausgabe und force
+    written2[0].unlink()
+    assert build(ERAADataset(adequacy=df_adequacy, net_position=grown_df))[1]["rebuilt"] == 1
+    assert build(ERAADataset(adequacy=df_adequacy), force=True)[1]["rebuilt"] == 3
+
+    # Geänderte Konfiguration (visualization) → alles neu
+    vis = cfg.visualization.model_copy(update={"figure_width": 800})
+    changed_cfg = cfg.model_copy(update={"visualization": vis})
+    _, changed = build(ERAADataset(adequacy=df_adequacy), changed_cfg)
+    assert changed["skipped"] == 0
+
+
+
+def test_sketch_fingerprint_stable_across_loads(config, tmp_path):
+    import numpy as np
+    import pandas as pd
+
+    from eraa_visualizer.plots import plot_prices_boxplot
+    from eraa_visualizer.render import PlotTask, task_fingerprint
+    from eraa_visualizer.sketch import SketchSet
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "study_zone": "DE00", "target_year": 2030, "price_eur_mwh": rng.uniform(0, 200, 20_000),
+    })
+    fingerprints = set()
+    # Zwei Ladevorgänge mit unterschiedlicher Blockung (Cache-Treffer vs. Quelle)
+    for chunk_rows in (1000, 7000):
+        sketch = SketchSet("price_eur_mwh")
+        for start in range(0, len(df), chunk_rows):
+            sketch.update(df.iloc[start:start + chunk_rows])
+        task = PlotTask(plot_prices_boxplot, sketch, tmp_path / "prices_boxplot.html")
+        fingerprints.add(task_fingerprint(task, config))
+    assert len(fingerprints) == 1 and None not in fingerprints
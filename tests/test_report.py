@@ -0,0 +1,79 @@
+"""Tests für eraa_visualizer.report."""
+
+from __future__ import annotations
+
+import gzip
+import json
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+
+def _line():
+    times = pd.date_range("2030-01-01", periods=48, freq="h")
+    df = pd.DataFrame({"datetime": times, "v": np.arange(48.0)})
+    return px.line(df, x="datetime", y="v")
+
+
+def test_compact_figure_encodes_dates_as_typed_array():
+    from eraa_visualizer.report import compact_figure
+    original = _line()
+    before = len(original.to_json())
+    fig = compact_figure(original)
+    assert fig.data[0].x.dtype == np.float64
+    assert fig.layout.xaxis.type == "date"
+    assert '"bdata"' in fig.to_json() and len(fig.to_json()) < before
+    assert fig.data[0].x[1] - fig.data[0].x[0] == 3_600_000
+    # Die übergebene Figur bleibt unverändert
+    assert original.data[0].x.dtype.kind == "M" and original.layout.xaxis.type is None
+    assert len(original.to_json()) == before
+
+
+def test_report_mode_shared_plotlyjs_gzip_and_manifest(config, tmp_path):
+    from eraa_visualizer.report import MANIFEST_NAME, PLOTLYJS_NAME, write_figure, write_manifest
+    config.paths.output_dir = str(tmp_path)
+    config.visualization.html.mode = "report"
+    config.visualization.html.gzip = True
+    paths = [tmp_path / "a" / "one.html", tmp_path / "b" / "two.html"]
+    fig = _line()
+    for path in paths:
+        write_figure(fig, path, config)
+    assert fig.data[0].x.dtype.kind == "M"
+    html = paths[0].read_text(encoding="utf-8")
+    assert f'src="../{PLOTLYJS_NAME}"' in html
+    assert len(html) < 100_000
+    assert gzip.decompress((tmp_path / "a" / "one.html.gz").read_bytes()).decode("utf-8") == html
+    manifest = write_manifest(paths, config)
+    assert manifest == json.loads((tmp_path / MANIFEST_NAME).read_text(encoding="utf-8"))
+    assert [f["path"] for f in manifest["files"]] == ["a/one.html", "b/two.html"]
+    js_bytes = (tmp_path / PLOTLYJS_NAME).stat().st_size
+    assert manifest["total_bytes"] == manifest["html_bytes"] + js_bytes
+    assert manifest["bytes_saved"] == js_bytes + manifest["html_bytes"] - manifest["gzip_bytes"]
+
+
+def test_plotlyjs_checked_once_per_output_dir(config, tmp_path, monkeypatch):
+    from eraa_visualizer import report
+    config.paths.output_dir = str(tmp_path)
+    config.visualization.html.mode = "report"
+    path = report.ensure_plotlyjs(config)
+    size = path.stat().st_size
+
+    def fail():
+        raise AssertionError("plotly.js erneut gelesen")
+
+    # Weitere Figuren lesen und kodieren das Bundle nicht erneut
+    monkeypatch.setattr(report, "_plotlyjs_bundle", fail)
+    for name in ("one", "two"):
+        report.write_figure(_line(), tmp_path / f"{name}.html", config)
+    assert path.stat().st_size == size
+
+
+def test_plotlyjs_replaced_when_content_differs(config, tmp_path):
+    from eraa_visualizer import report
+    config.paths.output_dir = str(tmp_path)
+    bundle = report._plotlyjs_bundle()
+    # Anderer Inhalt bei gleicher Größe (z.B. andere plotly-Version)
+    report.plotlyjs_path(config).write_bytes(b"x" * len(bundle))
+    report._CHECKED_PLOTLYJS.discard(report.plotlyjs_path(config).resolve())
+    assert report.ensure_plotlyjs(config).read_bytes() == bundle
@@ -0,0 +1,93 @@
+"""Tests für eraa_visualizer.sketch."""
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pandas as pd
+
+
+def test_quantile_sketch_exact_while_small():
+    from eraa_visualizer.sketch import QuantileSketch
+    values = np.random.default_rng(0).normal(50, 10, 150)
+    sketch = QuantileSketch(k=200)
+    sketch.update(values)
+    qs = [0.0, 0.25, 0.5, 0.95, 1.0]
+    np.testing.assert_allclose(sketch.quantile(qs), np.quantile(values, qs))
+    assert sketch.quantile(0.5) == np.quantile(values, 0.5)
+
+
+def test_quantile_sketch_rank_error_and_merge():
+    from eraa_visualizer.sketch import QuantileSketch
+    values = np.random.default_rng(1).lognormal(4, 0.5, 200_000)
+    parts = []
+    for block in np.array_split(values, 8):
+        part = QuantileSketch(k=200, seed=len(parts))
+        part.update(block)
+        parts.append(pickle.loads(pickle.dumps(part)))
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+    assert merged.count == len(values)
+    assert merged.min == values.min() and merged.max == values.max()
+    assert merged.nbytes < values.nbytes / 100
+    qs = np.array([0.05, 0.25, 0.5, 0.75, 0.95])
+    ranks = np.searchsorted(np.sort(values), merged.quantile(qs)) / len(values)
+    assert np.abs(ranks - qs).max() < 0.02
+
+
+def test_quantile_sketch_deterministic_beyond_k():
+    from eraa_visualizer.sketch import QuantileSketch, SketchSet
+    values = np.random.default_rng(3).lognormal(4, 0.5, 200_000)
+    qs = [0.05, 0.25, 0.5, 0.75, 0.95]
+    builds = []
+    for _ in range(2):
+        sketch = QuantileSketch(k=200)
+        sketch.update(values)
+        builds.append(sketch.quantile(qs))
+    np.testing.assert_array_equal(*builds)
+    df = pd.DataFrame({"study_zone": "DE00", "target_year": 2030, "price_eur_mwh": values})
+    stats = []
+    for _ in range(2):
+        sketch_set = SketchSet("price_eur_mwh")
+        sketch_set.update(df)
+        stats.append(sketch_set.box_stats())
+    pd.testing.assert_frame_equal(*stats)
+
+
+def test_sketch_set_merge_copies_sketches():
+    from eraa_visualizer.sketch import SketchSet
+    df = pd.DataFrame({"study_zone": "DE00", "target_year": 2030, "price_eur_mwh": [1.0, 2.0]})
+    source = SketchSet("price_eur_mwh")
+    source.update(df)
+    merged = SketchSet("price_eur_mwh").merge(source)
+    merged.update(df)
+    assert len(merged) == 4 and len(source) == 2
+
+
+def test_sketch_set_box_stats():
+    from eraa_visualizer.sketch import SketchSet
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame({
+        "study_zone": pd.Categorical(np.repeat(["DE00", "FR00"], 100)),
+        "target_year": np.tile(np.repeat([2030, 2035], 50), 2),
+        "price_eur_mwh": rng.uniform(20, 120, 200),
+    })
+    sketch = SketchSet("price_eur_mwh")
+    sketch.update(df.iloc[:120])
+    other = SketchSet("price_eur_mwh")
+    other.update(df.iloc[120:])
+    sketch.merge(other)
+    assert len(sketch) == 200
+    assert sketch.labels("target_year") == [2030, 2035]
+    stats = sketch.box_stats([5, 25, 50, 75, 95])
+    assert list(stats.columns) == [
+        "study_zone", "target_year", "q1", "median", "q3", "lowerfence", "upperfence", "count"
+    ]
+    g = df.groupby(["study_zone", "target_year"], observed=True)["price_eur_mwh"]
+    np.testing.assert_allclose(stats["median"], g.median().to_numpy())
+    np.testing.assert_allclose(stats["upperfence"], g.quantile(0.95).to_numpy())
+    assert list(stats["count"]) == [50] * 4
+    only = sketch.select(study_zone="FR00", target_year=[2035])
+    assert list(only.sketches) == [("FR00", 2035)]